@@ -3,14 +3,24 @@ import os
 from logging.config import fileConfig
 
 from sqlalchemy import pool
-from sqlalchemy.engine import Connection
+from sqlalchemy.engine import Connection, make_url
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
 
 # Import your models
 from src.infrastructure.database.database import Base
-from src.infrastructure.database.models import EventModel, TimeSlotModel, BookingModel
+from src.infrastructure.database.models import (
+    AvailabilityChangeModel,
+    BookingGroupModel,
+    BookingModel,
+    ChangeLogModel,
+    EventAvailabilityModel,
+    EventModel,
+    EventTemplateModel,
+    OutboxMessageModel,
+    TimeSlotModel,
+)
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -35,6 +45,11 @@ target_metadata = Base.metadata
 # ... etc.
 
 
+def _render_as_batch(url) -> bool:
+    # SQLite cannot ALTER most constraints; batch mode recreates the table instead.
+    return make_url(url).get_backend_name() == "sqlite"
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -53,6 +68,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        render_as_batch=_render_as_batch(url),
     )
 
     with context.begin_transaction():
@@ -60,7 +76,11 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=_render_as_batch(connection.engine.url),
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,51 @@
+"""booking groups
+
+Revision ID: 643f0764c1e2
+Revises: 6537aec12b21
+Create Date: 2026-10-19 10:59:39.062770+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "643f0764c1e2"
+down_revision: Union[str, None] = "6537aec12b21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "booking_groups",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("attendee_name", sa.String(length=255), nullable=False),
+        sa.Column("number_of_seats", sa.Integer(), nullable=False),
+        sa.Column("booking_token", sa.String(length=255), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_booking_groups_booking_token"), "booking_groups", ["booking_token"], unique=True
+    )
+    # Batch mode so SQLite, which cannot add a foreign key in place, rebuilds the table.
+    with op.batch_alter_table("bookings") as batch_op:
+        batch_op.add_column(sa.Column("group_id", sa.Uuid(), nullable=True))
+        batch_op.create_index(batch_op.f("ix_bookings_group_id"), ["group_id"], unique=False)
+        batch_op.create_foreign_key(
+            "fk_bookings_group_id", "booking_groups", ["group_id"], ["id"], ondelete="CASCADE"
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("bookings") as batch_op:
+        batch_op.drop_constraint("fk_bookings_group_id", type_="foreignkey")
+        batch_op.drop_index(batch_op.f("ix_bookings_group_id"))
+        batch_op.drop_column("group_id")
+    op.drop_index(op.f("ix_booking_groups_booking_token"), table_name="booking_groups")
+    op.drop_table("booking_groups")
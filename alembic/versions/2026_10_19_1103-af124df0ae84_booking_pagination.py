@@ -0,0 +1,49 @@
+"""booking pagination
+
+Revision ID: af124df0ae84
+Revises: 643f0764c1e2
+Create Date: 2026-10-19 11:03:29.196857+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "af124df0ae84"
+down_revision: Union[str, None] = "643f0764c1e2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("bookings") as batch_op:
+        batch_op.add_column(sa.Column("event_id", sa.Uuid(), nullable=True))
+    op.execute(
+        "UPDATE bookings SET event_id = "
+        "(SELECT time_slots.event_id FROM time_slots WHERE time_slots.id = bookings.time_slot_id)"
+    )
+    # Rows without a creation time sort first rather than break the keyset order.
+    op.execute("UPDATE bookings SET created_at = '1970-01-01' WHERE created_at IS NULL")
+    with op.batch_alter_table("bookings") as batch_op:
+        batch_op.alter_column("event_id", existing_type=sa.Uuid(), nullable=False)
+        batch_op.alter_column("created_at", existing_type=sa.DateTime(), nullable=False)
+        batch_op.create_foreign_key("fk_bookings_event_id", "events", ["event_id"], ["id"])
+        batch_op.create_index(
+            "ix_bookings_slot_created", ["time_slot_id", "created_at", "id"], unique=False
+        )
+        batch_op.create_index(
+            "ix_bookings_event_created", ["event_id", "created_at", "id"], unique=False
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("bookings") as batch_op:
+        batch_op.drop_index("ix_bookings_event_created")
+        batch_op.drop_index("ix_bookings_slot_created")
+        batch_op.drop_constraint("fk_bookings_event_id", type_="foreignkey")
+        batch_op.alter_column("created_at", existing_type=sa.DateTime(), nullable=True)
+        batch_op.drop_column("event_id")
@@ -0,0 +1,50 @@
+"""catalog listing
+
+Revision ID: 5d0c3be81f27
+Revises: af124df0ae84
+Create Date: 2026-10-19 11:12:41.508203+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d0c3be81f27"
+down_revision: Union[str, None] = "af124df0ae84"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CATALOG_TABLES = ("events", "time_slots", "bookings")
+
+
+def upgrade() -> None:
+    op.create_index("ix_events_date_id", "events", ["event_date", "id"], unique=False)
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    # Any write to the catalog, from any process, tells every worker to drop its
+    # cached listings. NOTIFY folds identical payloads within a transaction, so
+    # this is one notification per transaction, sent when it commits.
+    op.execute("""
+        CREATE FUNCTION notify_catalog_change() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            PERFORM pg_notify('catalog', 'db:');
+            RETURN NULL;
+        END
+        $$
+    """)
+    for table in CATALOG_TABLES:
+        op.execute(
+            f"CREATE TRIGGER {table}_catalog_change "
+            f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION notify_catalog_change()"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        for table in CATALOG_TABLES:
+            op.execute(f"DROP TRIGGER {table}_catalog_change ON {table}")
+        op.execute("DROP FUNCTION notify_catalog_change()")
+    op.drop_index("ix_events_date_id", table_name="events")
@@ -0,0 +1,166 @@
+"""event availability
+
+Revision ID: b7e24a9c1d53
+Revises: 5d0c3be81f27
+Create Date: 2026-10-19 11:20:08.913374+00:00
+
+"""
+
+from datetime import datetime
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e24a9c1d53"
+down_revision: Union[str, None] = "5d0c3be81f27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column holding the event id, columns the summary depends on)
+QUEUED_TABLES = (
+    ("events", "id", ("name", "event_date")),
+    ("time_slots", "event_id", ("max_capacity", "current_bookings")),
+)
+
+BACKFILL_SQL = """
+    INSERT INTO event_availability (
+        event_id, event_name, event_date, slot_count, open_slots,
+        total_capacity, booked_seats, available_seats, refreshed_at
+    )
+    SELECT
+        events.id,
+        events.name,
+        events.event_date,
+        COUNT(time_slots.id),
+        COALESCE(SUM(CASE
+            WHEN time_slots.max_capacity > COALESCE(time_slots.current_bookings, 0) THEN 1
+            ELSE 0
+        END), 0),
+        COALESCE(SUM(time_slots.max_capacity), 0),
+        COALESCE(SUM(COALESCE(time_slots.current_bookings, 0)), 0),
+        COALESCE(SUM(CASE
+            WHEN time_slots.max_capacity > COALESCE(time_slots.current_bookings, 0)
+            THEN time_slots.max_capacity - COALESCE(time_slots.current_bookings, 0)
+            ELSE 0
+        END), 0),
+        :now
+    FROM events
+    LEFT JOIN time_slots ON time_slots.event_id = events.id
+    GROUP BY events.id, events.name, events.event_date
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "availability_changes",
+        sa.Column(
+            "id",
+            sa.BigInteger().with_variant(sa.Integer(), "sqlite"),
+            autoincrement=True,
+            nullable=False,
+        ),
+        sa.Column("event_id", sa.Uuid(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "event_availability",
+        sa.Column("event_id", sa.Uuid(), nullable=False),
+        sa.Column("event_name", sa.String(length=255), nullable=False),
+        sa.Column("event_date", sa.Date(), nullable=False),
+        sa.Column("slot_count", sa.Integer(), nullable=False),
+        sa.Column("open_slots", sa.Integer(), nullable=False),
+        sa.Column("total_capacity", sa.Integer(), nullable=False),
+        sa.Column("booked_seats", sa.Integer(), nullable=False),
+        sa.Column("available_seats", sa.Integer(), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("event_id"),
+    )
+    op.create_index(
+        "ix_event_availability_date",
+        "event_availability",
+        ["event_date", "event_id"],
+        unique=False,
+    )
+
+    # Every write that can change a summary queues the id of its event in the
+    # same transaction; AvailabilityRefresher folds the queue into the summaries.
+    if op.get_bind().dialect.name == "postgresql":
+        _create_postgresql_triggers()
+    else:
+        _create_sqlite_triggers()
+
+    # Triggers are in place first, so nothing written meanwhile is missed.
+    op.execute(
+        sa.text(BACKFILL_SQL).bindparams(sa.bindparam("now", datetime.utcnow(), sa.DateTime()))
+    )
+
+
+def _create_postgresql_triggers() -> None:
+    # Statement-level triggers with transition tables: a bulk import or a bulk
+    # capacity change queues each event once rather than once per row.
+    for table, event_column, watched in QUEUED_TABLES:
+        changed = " OR ".join(f"n.{column} IS DISTINCT FROM o.{column}" for column in watched)
+        op.execute(f"""
+            CREATE FUNCTION queue_{table}_availability() RETURNS trigger LANGUAGE plpgsql AS $$
+            BEGIN
+                IF TG_OP = 'INSERT' THEN
+                    INSERT INTO availability_changes (event_id)
+                    SELECT DISTINCT {event_column} FROM new_rows;
+                ELSIF TG_OP = 'DELETE' THEN
+                    INSERT INTO availability_changes (event_id)
+                    SELECT DISTINCT {event_column} FROM old_rows;
+                ELSE
+                    INSERT INTO availability_changes (event_id)
+                    SELECT DISTINCT n.{event_column}
+                    FROM new_rows n JOIN old_rows o ON o.id = n.id
+                    WHERE {changed};
+                END IF;
+                RETURN NULL;
+            END
+            $$
+        """)
+        for operation, referencing in (
+            ("INSERT", "NEW TABLE AS new_rows"),
+            ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+            ("DELETE", "OLD TABLE AS old_rows"),
+        ):
+            op.execute(
+                f"CREATE TRIGGER {table}_availability_{operation.lower()} "
+                f"AFTER {operation} ON {table} REFERENCING {referencing} "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION queue_{table}_availability()"
+            )
+
+
+def _create_sqlite_triggers() -> None:
+    for table, event_column, watched in QUEUED_TABLES:
+        changed = " OR ".join(f"NEW.{column} IS NOT OLD.{column}" for column in watched)
+        for operation, row, condition in (
+            ("INSERT", "NEW", ""),
+            (f"UPDATE OF {', '.join(watched)}", "NEW", f"WHEN {changed}"),
+            ("DELETE", "OLD", ""),
+        ):
+            name = operation.split()[0].lower()
+            op.execute(
+                f"CREATE TRIGGER {table}_availability_{name} "
+                f"AFTER {operation} ON {table} {condition} BEGIN "
+                f"INSERT INTO availability_changes (event_id) VALUES ({row}.{event_column}); "
+                "END"
+            )
+
+
+def downgrade() -> None:
+    postgresql = op.get_bind().dialect.name == "postgresql"
+    for table, _, _ in QUEUED_TABLES:
+        for operation in ("insert", "update", "delete"):
+            if postgresql:
+                op.execute(f"DROP TRIGGER {table}_availability_{operation} ON {table}")
+            else:
+                op.execute(f"DROP TRIGGER {table}_availability_{operation}")
+        if postgresql:
+            op.execute(f"DROP FUNCTION queue_{table}_availability()")
+    op.drop_index("ix_event_availability_date", table_name="event_availability")
+    op.drop_table("event_availability")
+    op.drop_table("availability_changes")
@@ -0,0 +1,163 @@
+"""hashed booking tokens
+
+Revision ID: 3f9a61d2c8e4
+Revises: b7e24a9c1d53
+Create Date: 2026-10-19 11:31:52.207641+00:00
+
+"""
+
+import hashlib
+import secrets
+from typing import Sequence, Union
+from uuid import UUID
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9a61d2c8e4"
+down_revision: Union[str, None] = "b7e24a9c1d53"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TOKEN_TABLES = ("bookings", "booking_groups")
+
+# Rows hashed per transaction; each batch holds its row locks only briefly.
+BACKFILL_BATCH = 5000
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        for table in TOKEN_TABLES:
+            _hash_tokens_postgresql(table)
+    else:
+        for table in TOKEN_TABLES:
+            _hash_tokens_sqlite(table)
+
+
+def _hash_tokens_postgresql(table: str) -> None:
+    # Batches commit as they go, so every step here can be repeated if the
+    # migration is interrupted and run again.
+
+    # Expand: a nullable column, kept filled for rows that processes still
+    # running the previous release write while the backfill is under way.
+    op.execute(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS booking_token_hash BYTEA")
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION {table}_hash_token() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.booking_token_hash := sha256(convert_to(NEW.booking_token, 'UTF8'));
+            RETURN NEW;
+        END
+        $$
+    """)
+    op.execute(f"DROP TRIGGER IF EXISTS {table}_hash_token ON {table}")
+    op.execute(
+        f"CREATE TRIGGER {table}_hash_token BEFORE INSERT OR UPDATE OF booking_token ON {table} "
+        f"FOR EACH ROW EXECUTE FUNCTION {table}_hash_token()"
+    )
+
+    with op.get_context().autocommit_block():
+        # Backfill in id order, one short transaction per batch.
+        bind = op.get_bind()
+        after = UUID(int=0)
+        while True:
+            upper = bind.scalar(
+                sa.text(
+                    f"SELECT id FROM (SELECT id FROM {table} WHERE id > :after "
+                    "ORDER BY id LIMIT :batch) batch ORDER BY id DESC LIMIT 1"
+                ),
+                {"after": after, "batch": BACKFILL_BATCH},
+            )
+            if upper is None:
+                break
+            bind.execute(
+                sa.text(
+                    f"UPDATE {table} SET booking_token_hash = "
+                    "sha256(convert_to(booking_token, 'UTF8')) "
+                    "WHERE id > :after AND id <= :upper AND booking_token_hash IS NULL"
+                ),
+                {"after": after, "upper": upper},
+            )
+            after = upper
+        # An interrupted concurrent build leaves an invalid index behind.
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_booking_token_hash")
+        op.execute(
+            f"CREATE UNIQUE INDEX CONCURRENTLY ix_{table}_booking_token_hash "
+            f"ON {table} (booking_token_hash)"
+        )
+        # A validated CHECK lets SET NOT NULL skip its table scan; validation
+        # itself scans without blocking writes.
+        op.execute(
+            f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {table}_booking_token_hash_not_null"
+        )
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {table}_booking_token_hash_not_null "
+            "CHECK (booking_token_hash IS NOT NULL) NOT VALID"
+        )
+        op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {table}_booking_token_hash_not_null")
+
+    # Contract: from here on only the digest is kept.
+    op.alter_column(table, "booking_token_hash", nullable=False)
+    op.execute(f"ALTER TABLE {table} DROP CONSTRAINT {table}_booking_token_hash_not_null")
+    op.execute(f"DROP TRIGGER {table}_hash_token ON {table}")
+    op.execute(f"DROP FUNCTION {table}_hash_token()")
+    op.drop_index(f"ix_{table}_booking_token", table_name=table)
+    op.drop_column(table, "booking_token")
+
+
+def _hash_tokens_sqlite(table: str) -> None:
+    # SQLite has no sha256(); hash in batches here. Its writers are serialized,
+    # so nothing writes the table while the migration holds it.
+    op.add_column(table, sa.Column("booking_token_hash", sa.LargeBinary(length=32), nullable=True))
+    bind = op.get_bind()
+    while True:
+        rows = bind.execute(
+            sa.text(
+                f"SELECT id, booking_token FROM {table} WHERE booking_token_hash IS NULL LIMIT :batch"
+            ),
+            {"batch": BACKFILL_BATCH},
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            sa.text(f"UPDATE {table} SET booking_token_hash = :digest WHERE id = :id"),
+            [{"id": id_, "digest": hashlib.sha256(token.encode()).digest()} for id_, token in rows],
+        )
+    op.drop_index(f"ix_{table}_booking_token", table_name=table)
+    with op.batch_alter_table(table) as batch_op:
+        batch_op.alter_column("booking_token_hash", nullable=False)
+        batch_op.drop_column("booking_token")
+        batch_op.create_index(f"ix_{table}_booking_token_hash", ["booking_token_hash"], unique=True)
+
+
+def downgrade() -> None:
+    """Bring back the plaintext token column.
+
+    The tokens themselves cannot be recovered from their digests, so every
+    booking gets a fresh random token: links and tokens handed out before the
+    downgrade stop working, and attendees have to be sent new ones.
+    """
+    for table in TOKEN_TABLES:
+        _restore_tokens(table)
+
+
+def _restore_tokens(table: str) -> None:
+    op.add_column(table, sa.Column("booking_token", sa.String(length=255), nullable=True))
+    bind = op.get_bind()
+    while True:
+        ids = bind.scalars(
+            sa.text(f"SELECT id FROM {table} WHERE booking_token IS NULL LIMIT :batch"),
+            {"batch": BACKFILL_BATCH},
+        ).all()
+        if not ids:
+            break
+        bind.execute(
+            sa.text(f"UPDATE {table} SET booking_token = :token WHERE id = :id"),
+            [{"id": id_, "token": secrets.token_urlsafe(32)} for id_ in ids],
+        )
+    op.drop_index(f"ix_{table}_booking_token_hash", table_name=table)
+    with op.batch_alter_table(table) as batch_op:
+        batch_op.alter_column("booking_token", nullable=False)
+        batch_op.drop_column("booking_token_hash")
+        batch_op.create_index(f"ix_{table}_booking_token", ["booking_token"], unique=True)
@@ -0,0 +1,33 @@
+"""time slot event index
+
+Revision ID: 9c4e7b2a5f18
+Revises: 3f9a61d2c8e4
+Create Date: 2026-10-19 11:42:07.518334+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c4e7b2a5f18"
+down_revision: Union[str, None] = "3f9a61d2c8e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Cancelling an event deletes its slots by event_id, and deleting the event
+    # checks the time_slots foreign key; both would scan the table without it.
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            # An interrupted concurrent build leaves an invalid index behind.
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_time_slots_event_id")
+            op.execute("CREATE INDEX CONCURRENTLY ix_time_slots_event_id ON time_slots (event_id)")
+    else:
+        op.create_index("ix_time_slots_event_id", "time_slots", ["event_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_time_slots_event_id", table_name="time_slots")
@@ -0,0 +1,75 @@
+"""
+Measure notification outbox throughput against a local SMTP sink.
+
+Enqueues --messages outbox entries, drains them with the dispatcher over a
+pool of --pool-size SMTP connections and reports messages per second.
+
+    poetry run python -m benchmarks.outbox_throughput --messages 5000 --pool-size 8
+"""
+
+import argparse
+import asyncio
+import time
+from uuid import uuid4
+
+from sqlalchemy import delete
+
+from src.domain.entities import Booking, Notification
+from src.infrastructure.database.database import Base, async_session_maker, engine
+from src.infrastructure.database.models import OutboxMessageModel
+from src.infrastructure.database.repositories import SQLAlchemyNotificationOutbox
+from src.infrastructure.metrics import metrics
+from src.infrastructure.notifications import (
+    OutboxDispatcher,
+    SMTPConnectionPool,
+    SMTPSettings,
+    SMTPSink,
+)
+
+
+async def main(messages: int, pool_size: int, batch_size: int) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    sink = SMTPSink(port=0, keep=1)
+    await sink.start()
+
+    async with async_session_maker() as session:
+        async with session.begin():
+            await session.execute(delete(OutboxMessageModel))
+            outbox = SQLAlchemyNotificationOutbox(session)
+            for i in range(messages):
+                booking = Booking(
+                    attendee_name=f"Attendee {i}",
+                    time_slot_id=uuid4(),
+                    email=f"attendee{i}@example.com",
+                )
+                await outbox.enqueue(
+                    Notification.for_booking(Notification.BOOKING_CREATED, booking)
+                )
+
+    dispatcher = OutboxDispatcher(
+        async_session_maker,
+        SMTPConnectionPool(SMTPSettings(host=sink.host, port=sink.port), size=pool_size),
+        batch_size=batch_size,
+    )
+    started = time.perf_counter()
+    processed = await dispatcher.drain()
+    elapsed = time.perf_counter() - started
+    await dispatcher.stop()
+    await sink.stop()
+    await engine.dispose()
+
+    print(f"messages:   {processed} sent, {sink.received} received by sink")
+    print(f"elapsed:    {elapsed:.3f}s")
+    print(f"throughput: {processed / elapsed:.0f} messages/s")
+    print(f"batches:    {metrics.snapshot()['timings']['outbox.batch']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--pool-size", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.messages, args.pool_size, args.batch_size))
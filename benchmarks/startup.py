@@ -0,0 +1,84 @@
+"""
+Measure how long the API takes to import and to become ready to serve.
+
+Imports src.main in a fresh interpreter --runs times, then starts uvicorn as
+many times and polls /health until it answers, reporting the fastest and the
+median of each. Every run is a new process, so nothing is warm but the OS
+page cache; point DATABASE_URL at a migrated database first.
+
+    poetry run python -m benchmarks.startup --runs 10
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from typing import List
+
+IMPORT_PROBE = (
+    "import time; started = time.perf_counter(); import src.main; "
+    "print(time.perf_counter() - started)"
+)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def import_time() -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE], check=True, capture_output=True, text=True
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def ready_time(timeout: float) -> float:
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/health"
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.main:app", "--port", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if server.poll() is not None:
+                raise RuntimeError(f"Server exited with {server.returncode} before it was ready")
+            try:
+                with urllib.request.urlopen(url, timeout=1):
+                    return time.perf_counter() - started
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.005)
+        raise RuntimeError(f"Server not ready after {timeout:.0f}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def report(label: str, samples: List[float]) -> None:
+    print(
+        f"{label:<8} min {min(samples) * 1000:>7.0f} ms"
+        f"  median {statistics.median(samples) * 1000:>7.0f} ms"
+    )
+
+
+def main(runs: int, timeout: float) -> None:
+    os.environ.setdefault("PYTHONPATH", os.getcwd())
+    report("import", [import_time() for _ in range(runs)])
+    report("ready", [ready_time(timeout) for _ in range(runs)])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+    main(args.runs, args.timeout)
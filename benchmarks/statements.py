@@ -0,0 +1,160 @@
+"""
+Measure the CPU saved per request by the cached hot statements.
+
+Each request is one transaction doing what a booking request does to the
+database: look a booking up by token, fetch its slot, reserve and release a
+seat, then roll back. It runs --requests of them sequentially, alternating
+for --rounds rounds between three setups:
+
+- rebuilt, unprepared: statements built per call, as before, and no
+  prepared-statement cache (what DB_PGBOUNCER=true does);
+- rebuilt: statements built per call, prepared statements cached;
+- cached: the repository's module-level statements, prepared statements cached.
+
+and reports wall and CPU time per request. PostgreSQL only.
+
+    poetry run python -m benchmarks.statements --requests 5000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import date
+from datetime import time as clock
+from datetime import timedelta
+from typing import Awaitable, Callable, Dict, List
+from uuid import UUID, uuid4
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.application.use_cases.create_booking import CreateBookingUseCase
+from src.application.use_cases.create_event import CreateEventUseCase
+from src.infrastructure.database.database import (
+    DATABASE_URL,
+    DB_STATEMENT_CACHE_SIZE,
+    async_session_maker,
+    engine,
+)
+from src.infrastructure.database.models import BookingModel, TimeSlotModel
+from src.infrastructure.database.repositories import (
+    SQLAlchemyBookingRepository,
+    SQLAlchemyTimeSlotRepository,
+    token_digest,
+)
+from src.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+
+Request = Callable[[AsyncSession, str, UUID], Awaitable[None]]
+
+
+async def rebuilt(session: AsyncSession, token: str, slot_id: UUID) -> None:
+    # The statements as the repositories built them on every call.
+    await session.execute(
+        select(BookingModel).where(BookingModel.booking_token_hash == token_digest(token))
+    )
+    await session.execute(select(TimeSlotModel).where(TimeSlotModel.id == slot_id))
+    await session.execute(
+        update(TimeSlotModel)
+        .where(TimeSlotModel.id == slot_id)
+        .where(TimeSlotModel.current_bookings + 1 <= TimeSlotModel.max_capacity)
+        .values(current_bookings=TimeSlotModel.current_bookings + 1)
+    )
+    await session.execute(
+        update(TimeSlotModel)
+        .where(TimeSlotModel.id == slot_id)
+        .where(TimeSlotModel.current_bookings - 1 >= 0)
+        .values(current_bookings=TimeSlotModel.current_bookings - 1)
+    )
+
+
+async def cached(session: AsyncSession, token: str, slot_id: UUID) -> None:
+    await SQLAlchemyBookingRepository(session).get_by_token(token)
+    time_slots = SQLAlchemyTimeSlotRepository(session)
+    await time_slots.get_by_id(slot_id)
+    await time_slots.reserve_spots(slot_id, 1)
+    await time_slots.release_spots(slot_id, 1)
+
+
+async def measure(
+    bind, request: Request, requests: int, token: str, slot_id: UUID
+) -> Dict[str, float]:
+    wall, cpu = time.perf_counter(), time.process_time()
+    for _ in range(requests):
+        async with AsyncSession(bind) as session:
+            async with session.begin():
+                await request(session, token, slot_id)
+                await session.rollback()
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    return {"wall": wall / requests * 1e6, "cpu": cpu / requests * 1e6}
+
+
+def median(runs: List[Dict[str, float]], key: str) -> float:
+    return statistics.median(run[key] for run in runs)
+
+
+async def main(requests: int, rounds: int) -> None:
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("Prepared statements are asyncpg's; point DATABASE_URL at PostgreSQL.")
+
+    async with async_session_maker() as session:
+        uow = SQLAlchemyUnitOfWork(session)
+        event = await CreateEventUseCase(uow).execute(
+            name="Statement benchmark",
+            event_date=date.today() + timedelta(days=3650),
+            time_slots=[{"start_time": clock(9), "end_time": clock(9, 30), "max_capacity": 10}],
+        )
+    slot_id = event.time_slots[0].id
+    async with async_session_maker() as session:
+        booking = await CreateBookingUseCase(SQLAlchemyUnitOfWork(session)).execute(
+            "Benchmark", slot_id, 1
+        )
+
+    unprepared = create_async_engine(
+        DATABASE_URL,
+        connect_args={
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4().hex}__",
+        },
+    )
+    setups = [
+        ("rebuilt, unprepared", unprepared, rebuilt),
+        ("rebuilt", engine, rebuilt),
+        ("cached", engine, cached),
+    ]
+    runs: Dict[str, List[Dict[str, float]]] = {label: [] for label, _, _ in setups}
+    try:
+        for bind, request in {(bind, request) for _, bind, request in setups}:
+            await measure(bind, request, requests // 10, booking.booking_token, slot_id)
+        for round_ in range(rounds):
+            # Each setup goes first in turn, so slow drift over the rounds evens out.
+            shift = round_ % len(setups)
+            for label, bind, request in setups[shift:] + setups[:shift]:
+                runs[label].append(
+                    await measure(bind, request, requests, booking.booking_token, slot_id)
+                )
+    finally:
+        async with async_session_maker() as session:
+            await SQLAlchemyUnitOfWork(session).events.delete(event.id)
+            await session.commit()
+        await unprepared.dispose()
+        await engine.dispose()
+
+    print(f"requests:            {requests} x {rounds} rounds")
+    print(f"statement cache:     {DB_STATEMENT_CACHE_SIZE} per connection")
+    baseline = median(runs["rebuilt, unprepared"], "cpu")
+    for label, measured in runs.items():
+        cpu = median(measured, "cpu")
+        print(
+            f"{label:<20} {median(measured, 'wall'):8.1f} us wall {cpu:8.1f} us cpu per request"
+            f"  ({(cpu / baseline - 1) * 100:+.1f}% cpu)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.rounds))
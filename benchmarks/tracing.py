@@ -0,0 +1,128 @@
+"""
+Measure the per-request cost of tracing, through the whole app in process.
+
+Runs a booking workload (create, get, move and cancel --requests/4 bookings)
+first with tracing not installed, then instrumented with no request sampled,
+with --sample-rate of them sampled and with all of them sampled, exporting to
+a temporary file, and reports wall and CPU time per request for each. The
+instrumented runs alternate for --rounds rounds, so drift in the database
+affects them alike, and are compared with the unsampled ones. Run it with
+TRACING_ENABLED unset; it installs tracing itself.
+
+    poetry run python -m benchmarks.tracing --requests 2000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+import httpx
+
+from src.infrastructure.api.tracing import TracingMiddleware
+from src.infrastructure.database.database import engine
+from src.infrastructure.tracing import FileSpanSink, SpanExporter, instrument, tracer
+from src.infrastructure.tracing.tracer import TRACE_SAMPLE_RATE
+from src.main import app, lifespan
+
+
+async def workload(client: httpx.AsyncClient, requests: int, day: int) -> int:
+    slots = [
+        {"start_time": "09:00", "end_time": "09:30", "max_capacity": requests},
+        {"start_time": "09:30", "end_time": "10:00", "max_capacity": requests},
+    ]
+    event = (
+        await client.post(
+            "/events",
+            json={
+                "name": "Tracing benchmark",
+                "event_date": (date.today() + timedelta(days=3650 + day)).isoformat(),
+                "time_slots": slots,
+            },
+        )
+    ).json()
+    first, second = (slot["id"] for slot in event["time_slots"])
+    sent = 1
+    for i in range(requests // 4):
+        booking = await client.post(
+            "/bookings",
+            json={"attendee_name": f"Attendee {i}", "time_slot_id": first, "number_of_seats": 1},
+        )
+        token = booking.json()["booking_token"]
+        await client.get(f"/bookings/{token}")
+        await client.put(f"/bookings/{token}", json={"new_time_slot_id": second})
+        await client.delete(f"/bookings/{token}")
+        sent += 4
+    return sent
+
+
+async def measure(
+    asgi_app, requests: int, day: int, exporter: Optional[SpanExporter] = None
+) -> Dict[str, float]:
+    transport = httpx.ASGITransport(app=asgi_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench/api/v1") as client:
+        wall, cpu = time.perf_counter(), time.process_time()
+        sent = await workload(client, requests, day)
+        if exporter:
+            # Charge the export of this run's spans to this run.
+            await exporter.run_once()
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    return {"wall": wall / sent * 1e3, "cpu": cpu / sent * 1e3}
+
+
+def median(runs: List[Dict[str, float]], key: str) -> float:
+    return statistics.median(run[key] for run in runs)
+
+
+def report(label: str, runs: List[Dict[str, float]], baseline: List[Dict[str, float]]) -> None:
+    cpu = median(runs, "cpu")
+    print(
+        f"{label:<16} {median(runs, 'wall'):8.3f} ms wall {cpu:8.3f} ms cpu per request"
+        f"  ({(cpu / median(baseline, 'cpu') - 1) * 100:+.1f}% cpu)"
+    )
+
+
+async def main(requests: int, rounds: int, sample_rate: float) -> None:
+    if os.getenv("TRACING_ENABLED", "false").lower() == "true":
+        raise SystemExit("Unset TRACING_ENABLED; the benchmark installs tracing itself.")
+    async with lifespan(app):
+        await measure(app, requests // 4, 0)  # warm up pools and caches
+        untraced = [await measure(app, requests, day) for day in range(1, rounds + 1)]
+
+        instrument(engine)
+        traced_app = TracingMiddleware(app)
+        rates = {"unsampled": 0.0, f"sampled {sample_rate:g}": sample_rate, "sampled 1": 1.0}
+        runs: Dict[str, List[Dict[str, float]]] = {label: [] for label in rates}
+        day = rounds
+        with tempfile.TemporaryDirectory() as directory:
+            exporter = SpanExporter(FileSpanSink(os.path.join(directory, "traces.jsonl")))
+            exporter.start()
+            modes = list(rates.items())
+            for round_ in range(rounds):
+                # Each mode goes first in turn, so slow drift over the rounds evens out.
+                shift = round_ % len(modes)
+                for label, rate in modes[shift:] + modes[:shift]:
+                    day += 1
+                    tracer.sample_rate = rate
+                    runs[label].append(await measure(traced_app, requests, day, exporter))
+            await exporter.stop()
+
+    # Instrumented runs are compared with the unsampled runs they alternated with.
+    print(f"requests:        {requests} x {rounds} rounds")
+    report("untraced", untraced, untraced)
+    for label, measured in runs.items():
+        report(label, measured, runs["unsampled"])
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--sample-rate", type=float, default=TRACE_SAMPLE_RATE)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.rounds, args.sample_rate))
@@ -0,0 +1,130 @@
+"""
+Measure booking use-case throughput on the in-memory or PostgreSQL backend.
+
+Creates an event, then books, moves and cancels --bookings bookings with
+--concurrency tasks in flight, reporting operations per second for each step
+and, separately, the cost of serializing the responses. Running it with
+--backend memory leaves only use-case and serialization overhead; the
+difference to --backend sqlalchemy is the cost of the database.
+
+    poetry run python -m benchmarks.use_cases --backend memory --bookings 5000
+"""
+
+import argparse
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from datetime import date
+from datetime import time as clock
+from typing import AsyncIterator, Awaitable, Callable, List
+
+from src.application.unit_of_work import UnitOfWork
+from src.application.use_cases.cancel_booking import CancelBookingUseCase
+from src.application.use_cases.create_booking import CreateBookingUseCase
+from src.application.use_cases.create_event import CreateEventUseCase
+from src.application.use_cases.update_booking import UpdateBookingUseCase
+from src.infrastructure.api.schemas import BookingResponse
+
+
+def uow_factory(backend: str) -> Callable[[], AsyncIterator[UnitOfWork]]:
+    if backend == "memory":
+        from src.infrastructure.memory import MemoryUnitOfWork
+
+        @asynccontextmanager
+        async def open_memory_uow() -> AsyncIterator[UnitOfWork]:
+            yield MemoryUnitOfWork()
+
+        return open_memory_uow
+
+    from src.infrastructure.database.database import async_session_maker
+    from src.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+
+    @asynccontextmanager
+    async def open_sqlalchemy_uow() -> AsyncIterator[UnitOfWork]:
+        async with async_session_maker() as session:
+            yield SQLAlchemyUnitOfWork(session)
+
+    return open_sqlalchemy_uow
+
+
+async def run(label: str, count: int, concurrency: int, op: Callable[[int], Awaitable]) -> list:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def guarded(i: int):
+        async with semaphore:
+            return await op(i)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(guarded(i) for i in range(count)))
+    elapsed = time.perf_counter() - started
+    print(f"{label:<10} {count / elapsed:>10.0f} ops/s  ({elapsed:.3f}s)")
+    return results
+
+
+async def main(backend: str, bookings: int, concurrency: int) -> None:
+    open_uow = uow_factory(backend)
+    if backend == "sqlalchemy":
+        from src.infrastructure.database.database import engine, init_db
+
+        await init_db()
+
+    async with open_uow() as uow:
+        event = await CreateEventUseCase(uow).execute(
+            name="Benchmark",
+            event_date=date.today(),
+            time_slots=[
+                {"start_time": clock(9), "end_time": clock(9, 30), "max_capacity": bookings},
+                {"start_time": clock(9, 30), "end_time": clock(10), "max_capacity": bookings},
+            ],
+        )
+    first, second = (slot.id for slot in event.time_slots)
+
+    async def create(i: int):
+        async with open_uow() as uow:
+            return await CreateBookingUseCase(uow).execute(f"Attendee {i}", first, 1)
+
+    retries = 0
+
+    async def move(i: int):
+        nonlocal retries
+        async with open_uow() as uow:
+            moved = await UpdateBookingUseCase(uow).execute(created[i].booking_token, second)
+            retries += uow.retries
+            return moved
+
+    async def cancel(i: int):
+        async with open_uow() as uow:
+            return await CancelBookingUseCase(uow).execute(created[i].booking_token)
+
+    print(f"backend:    {backend}")
+    created: List = await run("create", bookings, concurrency, create)
+
+    started = time.perf_counter()
+    for booking in created:
+        BookingResponse(
+            id=booking.id,
+            attendee_name=booking.attendee_name,
+            time_slot_id=booking.time_slot_id,
+            number_of_seats=booking.number_of_seats,
+            booking_token=booking.booking_token,
+            email=booking.email,
+            created_at=booking.created_at,
+        ).model_dump_json()
+    elapsed = time.perf_counter() - started
+    print(f"{'serialize':<10} {bookings / elapsed:>10.0f} ops/s  ({elapsed:.3f}s)")
+
+    await run("move", bookings, concurrency, move)
+    print(f"{'retries':<10} {retries:>10}")
+    await run("cancel", bookings, concurrency, cancel)
+
+    if backend == "sqlalchemy":
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--backend", choices=("memory", "sqlalchemy"), default="memory")
+    parser.add_argument("--bookings", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    asyncio.run(main(args.backend, args.bookings, args.concurrency))
@@ -0,0 +1,106 @@
+import asyncio
+import random
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, TypeVar
+
+from src.domain.repositories import (
+    AvailabilityRepository,
+    BookingGroupRepository,
+    BookingRepository,
+    ChangeLogRepository,
+    EventImportRepository,
+    EventRepository,
+    EventTemplateRepository,
+    NotificationOutbox,
+    TimeSlotRepository,
+)
+
+T = TypeVar("T")
+
+# Attempts and backoff of `UnitOfWork.run` when a unit hits a transient conflict.
+MAX_ATTEMPTS = 4
+BASE_BACKOFF = 0.01
+MAX_BACKOFF = 0.2
+
+
+class UnitOfWork(ABC):
+    """
+    Transaction boundary shared by the repositories of one operation.
+
+    Repositories only stage their writes; `async with uow:` commits them
+    together when the block exits cleanly and rolls back otherwise. Blocks may
+    nest, in which case only the outermost one commits, so a request can
+    combine several use cases into a single transaction.
+    """
+
+    events: EventRepository
+    time_slots: TimeSlotRepository
+    bookings: BookingRepository
+    booking_groups: BookingGroupRepository
+    outbox: NotificationOutbox
+    change_log: ChangeLogRepository
+    templates: EventTemplateRepository
+    event_imports: EventImportRepository
+    availability: AvailabilityRepository
+
+    _depth = 0
+    # Retries made by `run` over the lifetime of this unit.
+    retries = 0
+
+    async def __aenter__(self) -> "UnitOfWork":
+        if self._depth == 0:
+            await self.begin()
+        self._depth += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._depth -= 1
+        if self._depth:
+            return
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
+
+    async def run(
+        self, operation: Callable[[], Awaitable[T]], max_attempts: int = MAX_ATTEMPTS
+    ) -> T:
+        """
+        Run `operation` inside this unit, retrying the whole unit on transient conflicts.
+
+        Deadlocks and serialization failures roll the unit back and run it again
+        after a short randomized backoff, up to `max_attempts` times. Inside an
+        enclosing unit the error is left to the outermost block, since only it
+        can roll back.
+        """
+        attempt = 1
+        while True:
+            try:
+                async with self:
+                    return await operation()
+            except Exception as e:
+                if self._depth or attempt >= max_attempts or not self.is_retryable(e):
+                    raise
+            self.retries += 1
+            backoff = min(MAX_BACKOFF, BASE_BACKOFF * 2 ** (attempt - 1))
+            await asyncio.sleep(backoff * random.uniform(0.5, 1.0))
+            attempt += 1
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Whether `error` is a transient conflict that a fresh attempt may not hit."""
+        return False
+
+    @abstractmethod
+    async def begin(self) -> None:
+        """Start the transaction."""
+        pass
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """Write all staged changes and commit."""
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """Discard all staged changes."""
+        pass
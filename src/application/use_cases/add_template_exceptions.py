@@ -0,0 +1,48 @@
+from datetime import date
+from typing import List, Tuple
+from uuid import UUID
+
+from src.application.unit_of_work import UnitOfWork
+from src.domain.entities import EventTemplate
+
+
+class AddTemplateExceptionsUseCase:
+    """Use case for skipping dates of a recurring event template."""
+
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    async def execute(
+        self, template_id: UUID, dates: List[date]
+    ) -> Tuple[EventTemplate, List[date]]:
+        """
+        Exclude dates from a template.
+
+        Events already generated for those dates are removed unless someone has
+        booked them; booked events are kept and reported back. The template is
+        locked meanwhile, so the generator cannot work from stale exceptions.
+
+        Args:
+            template_id: Template to change
+            dates: Dates to skip
+
+        Returns:
+            Tuple of (updated template, dates whose booked event was kept)
+
+        Raises:
+            ValueError: If the template does not exist
+        """
+        async with self.uow:
+            template = await self.uow.templates.get_for_update(template_id)
+            if not template:
+                raise ValueError("Template not found")
+
+            kept = []
+            for day in sorted(set(dates) - set(template.exceptions)):
+                if day <= template.generated_until:
+                    if not await self.uow.templates.remove_unbooked_event(template.id, day):
+                        kept.append(day)
+            template.exceptions = sorted(set(template.exceptions) | set(dates))
+            await self.uow.templates.update(template)
+
+        return template, kept
@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from src.application.unit_of_work import UnitOfWork
+from src.domain.entities import Change
+
+CAPACITY_UPDATED = "updated"
+CAPACITY_UNCHANGED = "unchanged"
+CAPACITY_BELOW_BOOKINGS = "below_bookings"
+CAPACITY_NOT_FOUND = "not_found"
+
+
+@dataclass
+class CapacityChangeResult:
+    """Outcome of a capacity change for one time slot."""
+
+    time_slot_id: UUID
+    status: str
+    max_capacity: Optional[int] = None
+    current_bookings: Optional[int] = None
+
+
+class AdjustSlotCapacitiesUseCase:
+    """Use case for changing the capacity of many time slots at once."""
+
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    async def execute(self, capacities: Dict[UUID, int]) -> List[CapacityChangeResult]:
+        """
+        Set new max capacities, leaving alone any slot they would overbook.
+
+        Args:
+            capacities: New max capacity by time slot ID
+
+        Returns:
+            One result per requested slot, in request order, with the slot's
+            capacity and bookings as they stand afterwards
+
+        Raises:
+            ValueError: If no slots are given or a capacity is not positive
+        """
+        if not capacities:
+            raise ValueError("At least one time slot is required")
+        if any(capacity <= 0 for capacity in capacities.values()):
+            raise ValueError("Capacity must be positive")
+        async with self.uow:
+            return await self._adjust(capacities)
+
+    async def _adjust(self, capacities: Dict[UUID, int]) -> List[CapacityChangeResult]:
+        changed, unchanged = await self.uow.time_slots.set_capacities(capacities)
+
+        results: Dict[UUID, CapacityChangeResult] = {}
+        for time_slot in changed:
+            results[time_slot.id] = CapacityChangeResult(
+                time_slot.id, CAPACITY_UPDATED, time_slot.max_capacity, time_slot.current_bookings
+            )
+            await self.uow.change_log.append(
+                Change(
+                    Change.SLOT_CAPACITY_CHANGED,
+                    {
+                        "time_slot_id": str(time_slot.id),
+                        "event_id": str(time_slot.event_id),
+                        "max_capacity": time_slot.max_capacity,
+                        "current_bookings": time_slot.current_bookings,
+                    },
+                )
+            )
+        for time_slot in unchanged:
+            status = (
+                CAPACITY_UNCHANGED
+                if time_slot.max_capacity == capacities[time_slot.id]
+                else CAPACITY_BELOW_BOOKINGS
+            )
+            results[time_slot.id] = CapacityChangeResult(
+                time_slot.id, status, time_slot.max_capacity, time_slot.current_bookings
+            )
+
+        return [
+            results.get(slot_id) or CapacityChangeResult(slot_id, CAPACITY_NOT_FOUND)
+            for slot_id in capacities
+        ]
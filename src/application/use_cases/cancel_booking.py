@@ -1,16 +1,12 @@
-from src.domain.repositories import BookingRepository, TimeSlotRepository
+from src.application.unit_of_work import UnitOfWork
+from src.domain.entities import Change, Notification
 
 
 class CancelBookingUseCase:
     """Use case for canceling a booking."""
 
-    def __init__(
-        self,
-        booking_repository: BookingRepository,
-        time_slot_repository: TimeSlotRepository,
-    ):
-        self.booking_repository = booking_repository
-        self.time_slot_repository = time_slot_repository
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
 
     async def execute(self, token: str) -> bool:
         """
@@ -22,22 +18,34 @@ class CancelBookingUseCase:
         Returns:
             True if canceled, False if not found
         """
-        session = getattr(self.booking_repository, "session", None)
-        if session:
-            if session.in_transaction():
-                return await self._cancel_booking(token)
-            async with session.begin():
-                return await self._cancel_booking(token)
-
-        return await self._cancel_booking(token)
+        async with self.uow:
+            return await self._cancel_booking(token)
 
     async def _cancel_booking(self, token: str) -> bool:
-        booking = await self.booking_repository.get_by_token(token)
+        booking = await self.uow.bookings.get_by_token(token)
         if not booking:
             return False
 
-        await self.time_slot_repository.release_spots(
+        await self.uow.time_slots.release_spots(
             booking.time_slot_id,
             booking.number_of_seats,
         )
-        return await self.booking_repository.delete(booking.id)
+        deleted = await self.uow.bookings.delete(booking.id)
+
+        if deleted:
+            await self.uow.change_log.append(
+                Change(
+                    Change.BOOKING_CANCELLED,
+                    {
+                        "booking_id": str(booking.id),
+                        "time_slot_id": str(booking.time_slot_id),
+                        "number_of_seats": booking.number_of_seats,
+                    },
+                )
+            )
+
+        if deleted and booking.email:
+            await self.uow.outbox.enqueue(
+                Notification.for_booking(Notification.BOOKING_CANCELLED, booking)
+            )
+        return deleted
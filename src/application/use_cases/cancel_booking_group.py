@@ -0,0 +1,51 @@
+from src.application.unit_of_work import UnitOfWork
+from src.domain.entities import Change, Notification
+
+
+class CancelBookingGroupUseCase:
+    """Use case for canceling every booking of a booking group."""
+
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    async def execute(self, token: str) -> bool:
+        """
+        Cancel a booking group and release its seats in all of its slots.
+
+        Args:
+            token: Booking group token
+
+        Returns:
+            True if canceled, False if not found
+        """
+        async with self.uow:
+            return await self._cancel_group(token)
+
+    async def _cancel_group(self, token: str) -> bool:
+        group = await self.uow.booking_groups.get_by_token(token)
+        if not group:
+            return False
+
+        # Deleting first means a concurrent cancel of the same group finds
+        # nothing to delete and releases nothing.
+        if not await self.uow.booking_groups.delete(group.id):
+            return False
+        for booking in sorted(group.bookings, key=lambda booking: booking.time_slot_id):
+            await self.uow.time_slots.release_spots(booking.time_slot_id, booking.number_of_seats)
+            await self.uow.change_log.append(
+                Change(
+                    Change.BOOKING_CANCELLED,
+                    {
+                        "booking_id": str(booking.id),
+                        "time_slot_id": str(booking.time_slot_id),
+                        "number_of_seats": booking.number_of_seats,
+                        "group_id": str(group.id),
+                    },
+                )
+            )
+
+        if group.email:
+            await self.uow.outbox.enqueue(
+                Notification.for_group(Notification.GROUP_BOOKING_CANCELLED, group)
+            )
+        return True
@@ -0,0 +1,80 @@
+from typing import List, Set
+from uuid import UUID
+
+from src.application.unit_of_work import UnitOfWork
+from src.domain.entities import Booking, Change, Event, Notification
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class CancelEventUseCase:
+    """Use case for cancelling an event with all of its time slots and bookings."""
+
+    def __init__(self, uow: UnitOfWork, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.uow = uow
+        self.chunk_size = chunk_size
+
+    async def execute(self, event_id: UUID) -> List[Booking]:
+        """
+        Cancel an event, telling everyone who had booked it.
+
+        Bookings are deleted a chunk at a time, each chunk's notifications and
+        change feed entries staged as it goes; the slots and the event go last.
+        It all happens in one transaction, committed before the cancelled
+        bookings are returned, so callers never hold it open while reporting.
+
+        Args:
+            event_id: Event ID
+
+        Returns:
+            The cancelled bookings
+
+        Raises:
+            ValueError: If the event does not exist
+        """
+        async with self.uow:
+            event = await self.uow.events.get_by_id(event_id)
+            if not event:
+                raise ValueError("Event not found")
+
+            # Group members may fall into different chunks; each group is told once.
+            notified_groups: Set[UUID] = set()
+            cancelled: List[Booking] = []
+            async for bookings in self.uow.bookings.delete_by_event(event_id, self.chunk_size):
+                await self._record(event, bookings, notified_groups)
+                cancelled.extend(bookings)
+
+            await self.uow.events.delete(event_id)
+            await self.uow.change_log.append(
+                Change(
+                    Change.EVENT_CANCELLED,
+                    {"event_id": str(event_id), "bookings_cancelled": len(cancelled)},
+                )
+            )
+        return cancelled
+
+    async def _record(
+        self, event: Event, bookings: List[Booking], notified_groups: Set[UUID]
+    ) -> None:
+        for booking in bookings:
+            payload = {
+                "booking_id": str(booking.id),
+                "time_slot_id": str(booking.time_slot_id),
+                "number_of_seats": booking.number_of_seats,
+            }
+            if booking.group_id:
+                payload["group_id"] = str(booking.group_id)
+            await self.uow.change_log.append(Change(Change.BOOKING_CANCELLED, payload))
+
+            if not booking.email or booking.group_id in notified_groups:
+                continue
+            if booking.group_id:
+                notified_groups.add(booking.group_id)
+            await self.uow.outbox.enqueue(
+                Notification.for_booking(
+                    Notification.EVENT_CANCELLED,
+                    booking,
+                    event_name=event.name,
+                    event_date=event.event_date,
+                )
+            )
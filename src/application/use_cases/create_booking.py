@@ -1,20 +1,15 @@
 from typing import Optional
 from uuid import UUID
 
-from src.domain.entities import Booking
-from src.domain.repositories import BookingRepository, TimeSlotRepository
+from src.application.unit_of_work import UnitOfWork
+from src.domain.entities import Booking, Change, Notification
 
 
 class CreateBookingUseCase:
     """Use case for creating a booking."""
 
-    def __init__(
-        self,
-        booking_repository: BookingRepository,
-        time_slot_repository: TimeSlotRepository,
-    ):
-        self.booking_repository = booking_repository
-        self.time_slot_repository = time_slot_repository
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
 
     async def execute(
         self,
@@ -37,29 +32,13 @@ class CreateBookingUseCase:
         Raises:
             ValueError: If time slot is full or doesn't exist
         """
-        session = getattr(self.booking_repository, "session", None)
-        if session:
-            if session.in_transaction():
-                return await self._create_booking(
-                    attendee_name,
-                    time_slot_id,
-                    number_of_seats,
-                    email,
-                )
-            async with session.begin():
-                return await self._create_booking(
-                    attendee_name,
-                    time_slot_id,
-                    number_of_seats,
-                    email,
-                )
-
-        return await self._create_booking(
-            attendee_name,
-            time_slot_id,
-            number_of_seats,
-            email,
-        )
+        async with self.uow:
+            return await self._create_booking(
+                attendee_name,
+                time_slot_id,
+                number_of_seats,
+                email,
+            )
 
     async def _create_booking(
         self,
@@ -68,7 +47,7 @@ class CreateBookingUseCase:
         number_of_seats: int,
         email: Optional[str],
     ) -> Booking:
-        time_slot = await self.time_slot_repository.get_by_id(time_slot_id)
+        time_slot = await self.uow.time_slots.get_by_id(time_slot_id)
         if not time_slot:
             raise ValueError("Time slot not found")
 
@@ -80,12 +59,36 @@ class CreateBookingUseCase:
             time_slot_id=time_slot_id,
             number_of_seats=number_of_seats,
             email=email,
+            event_id=time_slot.event_id,
         )
 
-        reserved = await self.time_slot_repository.reserve_spots(
+        reserved = await self.uow.time_slots.reserve_spots(
             time_slot_id,
             number_of_seats,
         )
         if not reserved:
             raise ValueError("Time slot is full")
-        return await self.booking_repository.create(booking)
+        created = await self.uow.bookings.create(booking)
+
+        await self.uow.change_log.append(
+            Change(
+                Change.BOOKING_CREATED,
+                {
+                    "booking_id": str(created.id),
+                    "event_id": str(time_slot.event_id),
+                    "time_slot_id": str(time_slot_id),
+                    "number_of_seats": number_of_seats,
+                },
+            )
+        )
+
+        if created.email:
+            await self.uow.outbox.enqueue(
+                Notification.for_booking(
+                    Notification.BOOKING_CREATED,
+                    created,
+                    start_time=time_slot.start_time,
+                    end_time=time_slot.end_time,
+                )
+            )
+        return created
@@ -0,0 +1,97 @@
+from typing import List, Optional
+from uuid import UUID
+
+from src.application.unit_of_work import UnitOfWork
+from src.domain.entities import BookingGroup, Change, Notification
+
+
+class CreateBookingGroupUseCase:
+    """Use case for booking one party into several time slots at once."""
+
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    async def execute(
+        self,
+        attendee_name: str,
+        time_slot_ids: List[UUID],
+        number_of_seats: int,
+        email: Optional[str] = None,
+    ) -> BookingGroup:
+        """
+        Book the same seats in every one of the time slots, or in none.
+
+        Args:
+            attendee_name: Name of the attendee
+            time_slot_ids: IDs of the time slots to book, all of one event
+            number_of_seats: Seats to reserve in each slot
+            email: Optional email for notifications
+
+        Returns:
+            Created BookingGroup with the token managing all its slots
+
+        Raises:
+            ValueError: If a time slot is full or doesn't exist, or the slots
+                are repeated or belong to different events
+        """
+        if not time_slot_ids:
+            raise ValueError("At least one time slot is required")
+        if len(set(time_slot_ids)) != len(time_slot_ids):
+            raise ValueError("Time slots must be distinct")
+        async with self.uow:
+            return await self._create_group(attendee_name, time_slot_ids, number_of_seats, email)
+
+    async def _create_group(
+        self,
+        attendee_name: str,
+        time_slot_ids: List[UUID],
+        number_of_seats: int,
+        email: Optional[str],
+    ) -> BookingGroup:
+        # One statement reserves every slot or none; raising afterwards rolls
+        # the whole unit back, so no seats stay reserved on any failure.
+        time_slots = await self.uow.time_slots.reserve_spots_together(
+            time_slot_ids, number_of_seats
+        )
+        if len(time_slots) != len(time_slot_ids):
+            for time_slot_id in time_slot_ids:
+                if not await self.uow.time_slots.get_by_id(time_slot_id):
+                    raise ValueError("Time slot not found")
+            raise ValueError("Time slot is full")
+        if len({time_slot.event_id for time_slot in time_slots}) > 1:
+            raise ValueError("Time slots must belong to the same event")
+
+        group = BookingGroup(
+            attendee_name=attendee_name,
+            number_of_seats=number_of_seats,
+            email=email,
+        )
+        time_slots.sort(key=lambda time_slot: (time_slot.start_time, time_slot.id))
+        for time_slot in time_slots:
+            group.add_slot(time_slot)
+        created = await self.uow.booking_groups.create(group)
+
+        for booking, time_slot in zip(created.bookings, time_slots):
+            await self.uow.change_log.append(
+                Change(
+                    Change.BOOKING_CREATED,
+                    {
+                        "booking_id": str(booking.id),
+                        "event_id": str(time_slot.event_id),
+                        "time_slot_id": str(time_slot.id),
+                        "number_of_seats": number_of_seats,
+                        "group_id": str(created.id),
+                    },
+                )
+            )
+
+        if created.email:
+            await self.uow.outbox.enqueue(
+                Notification.for_group(
+                    Notification.GROUP_BOOKING_CREATED,
+                    created,
+                    start_time=time_slots[0].start_time,
+                    end_time=max(time_slot.end_time for time_slot in time_slots),
+                )
+            )
+        return created
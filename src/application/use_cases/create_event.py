@@ -1,20 +1,29 @@
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from typing import List
 
+from src.application.unit_of_work import UnitOfWork
 from src.domain.entities import Event, TimeSlot
-from src.domain.repositories import EventRepository, TimeSlotRepository
+
+SLOT_DURATION = timedelta(minutes=30)
+
+
+def validate_slot_duration(start_time: time, end_time: time) -> None:
+    """
+    Enforce the fixed slot length shared by every event creation path.
+
+    Raises:
+        ValueError: If the slot is not exactly SLOT_DURATION long
+    """
+    duration = datetime.combine(date.min, end_time) - datetime.combine(date.min, start_time)
+    if duration != SLOT_DURATION:
+        raise ValueError("Time slots must be 30 minutes long")
 
 
 class CreateEventUseCase:
     """Use case for creating an event with time slots."""
 
-    def __init__(
-        self,
-        event_repository: EventRepository,
-        time_slot_repository: TimeSlotRepository,
-    ):
-        self.event_repository = event_repository
-        self.time_slot_repository = time_slot_repository
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
 
     async def execute(
         self,
@@ -34,25 +43,27 @@ class CreateEventUseCase:
 
         Returns:
             Created Event entity
+
+        Raises:
+            ValueError: If a time slot is not 30 minutes long
         """
-        # Create event
-        event = Event(name=name, event_date=event_date, description=description)
-        created_event = await self.event_repository.create(event)
-
-        # Create time slots
-        for slot_data in time_slots:
-            start_time = slot_data["start_time"]
-            end_time = slot_data["end_time"]
-            duration = datetime.combine(date.min, end_time) - datetime.combine(date.min, start_time)
-            if duration != timedelta(minutes=30):
-                raise ValueError("Time slots must be 30 minutes long")
-            time_slot = TimeSlot(
-                event_id=created_event.id,
-                start_time=start_time,
-                end_time=end_time,
-                max_capacity=slot_data["max_capacity"],
-            )
-            created_slot = await self.time_slot_repository.create(time_slot)
-            created_event.add_time_slot(created_slot)
+        async with self.uow:
+            # Create event
+            event = Event(name=name, event_date=event_date, description=description)
+            created_event = await self.uow.events.create(event)
+
+            # Create time slots; they are written together when the unit commits
+            for slot_data in time_slots:
+                start_time = slot_data["start_time"]
+                end_time = slot_data["end_time"]
+                validate_slot_duration(start_time, end_time)
+                time_slot = TimeSlot(
+                    event_id=created_event.id,
+                    start_time=start_time,
+                    end_time=end_time,
+                    max_capacity=slot_data["max_capacity"],
+                )
+                created_slot = await self.uow.time_slots.create(time_slot)
+                created_event.add_time_slot(created_slot)
 
         return created_event
@@ -0,0 +1,77 @@
+from datetime import date, time
+from typing import List, Optional
+
+from src.application.unit_of_work import UnitOfWork
+from src.application.use_cases.generate_template_events import slot_times
+from src.domain.entities import EventTemplate
+
+
+class CreateEventTemplateUseCase:
+    """Use case for creating a recurring event template."""
+
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    async def execute(
+        self,
+        name: str,
+        start_date: date,
+        window_start: time,
+        window_end: time,
+        slot_capacity: int,
+        frequency: str = EventTemplate.WEEKLY,
+        interval: int = 1,
+        weekdays: Optional[List[int]] = None,
+        end_date: Optional[date] = None,
+        exceptions: Optional[List[date]] = None,
+        description: Optional[str] = None,
+    ) -> EventTemplate:
+        """
+        Create a template; its events are generated separately.
+
+        Args:
+            name: Name given to every generated event
+            start_date: First date the template may produce an event
+            window_start: Start of the first slot of each day
+            window_end: End of the last slot of each day
+            slot_capacity: Seats in every generated slot
+            frequency: "daily" or "weekly"
+            interval: Every n-th day or week
+            weekdays: Weekdays for weekly templates, Monday being 0
+            end_date: Optional last date
+            exceptions: Dates to skip
+            description: Optional description of generated events
+
+        Returns:
+            Created EventTemplate entity
+
+        Raises:
+            ValueError: If the recurrence rule or window is invalid
+        """
+        if frequency not in EventTemplate.FREQUENCIES:
+            raise ValueError(f"Frequency must be one of: {', '.join(EventTemplate.FREQUENCIES)}")
+        if interval < 1:
+            raise ValueError("Interval must be at least 1")
+        if weekdays and not all(0 <= day <= 6 for day in weekdays):
+            raise ValueError("Weekdays must be between 0 (Monday) and 6 (Sunday)")
+        if end_date and end_date < start_date:
+            raise ValueError("End date must not be before start date")
+        if slot_capacity < 1:
+            raise ValueError("Slot capacity must be positive")
+        slot_times(window_start, window_end)
+
+        template = EventTemplate(
+            name=name,
+            description=description,
+            frequency=frequency,
+            interval=interval,
+            weekdays=weekdays,
+            start_date=start_date,
+            end_date=end_date,
+            window_start=window_start,
+            window_end=window_end,
+            slot_capacity=slot_capacity,
+            exceptions=exceptions,
+        )
+        async with self.uow:
+            return await self.uow.templates.create(template)
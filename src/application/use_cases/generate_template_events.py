@@ -0,0 +1,96 @@
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional, Tuple
+
+from src.application.unit_of_work import UnitOfWork
+from src.application.use_cases.create_event import SLOT_DURATION
+from src.domain.entities import Event, EventTemplate, TimeSlot
+
+DEFAULT_HORIZON_DAYS = 28
+DEFAULT_BATCH_SIZE = 100
+
+
+def slot_times(window_start: time, window_end: time) -> List[Tuple[time, time]]:
+    """
+    Split a daily window into consecutive SLOT_DURATION slots.
+
+    Raises:
+        ValueError: If the window is empty or not a whole number of slots
+    """
+    start = datetime.combine(date.min, window_start)
+    end = datetime.combine(date.min, window_end)
+    if end <= start or (end - start) % SLOT_DURATION:
+        raise ValueError("Template window must be a positive multiple of 30 minutes")
+    times = []
+    while start < end:
+        times.append((start.time(), (start + SLOT_DURATION).time()))
+        start += SLOT_DURATION
+    return times
+
+
+class GenerateTemplateEventsUseCase:
+    """Use case for materialising template occurrences up to a rolling horizon."""
+
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        horizon_days: int = DEFAULT_HORIZON_DAYS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self.uow = uow
+        self.horizon_days = horizon_days
+        self.batch_size = batch_size
+
+    async def execute(
+        self,
+        today: date,
+        templates: Optional[List[EventTemplate]] = None,
+    ) -> Tuple[int, int, int]:
+        """
+        Create the events and slots of due templates through the bulk import path.
+
+        Past dates are never generated, and a template's progress is committed
+        together with its events, so a date is produced exactly once.
+
+        Args:
+            today: First date that may still receive events
+            templates: Templates to generate; defaults to claiming up to
+                batch_size due templates
+
+        Returns:
+            Tuple of (templates processed, events created, slots created)
+        """
+        async with self.uow:
+            until = today + timedelta(days=self.horizon_days)
+            if templates is None:
+                templates = await self.uow.templates.claim_due(until, self.batch_size)
+
+            events: List[Event] = []
+            time_slots: List[TimeSlot] = []
+            for template in templates:
+                template.generated_until = max(template.generated_until, today - timedelta(days=1))
+                times = slot_times(template.window_start, template.window_end)
+                for day in template.occurrences(until):
+                    event = Event(
+                        name=template.name,
+                        event_date=day,
+                        description=template.description,
+                        template_id=template.id,
+                    )
+                    events.append(event)
+                    time_slots.extend(
+                        TimeSlot(
+                            event_id=event.id,
+                            start_time=start_time,
+                            end_time=end_time,
+                            max_capacity=template.slot_capacity,
+                        )
+                        for start_time, end_time in times
+                    )
+                template.generated_until = min(until, template.end_date or until)
+                await self.uow.templates.update(template)
+
+            if not events:
+                return len(templates), 0, 0
+            await self.uow.event_imports.stage(events, time_slots)
+            events_created, slots_created = await self.uow.event_imports.merge()
+            return len(templates), events_created, slots_created
@@ -0,0 +1,23 @@
+from typing import Optional
+
+from src.domain.entities import BookingGroup
+from src.domain.repositories import BookingGroupRepository
+
+
+class GetBookingGroupUseCase:
+    """Use case for retrieving a booking group by token."""
+
+    def __init__(self, booking_group_repository: BookingGroupRepository):
+        self.booking_group_repository = booking_group_repository
+
+    async def execute(self, token: str) -> Optional[BookingGroup]:
+        """
+        Get booking group by token.
+
+        Args:
+            token: Booking group token
+
+        Returns:
+            BookingGroup with its member bookings if found, None otherwise
+        """
+        return await self.booking_group_repository.get_by_token(token)
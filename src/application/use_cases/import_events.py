@@ -0,0 +1,181 @@
+from dataclasses import dataclass, field
+from datetime import date, time
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from src.application.unit_of_work import UnitOfWork
+from src.application.use_cases.create_event import validate_slot_duration
+from src.domain.entities import Event, TimeSlot
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_MAX_ERRORS = 1000
+
+# Key a row parser sets when a line could not be turned into a row at all.
+ROW_ERROR = "__error__"
+
+
+@dataclass
+class ImportRowError:
+    """A rejected input row."""
+
+    line: int
+    message: str
+
+
+@dataclass
+class ImportResult:
+    """Outcome of a bulk import."""
+
+    rows_processed: int = 0
+    rows_rejected: int = 0
+    rows_skipped: int = 0
+    events_created: int = 0
+    events_skipped: int = 0
+    slots_created: int = 0
+    merged: bool = False
+    errors: List[ImportRowError] = field(default_factory=list)
+
+
+class ImportEventsUseCase:
+    """Use case for bulk importing events and time slots from a row stream."""
+
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_errors: int = DEFAULT_MAX_ERRORS,
+    ):
+        self.uow = uow
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+
+    async def execute(
+        self,
+        rows: AsyncIterator[Tuple[int, dict]],
+        strict: bool = False,
+    ) -> ImportResult:
+        """
+        Import events from a stream of rows.
+
+        Each row describes one time slot together with its event (event_name,
+        event_date, description, start_time, end_time, max_capacity). Rows sharing
+        event_name and event_date belong to the same event. An event that
+        already exists is left as it is and its rows are skipped, so importing
+        the same file again creates nothing.
+
+        Args:
+            rows: Async iterator of (line number, row dict)
+            strict: Merge nothing if any row is rejected
+
+        Returns:
+            ImportResult with counts and per-row errors
+        """
+        async with self.uow:
+            return await self._import(rows, strict)
+
+    async def _import(self, rows: AsyncIterator[Tuple[int, dict]], strict: bool) -> ImportResult:
+        result = ImportResult()
+        events: Dict[Tuple[str, date], Event] = {}
+        existing: Set[Tuple[str, date]] = set()
+        batch: List[Tuple[int, dict]] = []
+
+        async for line, row in rows:
+            batch.append((line, row))
+            if len(batch) >= self.batch_size:
+                await self._process_batch(batch, events, existing, result, strict)
+                batch = []
+        if batch:
+            await self._process_batch(batch, events, existing, result, strict)
+
+        if strict and result.rows_rejected:
+            return result
+
+        result.events_created, result.slots_created = await self.uow.event_imports.merge()
+        result.merged = True
+        return result
+
+    async def _process_batch(
+        self,
+        batch: List[Tuple[int, dict]],
+        events: Dict[Tuple[str, date], Event],
+        existing: Set[Tuple[str, date]],
+        result: ImportResult,
+        strict: bool,
+    ) -> None:
+        new_events: List[Event] = []
+        new_slots: List[TimeSlot] = []
+        valid_rows = []
+
+        for line, row in batch:
+            result.rows_processed += 1
+            try:
+                valid_rows.append(self._validate_row(row))
+            except (KeyError, TypeError, ValueError) as e:
+                self._reject(result, line, e)
+
+        # One lookup per batch for the events this file has not seen yet.
+        unseen = {(name, event_date) for name, event_date, *_ in valid_rows}
+        unseen -= events.keys() | existing
+        if unseen:
+            found = await self.uow.events.find_existing(list(unseen))
+            existing |= found
+            result.events_skipped += len(found)
+
+        for name, event_date, description, slot_times, capacity in valid_rows:
+            if (name, event_date) in existing:
+                result.rows_skipped += 1
+                continue
+            event = events.get((name, event_date))
+            if event is None:
+                event = Event(name=name, event_date=event_date, description=description)
+                events[(name, event_date)] = event
+                new_events.append(event)
+            new_slots.append(
+                TimeSlot(
+                    event_id=event.id,
+                    start_time=slot_times[0],
+                    end_time=slot_times[1],
+                    max_capacity=capacity,
+                )
+            )
+
+        # In strict mode a single rejected row voids the import, so stop loading.
+        if new_slots and not (strict and result.rows_rejected):
+            await self.uow.event_imports.stage(new_events, new_slots)
+
+    def _reject(self, result: ImportResult, line: int, error: Exception) -> None:
+        result.rows_rejected += 1
+        if len(result.errors) < self.max_errors:
+            message = f"Missing field {error}" if isinstance(error, KeyError) else str(error)
+            result.errors.append(ImportRowError(line=line, message=message))
+
+    @staticmethod
+    def _validate_row(row: dict) -> Tuple[str, date, Optional[str], Tuple[time, time], int]:
+        if ROW_ERROR in row:
+            raise ValueError(row[ROW_ERROR])
+        name = str(row["event_name"]).strip()
+        if not 1 <= len(name) <= 255:
+            raise ValueError("event_name must be between 1 and 255 characters")
+
+        event_date = _parse(date, row["event_date"], "event_date")
+        start_time = _parse(time, row["start_time"], "start_time")
+        end_time = _parse(time, row["end_time"], "end_time")
+        validate_slot_duration(start_time, end_time)
+
+        try:
+            capacity = int(row["max_capacity"])
+        except ValueError:
+            raise ValueError(f"Invalid max_capacity: {row['max_capacity']!r}")
+        if capacity <= 0:
+            raise ValueError("max_capacity must be greater than 0")
+
+        description = row.get("description") or None
+        return name, event_date, description, (start_time, end_time), capacity
+
+
+def _parse(kind: type, value: object, field_name: str):
+    if isinstance(value, kind):
+        return value
+    try:
+        return kind.fromisoformat(str(value).strip())
+    except ValueError:
+        raise ValueError(f"Invalid {field_name}: {value!r}")
@@ -0,0 +1,37 @@
+from datetime import date
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from src.domain.entities import EventAvailability
+from src.domain.repositories import AvailabilityRepository
+
+
+class ListAvailabilityUseCase:
+    """Use case for paging through per-event availability summaries by date."""
+
+    def __init__(self, availability_repository: AvailabilityRepository):
+        self.availability_repository = availability_repository
+
+    async def execute(
+        self,
+        after: Optional[Tuple[date, UUID]] = None,
+        limit: int = 100,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Tuple[List[EventAvailability], bool]:
+        """
+        Get one page of availability summaries in (event_date, event_id) order.
+
+        Args:
+            after: (event_date, event_id) of the last summary of the previous page
+            limit: Maximum number of summaries on the page
+            start_date: Optional first event date to include
+            end_date: Optional last event date to include
+
+        Returns:
+            The page of summaries, and whether more follow it
+        """
+        summaries = await self.availability_repository.get_page(
+            after, limit + 1, start_date, end_date
+        )
+        return summaries[:limit], len(summaries) > limit
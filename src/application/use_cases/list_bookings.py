@@ -0,0 +1,50 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from src.domain.entities import Booking
+from src.domain.repositories import BookingRepository
+
+
+class ListBookingsUseCase:
+    """Use case for paging through the bookings of a time slot or an event."""
+
+    def __init__(self, booking_repository: BookingRepository):
+        self.booking_repository = booking_repository
+
+    async def execute(
+        self,
+        time_slot_id: Optional[UUID] = None,
+        event_id: Optional[UUID] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 100,
+        name_prefix: Optional[str] = None,
+    ) -> Tuple[List[Booking], bool]:
+        """
+        Get one page of bookings in (created_at, id) order.
+
+        Args:
+            time_slot_id: Time slot whose bookings to list
+            event_id: Event whose bookings to list, if no time slot is given
+            after: (created_at, id) of the last booking of the previous page
+            limit: Maximum number of bookings on the page
+            name_prefix: Optional case-insensitive attendee name prefix
+
+        Returns:
+            The page of bookings, and whether more follow it
+
+        Raises:
+            ValueError: If not exactly one of time_slot_id or event_id is given
+        """
+        if (time_slot_id is None) == (event_id is None):
+            raise ValueError("Exactly one of time_slot_id or event_id is required")
+        # One row past the page tells whether there is a next one.
+        if time_slot_id is not None:
+            bookings = await self.booking_repository.get_page_by_time_slot_id(
+                time_slot_id, after, limit + 1, name_prefix
+            )
+        else:
+            bookings = await self.booking_repository.get_page_by_event_id(
+                event_id, after, limit + 1, name_prefix
+            )
+        return bookings[:limit], len(bookings) > limit
@@ -0,0 +1,65 @@
+from datetime import date
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from src.domain.entities import Event
+from src.domain.repositories import EventRepository
+
+# Page size used to read a whole listing.
+LIST_ALL_PAGE_SIZE = 500
+
+
+class ListEventsUseCase:
+    """Use case for paging through events by date."""
+
+    def __init__(self, event_repository: EventRepository):
+        self.event_repository = event_repository
+
+    async def execute(
+        self,
+        after: Optional[Tuple[date, UUID]] = None,
+        limit: int = 100,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Tuple[List[Event], bool]:
+        """
+        Get one page of events in (event_date, id) order.
+
+        Args:
+            after: (event_date, id) of the last event of the previous page
+            limit: Maximum number of events on the page
+            start_date: Optional first event date to include
+            end_date: Optional last event date to include
+
+        Returns:
+            The page of events, and whether more follow it
+        """
+        # One row past the page tells whether there is a next one.
+        events = await self.event_repository.get_page(after, limit + 1, start_date, end_date)
+        return events[:limit], len(events) > limit
+
+    async def execute_all(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[Event]:
+        """
+        Get every event in (event_date, id) order, reading it a page at a time.
+
+        Args:
+            start_date: Optional first event date to include
+            end_date: Optional last event date to include
+
+        Returns:
+            All matching events
+        """
+        events: List[Event] = []
+        after: Optional[Tuple[date, UUID]] = None
+        while True:
+            page = await self.event_repository.get_page(
+                after, LIST_ALL_PAGE_SIZE, start_date, end_date
+            )
+            events.extend(page)
+            if len(page) < LIST_ALL_PAGE_SIZE:
+                return events
+            after = (page[-1].event_date, page[-1].id)
@@ -1,24 +1,22 @@
 from uuid import UUID
 
-from src.domain.entities import Booking
-from src.domain.repositories import BookingRepository, TimeSlotRepository
+from src.application.unit_of_work import UnitOfWork
+from src.domain.entities import Booking, Change, Notification
 
 
 class UpdateBookingUseCase:
     """Use case for updating a booking (changing time slot)."""
 
-    def __init__(
-        self,
-        booking_repository: BookingRepository,
-        time_slot_repository: TimeSlotRepository,
-    ):
-        self.booking_repository = booking_repository
-        self.time_slot_repository = time_slot_repository
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
 
     async def execute(self, token: str, new_time_slot_id: UUID) -> Booking:
         """
         Update booking to a new time slot.
 
+        The seats move in one atomic step; the unit is retried if it loses a
+        deadlock or serialization conflict.
+
         Args:
             token: Booking token
             new_time_slot_id: New time slot ID
@@ -29,39 +27,48 @@ class UpdateBookingUseCase:
         Raises:
             ValueError: If booking not found or new slot is full
         """
-        session = getattr(self.booking_repository, "session", None)
-        if session:
-            if session.in_transaction():
-                return await self._update_booking(token, new_time_slot_id)
-            async with session.begin():
-                return await self._update_booking(token, new_time_slot_id)
-
-        return await self._update_booking(token, new_time_slot_id)
+        return await self.uow.run(lambda: self._update_booking(token, new_time_slot_id))
 
     async def _update_booking(self, token: str, new_time_slot_id: UUID) -> Booking:
-        booking = await self.booking_repository.get_by_token(token)
+        booking = await self.uow.bookings.get_by_token(token)
         if not booking:
             raise ValueError("Booking not found")
 
         if booking.time_slot_id == new_time_slot_id:
             return booking
 
-        new_slot = await self.time_slot_repository.get_by_id(new_time_slot_id)
+        previous_time_slot_id = booking.time_slot_id
+        new_slot = await self.uow.bookings.move(booking, new_time_slot_id)
         if not new_slot:
-            raise ValueError("New time slot not found")
-
-        if not new_slot.is_available(booking.number_of_seats):
-            raise ValueError("New time slot is full")
+            new_slot = await self.uow.time_slots.get_by_id(new_time_slot_id)
+            if not new_slot:
+                raise ValueError("New time slot not found")
+            if not new_slot.is_available(booking.number_of_seats):
+                raise ValueError("New time slot is full")
+            raise ValueError("Booking was changed concurrently")
+        booking.time_slot_id = new_time_slot_id
+        booking.event_id = new_slot.event_id
 
-        reserved = await self.time_slot_repository.reserve_spots(
-            new_time_slot_id,
-            booking.number_of_seats,
+        await self.uow.change_log.append(
+            Change(
+                Change.BOOKING_MOVED,
+                {
+                    "booking_id": str(booking.id),
+                    "event_id": str(new_slot.event_id),
+                    "from_time_slot_id": str(previous_time_slot_id),
+                    "to_time_slot_id": str(new_time_slot_id),
+                    "number_of_seats": booking.number_of_seats,
+                },
+            )
         )
-        if not reserved:
-            raise ValueError("New time slot is full")
-        await self.time_slot_repository.release_spots(
-            booking.time_slot_id,
-            booking.number_of_seats,
-        )
-        booking.time_slot_id = new_time_slot_id
-        return await self.booking_repository.update(booking)
+
+        if booking.email:
+            await self.uow.outbox.enqueue(
+                Notification.for_booking(
+                    Notification.BOOKING_UPDATED,
+                    booking,
+                    start_time=new_slot.start_time,
+                    end_time=new_slot.end_time,
+                )
+            )
+        return booking
@@ -1,5 +1,19 @@
+from .booking import Booking
+from .booking_group import BookingGroup
+from .change import Change
 from .event import Event
+from .event_availability import EventAvailability
+from .event_template import EventTemplate
+from .notification import Notification
 from .time_slot import TimeSlot
-from .booking import Booking
 
-__all__ = ["Event", "TimeSlot", "Booking"]
+__all__ = [
+    "Event",
+    "TimeSlot",
+    "Booking",
+    "BookingGroup",
+    "Notification",
+    "Change",
+    "EventTemplate",
+    "EventAvailability",
+]
@@ -1,7 +1,7 @@
+import secrets
 from datetime import datetime
 from typing import Optional
 from uuid import UUID, uuid4
-import secrets
 
 
 class Booking:
@@ -16,14 +16,19 @@ class Booking:
         booking_id: Optional[UUID] = None,
         created_at: Optional[datetime] = None,
         email: Optional[str] = None,
+        group_id: Optional[UUID] = None,
+        event_id: Optional[UUID] = None,
     ):
         self.id = booking_id or uuid4()
         self.attendee_name = attendee_name
         self.time_slot_id = time_slot_id
         self.number_of_seats = number_of_seats
-        self.booking_token = booking_token or self._generate_token()
+        # Returned once on creation; bookings loaded other than by token do not carry it.
+        self.booking_token: Optional[str] = booking_token or self._generate_token()
         self.created_at = created_at or datetime.utcnow()
         self.email = email  # Optional for notifications
+        self.group_id = group_id  # Set on the member bookings of a BookingGroup
+        self.event_id = event_id  # Event of the time slot, kept for per-event listings
 
     @staticmethod
     def _generate_token() -> str:
@@ -31,4 +36,7 @@ class Booking:
         return secrets.token_urlsafe(32)
 
     def __repr__(self) -> str:
-        return f"Booking(id={self.id}, name={self.attendee_name}, token={self.booking_token[:8]}...)"
+        return (
+            f"Booking(id={self.id}, name={self.attendee_name}, "
+            f"token={(self.booking_token or '')[:8]}...)"
+        )
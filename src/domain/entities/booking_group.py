@@ -0,0 +1,58 @@
+import secrets
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID, uuid4
+
+from .booking import Booking
+from .time_slot import TimeSlot
+
+
+class BookingGroup:
+    """
+    Domain entity representing one party booked into several time slots at once.
+
+    Each slot holds an ordinary member booking; the group's token is the only
+    one handed out and manages all of them together.
+    """
+
+    def __init__(
+        self,
+        attendee_name: str,
+        number_of_seats: int = 1,
+        bookings: Optional[List[Booking]] = None,
+        booking_token: Optional[str] = None,
+        group_id: Optional[UUID] = None,
+        created_at: Optional[datetime] = None,
+        email: Optional[str] = None,
+    ):
+        self.id = group_id or uuid4()
+        self.attendee_name = attendee_name
+        self.number_of_seats = number_of_seats
+        self.bookings = bookings or []
+        self.booking_token = booking_token or secrets.token_urlsafe(32)
+        self.created_at = created_at or datetime.utcnow()
+        self.email = email
+
+    def add_slot(self, time_slot: TimeSlot) -> Booking:
+        """Add a member booking for the party's seats in one time slot."""
+        booking = Booking(
+            attendee_name=self.attendee_name,
+            time_slot_id=time_slot.id,
+            number_of_seats=self.number_of_seats,
+            created_at=self.created_at,
+            email=self.email,
+            group_id=self.id,
+            event_id=time_slot.event_id,
+        )
+        self.bookings.append(booking)
+        return booking
+
+    @property
+    def time_slot_ids(self) -> List[UUID]:
+        return [booking.time_slot_id for booking in self.bookings]
+
+    def __repr__(self) -> str:
+        return (
+            f"BookingGroup(id={self.id}, name={self.attendee_name}, "
+            f"slots={len(self.bookings)}, token={self.booking_token[:8]}...)"
+        )
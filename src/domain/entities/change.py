@@ -0,0 +1,27 @@
+from datetime import datetime
+from typing import Optional
+
+
+class Change:
+    """Domain entity representing one entry of the booking and capacity change feed."""
+
+    BOOKING_CREATED = "booking.created"
+    BOOKING_MOVED = "booking.moved"
+    BOOKING_CANCELLED = "booking.cancelled"
+    SLOT_CAPACITY_CHANGED = "slot.capacity_changed"
+    EVENT_CANCELLED = "event.cancelled"
+
+    def __init__(
+        self,
+        kind: str,
+        payload: dict,
+        seq: Optional[int] = None,
+        occurred_at: Optional[datetime] = None,
+    ):
+        self.kind = kind
+        self.payload = payload
+        self.seq = seq  # Assigned once the change is committed and sequenced
+        self.occurred_at = occurred_at or datetime.utcnow()
+
+    def __repr__(self) -> str:
+        return f"Change(seq={self.seq}, kind={self.kind})"
@@ -12,11 +12,13 @@ class Event:
         event_date: date,
         description: Optional[str] = None,
         event_id: Optional[UUID] = None,
+        template_id: Optional[UUID] = None,
     ):
         self.id = event_id or uuid4()
         self.name = name
         self.event_date = event_date
         self.description = description
+        self.template_id = template_id  # Set on events generated from a template
         self.time_slots: List["TimeSlot"] = []
 
     def add_time_slot(self, time_slot: "TimeSlot") -> None:
@@ -0,0 +1,34 @@
+from datetime import date, datetime
+from typing import Optional
+from uuid import UUID
+
+
+class EventAvailability:
+    """
+    Read model summarising the seats of one event across its time slots.
+
+    Summaries are derived from the slots and refreshed shortly after they
+    change, so they may briefly lag the slots themselves.
+    """
+
+    def __init__(
+        self,
+        event_id: UUID,
+        event_name: str,
+        event_date: date,
+        slot_count: int = 0,
+        open_slots: int = 0,
+        total_capacity: int = 0,
+        booked_seats: int = 0,
+        available_seats: int = 0,
+        refreshed_at: Optional[datetime] = None,
+    ):
+        self.event_id = event_id
+        self.event_name = event_name
+        self.event_date = event_date
+        self.slot_count = slot_count
+        self.open_slots = open_slots
+        self.total_capacity = total_capacity
+        self.booked_seats = booked_seats
+        self.available_seats = available_seats
+        self.refreshed_at = refreshed_at or datetime.utcnow()
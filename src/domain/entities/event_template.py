@@ -0,0 +1,76 @@
+from datetime import date, datetime, time, timedelta
+from typing import Iterator, List, Optional
+from uuid import UUID, uuid4
+
+
+class EventTemplate:
+    """
+    Domain entity describing a recurring event.
+
+    Each occurrence is one event whose day between `window_start` and
+    `window_end` is divided into consecutive slots of `slot_capacity` seats.
+    Occurrences are generated ahead of time up to a rolling horizon;
+    `generated_until` is the last date already covered.
+    """
+
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    FREQUENCIES = (DAILY, WEEKLY)
+
+    def __init__(
+        self,
+        name: str,
+        start_date: date,
+        window_start: time,
+        window_end: time,
+        slot_capacity: int,
+        frequency: str = WEEKLY,
+        interval: int = 1,
+        weekdays: Optional[List[int]] = None,
+        end_date: Optional[date] = None,
+        exceptions: Optional[List[date]] = None,
+        description: Optional[str] = None,
+        generated_until: Optional[date] = None,
+        template_id: Optional[UUID] = None,
+        created_at: Optional[datetime] = None,
+    ):
+        self.id = template_id or uuid4()
+        self.name = name
+        self.description = description
+        self.frequency = frequency
+        self.interval = interval
+        # Monday is 0; weekly templates default to the weekday they start on
+        self.weekdays = sorted(set(weekdays)) if weekdays else [start_date.weekday()]
+        self.start_date = start_date
+        self.end_date = end_date
+        self.window_start = window_start
+        self.window_end = window_end
+        self.slot_capacity = slot_capacity
+        self.exceptions = sorted(set(exceptions or []))
+        self.generated_until = generated_until or start_date - timedelta(days=1)
+        self.created_at = created_at or datetime.utcnow()
+
+    def occurs_on(self, day: date) -> bool:
+        """Check whether the recurrence rule produces an event on `day`."""
+        if day < self.start_date or (self.end_date and day > self.end_date):
+            return False
+        if day in self.exceptions:
+            return False
+        if self.frequency == self.DAILY:
+            return (day - self.start_date).days % self.interval == 0
+        first_week = self.start_date - timedelta(days=self.start_date.weekday())
+        week = (day - first_week).days // 7
+        return day.weekday() in self.weekdays and week % self.interval == 0
+
+    def occurrences(self, until: date) -> Iterator[date]:
+        """Dates after `generated_until` up to and including `until` that get an event."""
+        if self.end_date and until > self.end_date:
+            until = self.end_date
+        day = max(self.generated_until + timedelta(days=1), self.start_date)
+        while day <= until:
+            if self.occurs_on(day):
+                yield day
+            day += timedelta(days=1)
+
+    def __repr__(self) -> str:
+        return f"EventTemplate(id={self.id}, name={self.name}, frequency={self.frequency})"
@@ -0,0 +1,58 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID, uuid4
+
+from .booking import Booking
+from .booking_group import BookingGroup
+
+
+class Notification:
+    """Domain entity representing a message queued for delivery to an attendee."""
+
+    BOOKING_CREATED = "booking_created"
+    BOOKING_UPDATED = "booking_updated"
+    BOOKING_CANCELLED = "booking_cancelled"
+    GROUP_BOOKING_CREATED = "group_booking_created"
+    GROUP_BOOKING_CANCELLED = "group_booking_cancelled"
+    EVENT_CANCELLED = "event_cancelled"
+
+    def __init__(
+        self,
+        kind: str,
+        recipient: str,
+        payload: dict,
+        notification_id: Optional[UUID] = None,
+        created_at: Optional[datetime] = None,
+    ):
+        self.id = notification_id or uuid4()
+        self.kind = kind
+        self.recipient = recipient
+        self.payload = payload
+        self.created_at = created_at or datetime.utcnow()
+
+    @classmethod
+    def for_booking(cls, kind: str, booking: Booking, **details: object) -> "Notification":
+        """Build a notification about a booking; the booking token is never included."""
+        payload = {
+            "booking_id": str(booking.id),
+            "attendee_name": booking.attendee_name,
+            "number_of_seats": booking.number_of_seats,
+            "time_slot_id": str(booking.time_slot_id),
+        }
+        payload.update({key: str(value) for key, value in details.items()})
+        return cls(kind=kind, recipient=booking.email, payload=payload)
+
+    @classmethod
+    def for_group(cls, kind: str, group: BookingGroup, **details: object) -> "Notification":
+        """Build one notification about a whole booking group; its token is never included."""
+        payload = {
+            "group_id": str(group.id),
+            "attendee_name": group.attendee_name,
+            "number_of_seats": group.number_of_seats,
+            "slot_count": len(group.bookings),
+        }
+        payload.update({key: str(value) for key, value in details.items()})
+        return cls(kind=kind, recipient=group.email, payload=payload)
+
+    def __repr__(self) -> str:
+        return f"Notification(id={self.id}, kind={self.kind}, recipient={self.recipient})"
@@ -1,5 +1,21 @@
+from .availability_repository import AvailabilityRepository
+from .booking_group_repository import BookingGroupRepository
+from .booking_repository import BookingRepository
+from .change_log_repository import ChangeLogRepository
+from .event_import_repository import EventImportRepository
 from .event_repository import EventRepository
+from .event_template_repository import EventTemplateRepository
+from .notification_outbox import NotificationOutbox
 from .time_slot_repository import TimeSlotRepository
-from .booking_repository import BookingRepository
 
-__all__ = ["EventRepository", "TimeSlotRepository", "BookingRepository"]
+__all__ = [
+    "EventRepository",
+    "TimeSlotRepository",
+    "BookingRepository",
+    "BookingGroupRepository",
+    "EventImportRepository",
+    "NotificationOutbox",
+    "ChangeLogRepository",
+    "EventTemplateRepository",
+    "AvailabilityRepository",
+]
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from src.domain.entities import EventAvailability
+
+
+class AvailabilityRepository(ABC):
+    """Abstract repository interface for the EventAvailability read model."""
+
+    @abstractmethod
+    async def get_page(
+        self,
+        after: Optional[Tuple[date, UUID]] = None,
+        limit: int = 100,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[EventAvailability]:
+        """Get up to `limit` summaries in (event_date, event_id) order, after the given position."""
+        pass
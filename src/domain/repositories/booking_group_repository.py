@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from src.domain.entities import BookingGroup
+
+
+class BookingGroupRepository(ABC):
+    """Abstract repository interface for BookingGroup entity."""
+
+    @abstractmethod
+    async def create(self, group: BookingGroup) -> BookingGroup:
+        """Create a group together with its member bookings."""
+        pass
+
+    @abstractmethod
+    async def get_by_token(self, token: str) -> Optional[BookingGroup]:
+        """Get group by token, with its member bookings in time slot order."""
+        pass
+
+    @abstractmethod
+    async def delete(self, group_id: UUID) -> bool:
+        """Delete a group and its member bookings; False if it was already gone."""
+        pass
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
 
-from src.domain.entities import Booking
+from src.domain.entities import Booking, TimeSlot
 
 
 class BookingRepository(ABC):
@@ -28,12 +29,66 @@ class BookingRepository(ABC):
         """Get all bookings for a time slot."""
         pass
 
+    @abstractmethod
+    async def get_page_by_time_slot_id(
+        self,
+        time_slot_id: UUID,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 100,
+        name_prefix: Optional[str] = None,
+    ) -> List[Booking]:
+        """
+        Get up to `limit` bookings of a time slot in (created_at, id) order.
+
+        `after` is the (created_at, id) of the last booking of the previous
+        page; `name_prefix` keeps attendees whose name starts with it, ignoring
+        case.
+        """
+        pass
+
+    @abstractmethod
+    async def get_page_by_event_id(
+        self,
+        event_id: UUID,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 100,
+        name_prefix: Optional[str] = None,
+    ) -> List[Booking]:
+        """Get up to `limit` bookings of an event, paged like `get_page_by_time_slot_id`."""
+        pass
+
     @abstractmethod
     async def update(self, booking: Booking) -> Booking:
         """Update a booking."""
         pass
 
+    @abstractmethod
+    async def move(self, booking: Booking, new_time_slot_id: UUID) -> Optional[TimeSlot]:
+        """
+        Move a booking's seats from its time slot to another one atomically.
+
+        Both slots are locked in id order, so concurrent moves cannot deadlock,
+        then seats are reserved on the new slot, released on the old one and the
+        booking is repointed. Returns the new slot as updated, or None if it does
+        not exist, lacks capacity, or the booking has left its slot meanwhile.
+        """
+        pass
+
     @abstractmethod
     async def delete(self, booking_id: UUID) -> bool:
         """Delete a booking."""
         pass
+
+    @abstractmethod
+    def delete_by_event(
+        self, event_id: UUID, chunk_size: int = 1000
+    ) -> AsyncIterator[List[Booking]]:
+        """
+        Delete every booking of an event, and their booking groups, as a set.
+
+        The event and its time slots are locked first, so no booking can be
+        made or moved into the event until the transaction ends. The deleted
+        bookings are yielded in chunks of up to `chunk_size`, without tokens;
+        nothing is yielded if the event does not exist.
+        """
+        pass
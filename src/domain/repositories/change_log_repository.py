@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from src.domain.entities import Change
+
+
+class ChangeLogRepository(ABC):
+    """Abstract repository interface for the append-only change feed."""
+
+    @abstractmethod
+    async def append(self, change: Change) -> None:
+        """Append a change in the caller's transaction."""
+        pass
+
+    @abstractmethod
+    async def get_after(self, after: int, limit: int) -> List[Change]:
+        """Get up to `limit` sequenced changes with a sequence number above `after`."""
+        pass
+
+    @abstractmethod
+    async def sequence_pending(self, limit: int = 10_000, wait: bool = True) -> int:
+        """
+        Give committed, unsequenced changes the next sequence numbers; returns how many.
+
+        With `wait=False` it returns 0 at once if another worker is sequencing.
+        """
+        pass
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+
+from src.domain.entities import Event, TimeSlot
+
+
+class EventImportRepository(ABC):
+    """Abstract repository interface for staged bulk loading of events."""
+
+    @abstractmethod
+    async def stage(self, events: List[Event], time_slots: List[TimeSlot]) -> None:
+        """Stage new events and time slots without making them visible."""
+        pass
+
+    @abstractmethod
+    async def merge(self) -> Tuple[int, int]:
+        """Merge everything staged so far, returning (events, time slots) created."""
+        pass
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 from uuid import UUID
 
 from src.domain.entities import Event
@@ -29,6 +29,22 @@ class EventRepository(ABC):
         """Get events within date range."""
         pass
 
+    @abstractmethod
+    async def get_page(
+        self,
+        after: Optional[Tuple[date, UUID]] = None,
+        limit: int = 100,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[Event]:
+        """Get up to `limit` events in (event_date, id) order, after the given position."""
+        pass
+
+    @abstractmethod
+    async def find_existing(self, keys: List[Tuple[str, date]]) -> Set[Tuple[str, date]]:
+        """Get those of the given (name, event_date) pairs that already have an event."""
+        pass
+
     @abstractmethod
     async def update(self, event: Event) -> Event:
         """Update an event."""
@@ -36,5 +52,5 @@ class EventRepository(ABC):
 
     @abstractmethod
     async def delete(self, event_id: UUID) -> bool:
-        """Delete an event."""
+        """Delete an event together with its time slots and any bookings left in them."""
         pass
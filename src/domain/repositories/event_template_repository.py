@@ -0,0 +1,59 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional
+from uuid import UUID
+
+from src.domain.entities import EventTemplate
+
+
+class EventTemplateRepository(ABC):
+    """Abstract repository interface for EventTemplate entity."""
+
+    @abstractmethod
+    async def create(self, template: EventTemplate) -> EventTemplate:
+        """Create a new template."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, template_id: UUID) -> Optional[EventTemplate]:
+        """Get template by ID."""
+        pass
+
+    @abstractmethod
+    async def get_for_update(self, template_id: UUID) -> Optional[EventTemplate]:
+        """Get template by ID and lock it until the transaction ends."""
+        pass
+
+    @abstractmethod
+    async def get_all(self) -> List[EventTemplate]:
+        """Get all templates."""
+        pass
+
+    @abstractmethod
+    async def claim_due(self, until: date, limit: int) -> List[EventTemplate]:
+        """
+        Lock up to `limit` templates not yet generated up to `until`.
+
+        Templates locked by another transaction are skipped, so concurrent
+        generators never work on the same template.
+        """
+        pass
+
+    @abstractmethod
+    async def update(self, template: EventTemplate) -> EventTemplate:
+        """Persist exceptions and generation progress of a template."""
+        pass
+
+    @abstractmethod
+    async def delete(self, template_id: UUID) -> bool:
+        """Delete a template; events generated from it are kept."""
+        pass
+
+    @abstractmethod
+    async def remove_unbooked_event(self, template_id: UUID, event_date: date) -> bool:
+        """
+        Delete the event generated for `event_date` unless one of its slots is booked.
+
+        Returns False only if a booked event had to be kept.
+        """
+        pass
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+from src.domain.entities import Notification
+
+
+class NotificationOutbox(ABC):
+    """Abstract transactional outbox for attendee notifications."""
+
+    @abstractmethod
+    async def enqueue(self, notification: Notification) -> None:
+        """Queue a notification in the caller's transaction."""
+        pass
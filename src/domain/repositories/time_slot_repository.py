@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from src.domain.entities import TimeSlot
@@ -33,6 +33,31 @@ class TimeSlotRepository(ABC):
         """Reserve spots in a time slot if capacity allows."""
         pass
 
+    @abstractmethod
+    async def reserve_spots_together(self, slot_ids: List[UUID], seats: int) -> List[TimeSlot]:
+        """
+        Reserve seats in every one of the given distinct slots, or in none of them.
+
+        The slots are locked in id order, so concurrent group reservations
+        cannot deadlock. Returns the slots as updated, or an empty list if any
+        of them does not exist or lacks capacity.
+        """
+        pass
+
+    @abstractmethod
+    async def set_capacities(
+        self, capacities: Dict[UUID, int]
+    ) -> Tuple[List[TimeSlot], List[TimeSlot]]:
+        """
+        Set the max capacity of many slots at once, never below their bookings.
+
+        The slots are locked in id order. Returns the slots that were changed
+        and, as they stand, the ones that were left alone because the new
+        capacity is below their current bookings or equal to the old one.
+        Slots that do not exist are in neither list.
+        """
+        pass
+
     @abstractmethod
     async def release_spots(self, slot_id: UUID, seats: int) -> None:
         """Release spots from a time slot."""
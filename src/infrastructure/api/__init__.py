@@ -1,13 +1,18 @@
+from .admin import admin_router
+from .dependencies import require_admin
+from .routes import router
 from .schemas import (
+    BookingCreate,
+    BookingResponse,
+    BookingUpdate,
+    ChangeFeedResponse,
+    ChangeResponse,
     EventCreate,
     EventResponse,
+    ImportResultResponse,
     TimeSlotCreate,
     TimeSlotResponse,
-    BookingCreate,
-    BookingResponse,
-    BookingUpdate,
 )
-from .routes import router
 
 __all__ = [
     "EventCreate",
@@ -17,5 +22,10 @@ __all__ = [
     "BookingCreate",
     "BookingResponse",
     "BookingUpdate",
+    "ImportResultResponse",
+    "ChangeResponse",
+    "ChangeFeedResponse",
     "router",
+    "admin_router",
+    "require_admin",
 ]
@@ -0,0 +1,306 @@
+import json
+from datetime import date, datetime
+from typing import Iterator, List, Literal, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+
+from src.application.unit_of_work import UnitOfWork
+from src.application.use_cases.add_template_exceptions import AddTemplateExceptionsUseCase
+from src.application.use_cases.adjust_slot_capacities import AdjustSlotCapacitiesUseCase
+from src.application.use_cases.cancel_event import CancelEventUseCase
+from src.application.use_cases.create_event_template import CreateEventTemplateUseCase
+from src.application.use_cases.generate_template_events import GenerateTemplateEventsUseCase
+from src.application.use_cases.import_events import ImportEventsUseCase
+from src.application.use_cases.list_bookings import ListBookingsUseCase
+from src.domain.entities import Booking
+from src.infrastructure.backend import uses_database
+from src.infrastructure.database.exports import stream_attendee_manifest
+from src.infrastructure.importing import SUPPORTED_FORMATS, iter_rows
+from src.infrastructure.jobs.templates import TEMPLATE_HORIZON_DAYS
+from src.infrastructure.metrics import metrics
+
+from .cursors import decode_cursor, encode_cursor
+from .dependencies import get_uow, require_admin
+from .profiling import profile_store
+from .schemas import (
+    BookingPageResponse,
+    BookingSummaryResponse,
+    EventTemplateCreate,
+    EventTemplateResponse,
+    ImportResultResponse,
+    SlotCapacitiesResponse,
+    SlotCapacitiesUpdate,
+    TemplateExceptionsCreate,
+    TemplateExceptionsResponse,
+)
+
+CONTENT_TYPE_FORMATS = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+# Booking lines written per chunk of a cancellation's response.
+CANCELLATION_LINES_PER_CHUNK = 1000
+
+
+admin_router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+@admin_router.get("/metrics")
+async def get_metrics():
+    """In-process counters, gauges and timings of this worker."""
+    return metrics.snapshot()
+
+
+@admin_router.get("/profiles")
+async def list_profiles():
+    """Summaries of this worker's most recent request profiles, newest first."""
+    return [profile.summary() for profile in profile_store.recent()]
+
+
+@admin_router.get("/profiles/{profile_id}")
+async def download_profile(
+    profile_id: str, fmt: Literal["pstats", "text"] = Query(default="pstats", alias="format")
+):
+    """Download a request profile as a pstats file, or as a text report."""
+    profile = profile_store.get(profile_id)
+    if not profile:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    if fmt == "text":
+        return PlainTextResponse(profile.as_text())
+    return Response(
+        content=profile.dump(),
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": f'attachment; filename="profile-{profile_id}.prof"'},
+    )
+
+
+@admin_router.post("/events/import", response_model=ImportResultResponse)
+async def import_events(
+    request: Request,
+    fmt: Optional[str] = Query(default=None, alias="format"),
+    strict: bool = False,
+    uow: UnitOfWork = Depends(get_uow),
+):
+    """Bulk import events and time slots from a streamed CSV or NDJSON body."""
+    if fmt is None:
+        content_type = request.headers.get("content-type", "").split(";")[0].strip()
+        fmt = CONTENT_TYPE_FORMATS.get(content_type)
+    if fmt not in SUPPORTED_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported import format, expected one of: {', '.join(SUPPORTED_FORMATS)}",
+        )
+
+    use_case = ImportEventsUseCase(uow)
+    try:
+        return await use_case.execute(iter_rows(fmt, request.stream()), strict=strict)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+def _require_database_manifests() -> None:
+    # Manifests are streamed by the database itself; the memory backend has none.
+    if not uses_database():
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Attendee manifests require a database backend",
+        )
+
+
+def _manifest_response(filename: str, **target: UUID) -> StreamingResponse:
+    return StreamingResponse(
+        stream_attendee_manifest(**target),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+def _cancellation_lines(event_id: UUID, bookings: List[Booking]) -> Iterator[bytes]:
+    for start in range(0, len(bookings), CANCELLATION_LINES_PER_CHUNK):
+        yield b"".join(
+            _booking_summary(booking).model_dump_json().encode() + b"\n"
+            for booking in bookings[start : start + CANCELLATION_LINES_PER_CHUNK]
+        )
+    yield json.dumps(
+        {"event_id": str(event_id), "bookings_cancelled": len(bookings)}
+    ).encode() + b"\n"
+
+
+@admin_router.delete("/events/{event_id}")
+async def cancel_event(event_id: UUID, uow: UnitOfWork = Depends(get_uow)):
+    """
+    Cancel an event with all of its slots and bookings, streaming the bookings as NDJSON.
+
+    The cancellation commits before the response starts, so a client that
+    goes away mid-stream cannot undo it. One line per cancelled booking,
+    without tokens, then a last line counting them; every attendee with an
+    email is notified through the outbox.
+    """
+    try:
+        bookings = await CancelEventUseCase(uow).execute(event_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    metrics.increment("events.cancelled")
+    metrics.increment("events.bookings_cancelled", len(bookings))
+    return StreamingResponse(
+        _cancellation_lines(event_id, bookings), media_type="application/x-ndjson"
+    )
+
+
+@admin_router.get("/events/{event_id}/manifest")
+async def export_event_manifest(event_id: UUID, uow: UnitOfWork = Depends(get_uow)):
+    """Stream the attendee manifest of an event as CSV."""
+    _require_database_manifests()
+    if not await uow.events.get_by_id(event_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+    return _manifest_response(f"manifest-{event_id}.csv", event_id=event_id)
+
+
+@admin_router.get("/slots/{slot_id}/manifest")
+async def export_slot_manifest(slot_id: UUID, uow: UnitOfWork = Depends(get_uow)):
+    """Stream the attendee manifest of a single time slot as CSV."""
+    _require_database_manifests()
+    if not await uow.time_slots.get_by_id(slot_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Time slot not found")
+    return _manifest_response(f"manifest-{slot_id}.csv", time_slot_id=slot_id)
+
+
+@admin_router.patch("/slots/capacity", response_model=SlotCapacitiesResponse)
+async def adjust_slot_capacities(update: SlotCapacitiesUpdate, uow: UnitOfWork = Depends(get_uow)):
+    """Change the capacity of many slots at once; none is set below its bookings."""
+    capacities = {slot.time_slot_id: slot.max_capacity for slot in update.slots}
+    if len(capacities) != len(update.slots):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Time slots must be distinct"
+        )
+    try:
+        results = await AdjustSlotCapacitiesUseCase(uow).execute(capacities)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return SlotCapacitiesResponse(results=results)
+
+
+def _booking_summary(booking: Booking) -> BookingSummaryResponse:
+    return BookingSummaryResponse(
+        id=booking.id,
+        attendee_name=booking.attendee_name,
+        time_slot_id=booking.time_slot_id,
+        number_of_seats=booking.number_of_seats,
+        email=booking.email,
+        created_at=booking.created_at,
+        group_id=booking.group_id,
+    )
+
+
+async def _booking_page(
+    use_case: ListBookingsUseCase, cursor: Optional[str], **query
+) -> BookingPageResponse:
+    after = decode_cursor(cursor, datetime.fromisoformat) if cursor else None
+    bookings, has_more = await use_case.execute(after=after, **query)
+    last = bookings[-1] if bookings and has_more else None
+    return BookingPageResponse(
+        bookings=[_booking_summary(booking) for booking in bookings],
+        next_cursor=encode_cursor(last.created_at, last.id) if last else None,
+    )
+
+
+@admin_router.get("/events/{event_id}/bookings", response_model=BookingPageResponse)
+async def list_event_bookings(
+    event_id: UUID,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=100, ge=1, le=1000),
+    name_prefix: Optional[str] = Query(default=None, min_length=1, max_length=255),
+    uow: UnitOfWork = Depends(get_uow),
+):
+    """Page through an event's bookings, oldest first; pass `next_cursor` back for more."""
+    # Only the first page checks the event; later pages are a single range scan.
+    if cursor is None and not await uow.events.get_by_id(event_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+    return await _booking_page(
+        ListBookingsUseCase(uow.bookings),
+        cursor,
+        event_id=event_id,
+        limit=limit,
+        name_prefix=name_prefix,
+    )
+
+
+@admin_router.get("/slots/{slot_id}/bookings", response_model=BookingPageResponse)
+async def list_slot_bookings(
+    slot_id: UUID,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=100, ge=1, le=1000),
+    name_prefix: Optional[str] = Query(default=None, min_length=1, max_length=255),
+    uow: UnitOfWork = Depends(get_uow),
+):
+    """Page through a time slot's bookings, oldest first; pass `next_cursor` back for more."""
+    if cursor is None and not await uow.time_slots.get_by_id(slot_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Time slot not found")
+    return await _booking_page(
+        ListBookingsUseCase(uow.bookings),
+        cursor,
+        time_slot_id=slot_id,
+        limit=limit,
+        name_prefix=name_prefix,
+    )
+
+
+@admin_router.post(
+    "/templates", response_model=EventTemplateResponse, status_code=status.HTTP_201_CREATED
+)
+async def create_template(template_data: EventTemplateCreate, uow: UnitOfWork = Depends(get_uow)):
+    """Create a recurring event template and generate its events up to the horizon."""
+    try:
+        async with uow:
+            template = await CreateEventTemplateUseCase(uow).execute(**template_data.model_dump())
+            # Later dates are generated by the background job as the horizon moves.
+            await GenerateTemplateEventsUseCase(uow, horizon_days=TEMPLATE_HORIZON_DAYS).execute(
+                date.today(), templates=[template]
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return template
+
+
+@admin_router.get("/templates", response_model=List[EventTemplateResponse])
+async def list_templates(uow: UnitOfWork = Depends(get_uow)):
+    """List recurring event templates."""
+    return await uow.templates.get_all()
+
+
+@admin_router.get("/templates/{template_id}", response_model=EventTemplateResponse)
+async def get_template(template_id: UUID, uow: UnitOfWork = Depends(get_uow)):
+    """Get a recurring event template."""
+    template = await uow.templates.get_by_id(template_id)
+    if not template:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Template not found")
+    return template
+
+
+@admin_router.post("/templates/{template_id}/exceptions", response_model=TemplateExceptionsResponse)
+async def add_template_exceptions(
+    template_id: UUID,
+    exceptions: TemplateExceptionsCreate,
+    uow: UnitOfWork = Depends(get_uow),
+):
+    """Skip dates of a template, removing their events unless they are booked."""
+    use_case = AddTemplateExceptionsUseCase(uow)
+    try:
+        template, kept = await use_case.execute(template_id, exceptions.dates)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    return TemplateExceptionsResponse(template=template, kept_booked=kept)
+
+
+@admin_router.delete("/templates/{template_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_template(template_id: UUID, uow: UnitOfWork = Depends(get_uow)):
+    """Stop generating events for a template; already generated events are kept."""
+    async with uow:
+        deleted = await uow.templates.delete(template_id)
+    if not deleted:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Template not found")
@@ -0,0 +1,24 @@
+import base64
+from datetime import date, datetime
+from typing import Callable, Tuple, TypeVar
+from uuid import UUID
+
+from fastapi import HTTPException, status
+
+P = TypeVar("P", date, datetime)
+
+
+def encode_cursor(position: P, item_id: UUID) -> str:
+    """Opaque cursor for the keyset position of the last item on a page."""
+    raw = f"{position.isoformat()}|{item_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, parse: Callable[[str], P]) -> Tuple[P, UUID]:
+    """Keyset position of a cursor from `encode_cursor`; 400 if it is malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        position, item_id = raw.split("|")
+        return parse(position), UUID(item_id)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
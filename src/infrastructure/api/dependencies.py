@@ -0,0 +1,27 @@
+import os
+import secrets
+from typing import AsyncIterator, Optional
+
+from fastapi import Header, HTTPException, status
+
+from src.application.unit_of_work import UnitOfWork
+from src.infrastructure.backend import open_uow
+from src.infrastructure.metrics import metrics
+
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
+
+async def require_admin(x_admin_token: Optional[str] = Header(default=None)) -> None:
+    """Dependency guarding admin endpoints with the ADMIN_TOKEN shared secret."""
+    if not ADMIN_TOKEN or not x_admin_token:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+    if not secrets.compare_digest(x_admin_token.encode(), ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+
+
+async def get_uow() -> AsyncIterator[UnitOfWork]:
+    """Dependency providing the unit of work of a request on the configured backend."""
+    async with open_uow() as uow:
+        yield uow
+    if uow.retries:
+        metrics.increment("uow.retries", uow.retries)
@@ -0,0 +1,207 @@
+import cProfile
+import io
+import marshal
+import os
+import pstats
+import random
+import secrets
+import time
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Deque, Dict, List, Optional
+from uuid import uuid4
+
+from sqlalchemy import event
+
+from src.infrastructure.database.database import engine
+from src.infrastructure.metrics import metrics
+
+from .dependencies import ADMIN_TOKEN
+
+# Share of requests profiled without being asked; 0 profiles only on request.
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+# Profiles kept per worker; the oldest is dropped first.
+PROFILE_BUFFER_SIZE = int(os.getenv("PROFILE_BUFFER_SIZE", "20"))
+
+# Sent with a valid X-Admin-Token to have that request profiled.
+PROFILE_HEADER = b"x-profile"
+ADMIN_TOKEN_HEADER = b"x-admin-token"
+PROFILE_ID_HEADER = b"x-profile-id"
+
+# Distinct statements timed individually per profile; the rest only count in the totals.
+MAX_PROFILED_STATEMENTS = 50
+# Statements are cut to this length in text reports; IN lists can run on for pages.
+STATEMENT_REPORT_CHARS = 300
+
+current_profile: ContextVar[Optional["RequestProfile"]] = ContextVar(
+    "current_profile", default=None
+)
+
+
+class RequestProfile:
+    """cProfile statistics of one request, with the time spent in SQL set apart."""
+
+    def __init__(self, method: str, path: str):
+        self.id = uuid4().hex
+        self.method = method
+        self.path = path
+        self.started_at = datetime.utcnow()
+        self.status: Optional[int] = None
+        self.duration = 0.0
+        self.sql_seconds = 0.0
+        self.sql_statements = 0
+        # Statement text -> [executions, seconds]
+        self.statements: Dict[str, List] = {}
+        self.stats: Optional[pstats.Stats] = None
+
+    def record_sql(self, statement: str, seconds: float) -> None:
+        self.sql_statements += 1
+        self.sql_seconds += seconds
+        timing = self.statements.get(statement)
+        if timing is None:
+            if len(self.statements) >= MAX_PROFILED_STATEMENTS:
+                return
+            timing = self.statements[statement] = [0, 0.0]
+        timing[0] += 1
+        timing[1] += seconds
+
+    def summary(self) -> dict:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "status": self.status,
+            "started_at": self.started_at.isoformat(),
+            "duration_seconds": round(self.duration, 6),
+            "sql_seconds": round(self.sql_seconds, 6),
+            "sql_statements": self.sql_statements,
+        }
+
+    def dump(self) -> bytes:
+        """The statistics in the file format of `pstats.Stats.dump_stats`."""
+        return marshal.dumps(self.stats.stats)
+
+    def as_text(self, limit: int = 40) -> str:
+        """A readable report: totals, slowest statements, then the hottest functions."""
+        out = io.StringIO()
+        out.write(f"{self.method} {self.path} -> {self.status}\n")
+        out.write(
+            f"total {self.duration * 1000:.1f} ms, "
+            f"sql {self.sql_seconds * 1000:.1f} ms in {self.sql_statements} statements, "
+            f"other {(self.duration - self.sql_seconds) * 1000:.1f} ms\n\n"
+        )
+        for statement, (count, seconds) in sorted(
+            self.statements.items(), key=lambda item: item[1][1], reverse=True
+        ):
+            text = " ".join(statement.split())[:STATEMENT_REPORT_CHARS]
+            out.write(f"{seconds * 1000:9.2f} ms {count:5}x  {text}\n")
+        out.write("\n")
+        self.stats.stream = out
+        self.stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+        return out.getvalue()
+
+
+class ProfileStore:
+    """Ring buffer of the most recent request profiles of this worker."""
+
+    def __init__(self, size: int):
+        self._profiles: Deque[RequestProfile] = deque(maxlen=size)
+
+    def add(self, profile: RequestProfile) -> None:
+        self._profiles.append(profile)
+
+    def get(self, profile_id: str) -> Optional[RequestProfile]:
+        return next((profile for profile in self._profiles if profile.id == profile_id), None)
+
+    def recent(self) -> List[RequestProfile]:
+        return list(reversed(self._profiles))
+
+
+profile_store = ProfileStore(PROFILE_BUFFER_SIZE)
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _start_statement(connection, cursor, statement, parameters, context, executemany) -> None:
+    if current_profile.get() is not None:
+        context._profile_started = time.perf_counter()
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _finish_statement(connection, cursor, statement, parameters, context, executemany) -> None:
+    profile = current_profile.get()
+    started = getattr(context, "_profile_started", None)
+    if profile is not None and started is not None:
+        profile.record_sql(statement, time.perf_counter() - started)
+
+
+class ProfilingMiddleware:
+    """
+    Runs a request under cProfile when an admin asks for it or it is sampled.
+
+    Admins opt in per request with `X-Profile: 1` alongside their
+    `X-Admin-Token`; `PROFILE_SAMPLE_RATE` picks a share of all requests.
+    cProfile sees the whole thread, so other requests the event loop serves
+    meanwhile show up in the profile too, and only one request is profiled
+    at a time. SQL time is measured per statement for the profiled request
+    alone, including loads it started that other requests share. The
+    response carries `X-Profile-Id`.
+    """
+
+    def __init__(
+        self,
+        app,
+        store: ProfileStore = profile_store,
+        sample_rate: Optional[float] = None,
+    ):
+        self.app = app
+        self.store = store
+        self.sample_rate = PROFILE_SAMPLE_RATE if sample_rate is None else sample_rate
+        self._active = False
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or self._active or not self._wanted(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(scope["method"], scope["path"])
+
+        async def send_with_id(message) -> None:
+            if message["type"] == "http.response.start":
+                profile.status = message["status"]
+                headers = list(message.get("headers", ()))
+                headers.append((PROFILE_ID_HEADER, profile.id.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        self._active = True
+        token = current_profile.set(profile)
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            profiler.disable()
+            profile.duration = time.perf_counter() - started
+            current_profile.reset(token)
+            self._active = False
+            # The response has gone out; building the statistics costs the client nothing.
+            profile.stats = pstats.Stats(profiler)
+            self.store.add(profile)
+            metrics.increment("profiling.profiles")
+
+    def _wanted(self, scope) -> bool:
+        if self.sample_rate and random.random() < self.sample_rate:
+            return True
+        if not ADMIN_TOKEN:
+            return False
+        requested, token = False, None
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                requested = value == b"1"
+            elif name == ADMIN_TOKEN_HEADER:
+                token = value
+        return (
+            requested and token is not None and secrets.compare_digest(token, ADMIN_TOKEN.encode())
+        )
@@ -0,0 +1,180 @@
+import asyncio
+import math
+import os
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Tuple
+
+from fastapi import HTTPException, Request, status
+
+from src.infrastructure.database.database import DB_MAX_OVERFLOW, DB_POOL_SIZE
+from src.infrastructure.metrics import metrics
+
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+RATE_LIMIT_READ_PER_SECOND = float(os.getenv("RATE_LIMIT_READ_PER_SECOND", "50"))
+RATE_LIMIT_READ_BURST = float(os.getenv("RATE_LIMIT_READ_BURST", "100"))
+RATE_LIMIT_WRITE_PER_SECOND = float(os.getenv("RATE_LIMIT_WRITE_PER_SECOND", "5"))
+RATE_LIMIT_WRITE_BURST = float(os.getenv("RATE_LIMIT_WRITE_BURST", "20"))
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+# Proxies in front of the app that each append the address they saw to
+# X-Forwarded-For; 0 ignores the header.
+RATE_LIMIT_TRUSTED_PROXIES = int(os.getenv("RATE_LIMIT_TRUSTED_PROXIES", "0"))
+
+# Writes beyond what the connection pool can serve wait at most this long.
+WRITE_CONCURRENCY_LIMIT = int(
+    os.getenv("WRITE_CONCURRENCY_LIMIT", str(DB_POOL_SIZE + DB_MAX_OVERFLOW))
+)
+WRITE_QUEUE_TIMEOUT = float(os.getenv("WRITE_QUEUE_TIMEOUT", "0.5"))
+WRITE_QUEUE_MAX = int(os.getenv("WRITE_QUEUE_MAX", str(WRITE_CONCURRENCY_LIMIT * 2)))
+
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at `rate` tokens per second."""
+
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, burst: float, now: float):
+        self.tokens = burst
+        self.updated = now
+
+    def take(self, rate: float, burst: float, now: float) -> float:
+        """Take one token; returns 0 on success, else seconds until one is available."""
+        self.tokens = min(burst, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / rate
+
+
+class RateLimiter:
+    """
+    Token buckets per key with bounded memory.
+
+    Buckets live in an LRU ordered dict; once `max_keys` is reached the least
+    recently seen key is evicted. An evicted client simply starts over with a
+    full bucket, which errs on the side of letting traffic through.
+    """
+
+    def __init__(self, rate: float, burst: float, max_keys: int = RATE_LIMIT_MAX_KEYS):
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[Tuple[str, str], TokenBucket]" = OrderedDict()
+
+    def check(self, key: Tuple[str, str]) -> float:
+        """Returns 0 if the request may proceed, else the suggested retry delay."""
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(self.burst, now)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+                metrics.increment("rate_limit.evicted")
+        else:
+            self._buckets.move_to_end(key)
+        return bucket.take(self.rate, self.burst, now)
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class ConcurrencyLimiter:
+    """
+    Caps concurrent requests at what the database pool can serve.
+
+    Requests over the cap queue for up to `queue_timeout` seconds; when the
+    queue is full or the wait times out they are shed instead of piling up as
+    sessions waiting on the pool.
+    """
+
+    def __init__(self, limit: int, queue_timeout: float, max_waiting: int):
+        self.limit = limit
+        self.queue_timeout = queue_timeout
+        self.max_waiting = max_waiting
+        self.in_flight = 0
+        self.waiting = 0
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def acquire(self) -> bool:
+        if self._semaphore.locked():
+            if self.waiting >= self.max_waiting:
+                return False
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+            except asyncio.TimeoutError:
+                return False
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+        self.in_flight += 1
+        return True
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._semaphore.release()
+
+
+read_limiter = RateLimiter(RATE_LIMIT_READ_PER_SECOND, RATE_LIMIT_READ_BURST)
+write_limiter = RateLimiter(RATE_LIMIT_WRITE_PER_SECOND, RATE_LIMIT_WRITE_BURST)
+write_concurrency = ConcurrencyLimiter(
+    WRITE_CONCURRENCY_LIMIT, WRITE_QUEUE_TIMEOUT, WRITE_QUEUE_MAX
+)
+
+
+def client_ip(request: Request, trusted_proxies: int = RATE_LIMIT_TRUSTED_PROXIES) -> str:
+    """
+    The address the rate limits are keyed on.
+
+    Behind `trusted_proxies` proxies it is the X-Forwarded-For entry appended
+    by the outermost of them, counted from the right; the entries left of it
+    are written by the client and could be rotated to get a fresh bucket.
+    """
+    if trusted_proxies > 0:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            entries = forwarded.split(",")
+            if len(entries) >= trusted_proxies:
+                return entries[-trusted_proxies].strip()
+    return request.client.host if request.client else "unknown"
+
+
+async def rate_limit(request: Request) -> None:
+    """Dependency applying a token bucket per client IP and route."""
+    if not RATE_LIMIT_ENABLED:
+        return
+    route = request.scope.get("route")
+    route_key = f"{request.method} {getattr(route, 'path', request.url.path)}"
+    limiter = write_limiter if request.method in WRITE_METHODS else read_limiter
+
+    retry_after = limiter.check((client_ip(request), route_key))
+    metrics.set_gauge("rate_limit.tracked_keys", len(read_limiter) + len(write_limiter))
+    if retry_after:
+        metrics.increment("rate_limit.rejected")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+
+async def limit_write_concurrency() -> AsyncIterator[None]:
+    """Dependency holding a write slot for the duration of the request."""
+    if not await write_concurrency.acquire():
+        metrics.increment("load_shed.rejected")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy, please retry",
+            headers={"Retry-After": "1"},
+        )
+    metrics.set_gauge("write_concurrency.in_flight", write_concurrency.in_flight)
+    metrics.set_gauge("write_concurrency.waiting", write_concurrency.waiting)
+    try:
+        yield
+    finally:
+        write_concurrency.release()
+        metrics.set_gauge("write_concurrency.in_flight", write_concurrency.in_flight)
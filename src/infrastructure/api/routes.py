@@ -1,40 +1,101 @@
-from typing import List
+from datetime import date
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 
+from src.application.unit_of_work import UnitOfWork
 from src.application.use_cases.cancel_booking import CancelBookingUseCase
+from src.application.use_cases.cancel_booking_group import CancelBookingGroupUseCase
 from src.application.use_cases.create_booking import CreateBookingUseCase
+from src.application.use_cases.create_booking_group import CreateBookingGroupUseCase
 from src.application.use_cases.create_event import CreateEventUseCase
 from src.application.use_cases.get_available_slots import GetAvailableSlotsUseCase
 from src.application.use_cases.get_booking import GetBookingUseCase
+from src.application.use_cases.get_booking_group import GetBookingGroupUseCase
+from src.application.use_cases.list_availability import ListAvailabilityUseCase
+from src.application.use_cases.list_events import ListEventsUseCase
 from src.application.use_cases.update_booking import UpdateBookingUseCase
-from src.infrastructure.database import get_db
-from src.infrastructure.database.repositories import (
-    SQLAlchemyEventRepository,
-    SQLAlchemyTimeSlotRepository,
-    SQLAlchemyBookingRepository,
-)
+from src.domain.entities import BookingGroup, Event, TimeSlot
+from src.infrastructure.backend import open_uow
+from src.infrastructure.cache import SingleFlight, catalog_cache
+
+from .cursors import decode_cursor, encode_cursor
+from .dependencies import get_uow, require_admin
+from .rate_limit import limit_write_concurrency, rate_limit
 from .schemas import (
-    EventCreate,
-    EventResponse,
     BookingCreate,
+    BookingGroupCreate,
+    BookingGroupResponse,
     BookingResponse,
     BookingUpdate,
+    ChangeFeedResponse,
+    ChangeResponse,
+    EventAvailabilityResponse,
+    EventCreate,
+    EventResponse,
     TimeSlotResponse,
 )
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(rate_limit)])
+write_guard = [Depends(limit_write_concurrency)]
+
+# Concurrent reads of the same event or slot list share one query and one
+# serialized body; each load opens its own unit of work so it outlives any caller.
+event_reads: SingleFlight[Optional[bytes]] = SingleFlight("event_reads")
+_slot_list = TypeAdapter(List[TimeSlotResponse])
+_event_list = TypeAdapter(List[EventResponse])
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+# Page size of GET /events when a cursor is given without a limit.
+DEFAULT_PAGE_SIZE = 100
+
+
+def _slot_response(slot: TimeSlot) -> TimeSlotResponse:
+    return TimeSlotResponse(
+        id=slot.id,
+        start_time=slot.start_time,
+        end_time=slot.end_time,
+        max_capacity=slot.max_capacity,
+        current_bookings=slot.current_bookings,
+        available_spots=slot.available_spots(),
+    )
+
+
+def _event_response(event: Event) -> EventResponse:
+    return EventResponse(
+        id=event.id,
+        name=event.name,
+        event_date=event.event_date,
+        description=event.description,
+        template_id=event.template_id,
+        time_slots=[_slot_response(slot) for slot in event.time_slots],
+    )
+
+
+def _group_response(group: BookingGroup) -> BookingGroupResponse:
+    return BookingGroupResponse(
+        id=group.id,
+        attendee_name=group.attendee_name,
+        time_slot_ids=group.time_slot_ids,
+        number_of_seats=group.number_of_seats,
+        booking_token=group.booking_token,
+        email=group.email,
+        created_at=group.created_at,
+    )
 
 
 # Event endpoints
-@router.post("/events", response_model=EventResponse, status_code=status.HTTP_201_CREATED)
-async def create_event(event_data: EventCreate, db: AsyncSession = Depends(get_db)):
+@router.post(
+    "/events",
+    response_model=EventResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=write_guard,
+)
+async def create_event(event_data: EventCreate, uow: UnitOfWork = Depends(get_uow)):
     """Create a new event with time slots."""
-    event_repo = SQLAlchemyEventRepository(db)
-    time_slot_repo = SQLAlchemyTimeSlotRepository(db)
-    use_case = CreateEventUseCase(event_repo, time_slot_repo)
+    use_case = CreateEventUseCase(uow)
 
     try:
         time_slots = [slot.model_dump() for slot in event_data.time_slots]
@@ -45,111 +106,119 @@ async def create_event(event_data: EventCreate, db: AsyncSession = Depends(get_d
             description=event_data.description,
         )
 
-        return EventResponse(
-            id=event.id,
-            name=event.name,
-            event_date=event.event_date,
-            description=event.description,
-            time_slots=[
-                TimeSlotResponse(
-                    id=slot.id,
-                    start_time=slot.start_time,
-                    end_time=slot.end_time,
-                    max_capacity=slot.max_capacity,
-                    current_bookings=slot.current_bookings,
-                    available_spots=slot.available_spots(),
-                )
-                for slot in event.time_slots
-            ],
-        )
+        return _event_response(event)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/events", response_model=List[EventResponse])
-async def get_all_events(db: AsyncSession = Depends(get_db)):
-    """Get all events."""
-    event_repo = SQLAlchemyEventRepository(db)
-    events = await event_repo.get_all()
-
-    return [
-        EventResponse(
-            id=event.id,
-            name=event.name,
-            event_date=event.event_date,
-            description=event.description,
-            time_slots=[
-                TimeSlotResponse(
-                    id=slot.id,
-                    start_time=slot.start_time,
-                    end_time=slot.end_time,
-                    max_capacity=slot.max_capacity,
-                    current_bookings=slot.current_bookings,
-                    available_spots=slot.available_spots(),
-                )
-                for slot in event.time_slots
-            ],
-        )
-        for event in events
-    ]
+async def get_all_events(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=500),
+):
+    """
+    Get events in date order.
+
+    Without `cursor` or `limit` every matching event is returned. Otherwise the
+    listing is paged (100 events by default) and `X-Next-Cursor` continues it.
+    """
+    key = ("events", start_date, end_date, cursor, limit)
+    # A hit is served as stored: no session, no mapping, no serialization.
+    page = catalog_cache.get(key)
+    if page is None:
+        after = decode_cursor(cursor, date.fromisoformat) if cursor else None
+        paged = cursor is not None or limit is not None
+
+        async def load() -> Tuple[bytes, Optional[str]]:
+            version = catalog_cache.version
+            async with open_uow() as uow:
+                use_case = ListEventsUseCase(uow.events)
+                if paged:
+                    events, has_more = await use_case.execute(
+                        after, limit or DEFAULT_PAGE_SIZE, start_date, end_date
+                    )
+                else:
+                    events, has_more = await use_case.execute_all(start_date, end_date), False
+            last = events[-1] if events and has_more else None
+            loaded = (
+                _event_list.dump_json([_event_response(event) for event in events]),
+                encode_cursor(last.event_date, last.id) if last else None,
+            )
+            catalog_cache.put(key, loaded, version)
+            return loaded
+
+        page = await event_reads.do(key, load)
+    body, next_cursor = page
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/events/{event_id}", response_model=EventResponse)
-async def get_event(event_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_event(event_id: UUID):
     """Get event by ID."""
-    event_repo = SQLAlchemyEventRepository(db)
-    event = await event_repo.get_by_id(event_id)
 
-    if not event:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+    async def load() -> Optional[bytes]:
+        async with open_uow() as uow:
+            event = await uow.events.get_by_id(event_id)
+        return _event_response(event).model_dump_json().encode() if event else None
 
-    return EventResponse(
-        id=event.id,
-        name=event.name,
-        event_date=event.event_date,
-        description=event.description,
-        time_slots=[
-            TimeSlotResponse(
-                id=slot.id,
-                start_time=slot.start_time,
-                end_time=slot.end_time,
-                max_capacity=slot.max_capacity,
-                current_bookings=slot.current_bookings,
-                available_spots=slot.available_spots(),
-            )
-            for slot in event.time_slots
-        ],
-    )
+    body = await event_reads.do(("event", event_id), load)
+    if body is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/events/{event_id}/slots", response_model=List[TimeSlotResponse])
-async def get_event_slots(event_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_event_slots(event_id: UUID):
     """Get available time slots for an event."""
-    time_slot_repo = SQLAlchemyTimeSlotRepository(db)
-    use_case = GetAvailableSlotsUseCase(time_slot_repo)
-
-    slots = await use_case.execute(event_id)
-
-    return [
-        TimeSlotResponse(
-            id=slot.id,
-            start_time=slot.start_time,
-            end_time=slot.end_time,
-            max_capacity=slot.max_capacity,
-            current_bookings=slot.current_bookings,
-            available_spots=slot.available_spots(),
+
+    async def load() -> bytes:
+        async with open_uow() as uow:
+            use_case = GetAvailableSlotsUseCase(uow.time_slots)
+            slots = await use_case.execute(event_id)
+        return _slot_list.dump_json([_slot_response(slot) for slot in slots])
+
+    body = await event_reads.do(("slots", event_id), load)
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/availability", response_model=List[EventAvailabilityResponse])
+async def get_availability(
+    response: Response,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=100, ge=1, le=500),
+):
+    """
+    Get seat totals per event in date order, a page at a time.
+
+    Served from precomputed summaries, which trail bookings by up to
+    `AVAILABILITY_REFRESH_INTERVAL` seconds; `X-Next-Cursor` continues the listing.
+    """
+    after = decode_cursor(cursor, date.fromisoformat) if cursor else None
+    async with open_uow() as uow:
+        summaries, has_more = await ListAvailabilityUseCase(uow.availability).execute(
+            after, limit, start_date, end_date
         )
-        for slot in slots
-    ]
+    if summaries and has_more:
+        last = summaries[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.event_date, last.event_id)
+    return summaries
 
 
 # Booking endpoints
-@router.post("/bookings", response_model=BookingResponse, status_code=status.HTTP_201_CREATED)
-async def create_booking(booking_data: BookingCreate, db: AsyncSession = Depends(get_db)):
+@router.post(
+    "/bookings",
+    response_model=BookingResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=write_guard,
+)
+async def create_booking(booking_data: BookingCreate, uow: UnitOfWork = Depends(get_uow)):
     """Create a new booking."""
-    booking_repo = SQLAlchemyBookingRepository(db)
-    time_slot_repo = SQLAlchemyTimeSlotRepository(db)
-    use_case = CreateBookingUseCase(booking_repo, time_slot_repo)
+    use_case = CreateBookingUseCase(uow)
 
     try:
         booking = await use_case.execute(
@@ -173,10 +242,9 @@ async def create_booking(booking_data: BookingCreate, db: AsyncSession = Depends
 
 
 @router.get("/bookings/{token}", response_model=BookingResponse)
-async def get_booking(token: str, db: AsyncSession = Depends(get_db)):
+async def get_booking(token: str, uow: UnitOfWork = Depends(get_uow)):
     """Get booking by token."""
-    booking_repo = SQLAlchemyBookingRepository(db)
-    use_case = GetBookingUseCase(booking_repo)
+    use_case = GetBookingUseCase(uow.bookings)
 
     booking = await use_case.execute(token)
 
@@ -194,14 +262,12 @@ async def get_booking(token: str, db: AsyncSession = Depends(get_db)):
     )
 
 
-@router.put("/bookings/{token}", response_model=BookingResponse)
+@router.put("/bookings/{token}", response_model=BookingResponse, dependencies=write_guard)
 async def update_booking(
-    token: str, booking_update: BookingUpdate, db: AsyncSession = Depends(get_db)
+    token: str, booking_update: BookingUpdate, uow: UnitOfWork = Depends(get_uow)
 ):
     """Update booking to a new time slot."""
-    booking_repo = SQLAlchemyBookingRepository(db)
-    time_slot_repo = SQLAlchemyTimeSlotRepository(db)
-    use_case = UpdateBookingUseCase(booking_repo, time_slot_repo)
+    use_case = UpdateBookingUseCase(uow)
 
     try:
         booking = await use_case.execute(token, booking_update.new_time_slot_id)
@@ -219,14 +285,96 @@ async def update_booking(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.delete("/bookings/{token}", status_code=status.HTTP_204_NO_CONTENT)
-async def cancel_booking(token: str, db: AsyncSession = Depends(get_db)):
+@router.delete(
+    "/bookings/{token}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=write_guard,
+)
+async def cancel_booking(token: str, uow: UnitOfWork = Depends(get_uow)):
     """Cancel a booking."""
-    booking_repo = SQLAlchemyBookingRepository(db)
-    time_slot_repo = SQLAlchemyTimeSlotRepository(db)
-    use_case = CancelBookingUseCase(booking_repo, time_slot_repo)
+    use_case = CancelBookingUseCase(uow)
 
     success = await use_case.execute(token)
 
     if not success:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking not found")
+
+
+# Booking group endpoints
+@router.post(
+    "/booking-groups",
+    response_model=BookingGroupResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=write_guard,
+)
+async def create_booking_group(group_data: BookingGroupCreate, uow: UnitOfWork = Depends(get_uow)):
+    """Book the same seats in several time slots of an event, all or nothing."""
+    use_case = CreateBookingGroupUseCase(uow)
+
+    try:
+        group = await use_case.execute(
+            attendee_name=group_data.attendee_name,
+            time_slot_ids=group_data.time_slot_ids,
+            number_of_seats=group_data.number_of_seats,
+            email=group_data.email,
+        )
+        return _group_response(group)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/booking-groups/{token}", response_model=BookingGroupResponse)
+async def get_booking_group(token: str, uow: UnitOfWork = Depends(get_uow)):
+    """Get a booking group and its time slots by token."""
+    use_case = GetBookingGroupUseCase(uow.booking_groups)
+
+    group = await use_case.execute(token)
+
+    if not group:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking not found")
+
+    return _group_response(group)
+
+
+@router.delete(
+    "/booking-groups/{token}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=write_guard,
+)
+async def cancel_booking_group(token: str, uow: UnitOfWork = Depends(get_uow)):
+    """Cancel a booking group in all of its time slots."""
+    use_case = CancelBookingGroupUseCase(uow)
+
+    success = await use_case.execute(token)
+
+    if not success:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking not found")
+
+
+# Change feed
+@router.get(
+    "/changes",
+    response_model=ChangeFeedResponse,
+    dependencies=[Depends(require_admin)],
+)
+async def get_changes(
+    after: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=1000),
+    uow: UnitOfWork = Depends(get_uow),
+):
+    """Get booking and capacity changes after a cursor, oldest first."""
+    # Read only: entries show up once the background sequencer has numbered them.
+    changes = await uow.change_log.get_after(after, limit)
+
+    return ChangeFeedResponse(
+        changes=[
+            ChangeResponse(
+                seq=change.seq,
+                kind=change.kind,
+                occurred_at=change.occurred_at,
+                payload=change.payload,
+            )
+            for change in changes
+        ],
+        next_cursor=changes[-1].seq if changes else after,
+    )
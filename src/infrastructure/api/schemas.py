@@ -1,8 +1,15 @@
-from datetime import date, time, datetime
-from typing import List, Optional
+from datetime import date, datetime, time
+from typing import List, Literal, Optional
 from uuid import UUID
+
 from pydantic import BaseModel, Field
 
+# Slots one booking group may span; a group locks all of them at once.
+MAX_GROUP_SLOTS = 24
+
+# Slots one bulk capacity change may touch; they are all locked in one statement.
+MAX_CAPACITY_CHANGES = 1000
+
 
 class TimeSlotCreate(BaseModel):
     start_time: time
@@ -34,12 +41,28 @@ class EventResponse(BaseModel):
     name: str
     event_date: date
     description: Optional[str]
+    template_id: Optional[UUID] = None
     time_slots: List[TimeSlotResponse] = []
 
     class Config:
         from_attributes = True
 
 
+class EventAvailabilityResponse(BaseModel):
+    event_id: UUID
+    event_name: str
+    event_date: date
+    slot_count: int
+    open_slots: int
+    total_capacity: int
+    booked_seats: int
+    available_seats: int
+    refreshed_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class BookingCreate(BaseModel):
     attendee_name: str = Field(min_length=1, max_length=255)
     time_slot_id: UUID
@@ -62,3 +85,133 @@ class BookingResponse(BaseModel):
 
 class BookingUpdate(BaseModel):
     new_time_slot_id: UUID
+
+
+class BookingGroupCreate(BaseModel):
+    attendee_name: str = Field(min_length=1, max_length=255)
+    time_slot_ids: List[UUID] = Field(min_length=1, max_length=MAX_GROUP_SLOTS)
+    number_of_seats: int = Field(gt=0)
+    email: Optional[str] = None
+
+
+class BookingGroupResponse(BaseModel):
+    id: UUID
+    attendee_name: str
+    time_slot_ids: List[UUID]
+    number_of_seats: int
+    booking_token: str
+    email: Optional[str]
+    created_at: datetime
+
+
+# Bookings as listed to admins; tokens are never included.
+class BookingSummaryResponse(BaseModel):
+    id: UUID
+    attendee_name: str
+    time_slot_id: UUID
+    number_of_seats: int
+    email: Optional[str]
+    created_at: datetime
+    group_id: Optional[UUID] = None
+
+
+class BookingPageResponse(BaseModel):
+    bookings: List[BookingSummaryResponse]
+    next_cursor: Optional[str] = None
+
+
+class SlotCapacity(BaseModel):
+    time_slot_id: UUID
+    max_capacity: int = Field(gt=0)
+
+
+class SlotCapacitiesUpdate(BaseModel):
+    slots: List[SlotCapacity] = Field(min_length=1, max_length=MAX_CAPACITY_CHANGES)
+
+
+class SlotCapacityResult(BaseModel):
+    time_slot_id: UUID
+    status: Literal["updated", "unchanged", "below_bookings", "not_found"]
+    max_capacity: Optional[int] = None
+    current_bookings: Optional[int] = None
+
+    class Config:
+        from_attributes = True
+
+
+class SlotCapacitiesResponse(BaseModel):
+    results: List[SlotCapacityResult]
+
+
+class ImportRowErrorResponse(BaseModel):
+    line: int
+    message: str
+
+
+class ImportResultResponse(BaseModel):
+    rows_processed: int
+    rows_rejected: int
+    rows_skipped: int
+    events_created: int
+    events_skipped: int
+    slots_created: int
+    merged: bool
+    errors: List[ImportRowErrorResponse] = []
+
+    class Config:
+        from_attributes = True
+
+
+class ChangeResponse(BaseModel):
+    seq: int
+    kind: str
+    occurred_at: datetime
+    payload: dict
+
+
+class ChangeFeedResponse(BaseModel):
+    changes: List[ChangeResponse]
+    next_cursor: int
+
+
+class EventTemplateCreate(BaseModel):
+    name: str = Field(min_length=1, max_length=255)
+    description: Optional[str] = None
+    frequency: Literal["daily", "weekly"] = "weekly"
+    interval: int = Field(default=1, ge=1)
+    weekdays: Optional[List[int]] = None
+    start_date: date
+    end_date: Optional[date] = None
+    window_start: time
+    window_end: time
+    slot_capacity: int = Field(gt=0)
+    exceptions: List[date] = []
+
+
+class EventTemplateResponse(BaseModel):
+    id: UUID
+    name: str
+    description: Optional[str]
+    frequency: str
+    interval: int
+    weekdays: List[int]
+    start_date: date
+    end_date: Optional[date]
+    window_start: time
+    window_end: time
+    slot_capacity: int
+    exceptions: List[date]
+    generated_until: date
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class TemplateExceptionsCreate(BaseModel):
+    dates: List[date] = Field(min_length=1)
+
+
+class TemplateExceptionsResponse(BaseModel):
+    template: EventTemplateResponse
+    kept_booked: List[date]
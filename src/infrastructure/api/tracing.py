@@ -0,0 +1,80 @@
+from typing import Optional, Tuple
+
+from src.infrastructure.tracing import SPAN_SERVER, Tracer, current_span, tracer
+
+TRACEPARENT_HEADER = b"traceparent"
+TRACE_ID_HEADER = b"x-trace-id"
+
+
+def parse_traceparent(value: bytes) -> Optional[Tuple[int, int, bool]]:
+    """(trace id, parent span id, sampled) of a W3C traceparent header, or None if malformed."""
+    parts = value.split(b"-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16 or len(parts[3]) != 2:
+        return None
+    try:
+        trace_id, parent_id, flags = int(parts[1], 16), int(parts[2], 16), int(parts[3], 16)
+    except ValueError:
+        return None
+    if not trace_id or not parent_id:
+        return None
+    return trace_id, parent_id, bool(flags & 1)
+
+
+class TracingMiddleware:
+    """
+    Opens the root span of each sampled request and makes it current.
+
+    A request carrying a valid `traceparent` joins that trace and follows
+    its sampling decision; others are sampled at `TRACE_SAMPLE_RATE`. The
+    span is named after the matched route template once routing is done,
+    covers streamed bodies until their last chunk, and its trace id is
+    returned in `X-Trace-Id`.
+    """
+
+    def __init__(self, app, source: Tracer = tracer):
+        self.app = app
+        self.source = source
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        parent = None
+        for name, value in scope["headers"]:
+            if name == TRACEPARENT_HEADER:
+                parent = parse_traceparent(value)
+                break
+        trace_id, parent_id, sampled = parent or (None, None, None)
+        method = scope["method"]
+        span = self.source.start_trace(
+            f"{method} {scope['path']}", trace_id, parent_id, sampled, SPAN_SERVER
+        )
+        if span is None:
+            await self.app(scope, receive, send)
+            return
+        span.attributes = {"http.method": method, "http.target": scope["path"]}
+
+        async def send_with_trace_id(message) -> None:
+            if message["type"] == "http.response.start":
+                span.attributes["http.status_code"] = message["status"]
+                headers = list(message.get("headers", ()))
+                headers.append((TRACE_ID_HEADER, f"{span.trace_id:032x}".encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        token = current_span.set(span)
+        error = None
+        try:
+            await self.app(scope, receive, send_with_trace_id)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            current_span.reset(token)
+            # Routing has filled in the matched route by now.
+            route = scope.get("route")
+            if route is not None:
+                span.name = f"{method} {route.path}"
+                span.attributes["http.route"] = route.path
+            self.source.end(span, error)
@@ -0,0 +1,34 @@
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from src.application.unit_of_work import UnitOfWork
+
+# "sqlalchemy" (PostgreSQL) or "memory", which keeps everything in process and
+# separates use-case and serialization cost from database cost in benchmarks.
+REPOSITORY_BACKEND = os.getenv("REPOSITORY_BACKEND", "sqlalchemy").lower()
+BACKENDS = ("sqlalchemy", "memory")
+
+if REPOSITORY_BACKEND not in BACKENDS:
+    raise ValueError(f"REPOSITORY_BACKEND must be one of: {', '.join(BACKENDS)}")
+
+
+def uses_database() -> bool:
+    """Whether the configured backend stores data in PostgreSQL."""
+    return REPOSITORY_BACKEND == "sqlalchemy"
+
+
+@asynccontextmanager
+async def open_uow() -> AsyncIterator[UnitOfWork]:
+    """Open a unit of work on the configured backend, with its own session if any."""
+    if REPOSITORY_BACKEND == "memory":
+        from src.infrastructure.memory import MemoryUnitOfWork
+
+        yield MemoryUnitOfWork()
+        return
+
+    from src.infrastructure.database.database import async_session_maker
+    from src.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+
+    async with async_session_maker() as session:
+        yield SQLAlchemyUnitOfWork(session)
@@ -0,0 +1,18 @@
+from .booking_cache import BookingCache, CachedBookingRepository, booking_cache, token_key
+from .invalidation import InvalidationBus, invalidation_bus
+from .response_cache import ResponseCache, catalog_cache
+from .single_flight import SingleFlight
+from .ttl_cache import TTLCache
+
+__all__ = [
+    "TTLCache",
+    "InvalidationBus",
+    "invalidation_bus",
+    "SingleFlight",
+    "BookingCache",
+    "CachedBookingRepository",
+    "booking_cache",
+    "token_key",
+    "ResponseCache",
+    "catalog_cache",
+]
@@ -0,0 +1,208 @@
+import os
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from src.domain.entities import Booking, TimeSlot
+from src.domain.repositories import BookingRepository
+from src.infrastructure.database.repositories import token_digest
+from src.infrastructure.metrics import metrics
+
+from .invalidation import invalidation_bus
+from .ttl_cache import TTLCache
+
+BOOKING_CACHE_SIZE = int(os.getenv("BOOKING_CACHE_SIZE", "10000"))
+BOOKING_CACHE_TTL = float(os.getenv("BOOKING_CACHE_TTL", "60"))
+BOOKING_CHANNEL = "booking_cache"
+# Invalidation payload that empties the cache, for deletes too large to announce per booking.
+ALL_BOOKINGS = "*"
+
+
+def token_key(token: str) -> bytes:
+    """Cache key for a booking token; raw tokens are never kept in memory."""
+    return token_digest(token)
+
+
+class BookingCache:
+    """
+    Bounded TTL/LRU cache of bookings keyed by token hash.
+
+    Entries are stored as plain field tuples and turned into fresh Booking
+    entities on every hit, so callers can never mutate a cached value. A
+    booking id index allows invalidation by id, which is what gets broadcast
+    to other workers. `generation` changes on every invalidation so a lookup
+    that raced with one can decline to cache what it read.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self._entries: TTLCache[Tuple] = TTLCache(max_size, ttl)
+        self._keys_by_id: Dict[UUID, bytes] = {}
+        self.generation = 0
+
+    def get(self, token: str) -> Optional[Booking]:
+        fields = self._entries.get(token_key(token))
+        if fields is None:
+            metrics.increment("booking_cache.misses")
+            self._report()
+            return None
+        metrics.increment("booking_cache.hits")
+        self._report()
+        (
+            booking_id,
+            attendee_name,
+            time_slot_id,
+            seats,
+            created_at,
+            email,
+            group_id,
+            event_id,
+        ) = fields
+        return Booking(
+            attendee_name=attendee_name,
+            time_slot_id=time_slot_id,
+            number_of_seats=seats,
+            booking_token=token,
+            booking_id=booking_id,
+            created_at=created_at,
+            email=email,
+            group_id=group_id,
+            event_id=event_id,
+        )
+
+    def put(self, booking: Booking, generation: int) -> None:
+        if generation != self.generation:
+            return
+        key = token_key(booking.booking_token)
+        self._entries.set(
+            key,
+            (
+                booking.id,
+                booking.attendee_name,
+                booking.time_slot_id,
+                booking.number_of_seats,
+                booking.created_at,
+                booking.email,
+                booking.group_id,
+                booking.event_id,
+            ),
+        )
+        self._keys_by_id[booking.id] = key
+        # The id index may hold keys the LRU has already evicted; trim it lazily.
+        if len(self._keys_by_id) > 2 * self._entries.max_size:
+            self._keys_by_id = {
+                booking_id: key
+                for booking_id, key in self._keys_by_id.items()
+                if key in self._entries
+            }
+
+    def invalidate(self, booking_id: UUID) -> None:
+        self.generation += 1
+        key = self._keys_by_id.pop(booking_id, None)
+        if key is not None:
+            self._entries.pop(key)
+            metrics.increment("booking_cache.invalidations")
+
+    def on_notification(self, payload: str) -> None:
+        if payload == ALL_BOOKINGS:
+            self.clear()
+        else:
+            self.invalidate(UUID(payload))
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+        self._keys_by_id.clear()
+
+    def _report(self) -> None:
+        hits = metrics.counter("booking_cache.hits")
+        total = hits + metrics.counter("booking_cache.misses")
+        metrics.set_gauge("booking_cache.hit_rate", hits / total if total else 0.0)
+        metrics.set_gauge("booking_cache.size", len(self._entries))
+
+
+booking_cache = BookingCache(BOOKING_CACHE_SIZE, BOOKING_CACHE_TTL)
+invalidation_bus.subscribe(BOOKING_CHANNEL, booking_cache.on_notification, booking_cache.clear)
+
+
+class CachedBookingRepository(BookingRepository):
+    """
+    BookingRepository decorator caching `get_by_token` lookups.
+
+    Reads inside an open transaction bypass the cache, so use cases that lock
+    and modify a booking always see the database state. Updates and deletes
+    evict the booking locally and announce the eviction to other workers once
+    the transaction commits; deleting all bookings of an event empties the
+    cache everywhere instead of announcing each one.
+    """
+
+    def __init__(self, repository: BookingRepository, cache: BookingCache = booking_cache):
+        self.repository = repository
+        self.cache = cache
+
+    @property
+    def session(self):
+        return self.repository.session
+
+    async def create(self, booking: Booking) -> Booking:
+        return await self.repository.create(booking)
+
+    async def get_by_id(self, booking_id: UUID) -> Optional[Booking]:
+        return await self.repository.get_by_id(booking_id)
+
+    async def get_by_token(self, token: str) -> Optional[Booking]:
+        if self.session.in_transaction():
+            return await self.repository.get_by_token(token)
+        booking = self.cache.get(token)
+        if booking is None:
+            generation = self.cache.generation
+            booking = await self.repository.get_by_token(token)
+            if booking is not None:
+                self.cache.put(booking, generation)
+        return booking
+
+    async def get_by_time_slot_id(self, time_slot_id: UUID) -> List[Booking]:
+        return await self.repository.get_by_time_slot_id(time_slot_id)
+
+    async def get_page_by_time_slot_id(
+        self,
+        time_slot_id: UUID,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 100,
+        name_prefix: Optional[str] = None,
+    ) -> List[Booking]:
+        return await self.repository.get_page_by_time_slot_id(
+            time_slot_id, after, limit, name_prefix
+        )
+
+    async def get_page_by_event_id(
+        self,
+        event_id: UUID,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 100,
+        name_prefix: Optional[str] = None,
+    ) -> List[Booking]:
+        return await self.repository.get_page_by_event_id(event_id, after, limit, name_prefix)
+
+    async def update(self, booking: Booking) -> Booking:
+        await self._invalidate(booking.id)
+        return await self.repository.update(booking)
+
+    async def move(self, booking: Booking, new_time_slot_id: UUID) -> Optional[TimeSlot]:
+        await self._invalidate(booking.id)
+        return await self.repository.move(booking, new_time_slot_id)
+
+    async def delete(self, booking_id: UUID) -> bool:
+        await self._invalidate(booking_id)
+        return await self.repository.delete(booking_id)
+
+    async def delete_by_event(
+        self, event_id: UUID, chunk_size: int = 1000
+    ) -> AsyncIterator[List[Booking]]:
+        self.cache.clear()
+        await invalidation_bus.publish(self.session, BOOKING_CHANNEL, ALL_BOOKINGS)
+        async for bookings in self.repository.delete_by_event(event_id, chunk_size):
+            yield bookings
+
+    async def _invalidate(self, booking_id: UUID) -> None:
+        self.cache.invalidate(booking_id)
+        await invalidation_bus.publish(self.session, BOOKING_CHANNEL, str(booking_id))
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+from uuid import uuid4
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database.database import DATABASE_URL, IS_SQLITE
+from src.infrastructure.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY = "pending_invalidations"
+
+
+class InvalidationBus:
+    """
+    Cross-worker cache invalidation over Postgres LISTEN/NOTIFY.
+
+    `publish` issues `pg_notify` inside the caller's transaction, so other
+    workers hear about a change only once it has committed, and the local
+    worker's handlers run right after the commit. Each worker holds one
+    listening connection; if it drops, every subscriber is reset because
+    notifications may have been missed in the meantime. Without a dsn
+    (SQLite) changes are only delivered within this process.
+    """
+
+    def __init__(self, dsn: Optional[str]):
+        self.dsn = dsn
+        self.worker_id = uuid4().hex[:12]
+        self._handlers: Dict[str, List[Callable[[str], None]]] = defaultdict(list)
+        self._reset_handlers: List[Callable[[], None]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(
+        self,
+        channel: str,
+        handler: Callable[[str], None],
+        on_reset: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self._handlers[channel].append(handler)
+        if on_reset:
+            self._reset_handlers.append(on_reset)
+
+    async def publish(self, session: AsyncSession, channel: str, payload: str) -> None:
+        """Announce a change that becomes visible when the session commits."""
+        if self.dsn:
+            await session.execute(
+                text("SELECT pg_notify(:channel, :payload)").bindparams(
+                    channel=channel, payload=f"{self.worker_id}:{payload}"
+                )
+            )
+        session.sync_session.info.setdefault(PENDING_KEY, []).append((channel, payload))
+
+    def deliver(self, channel: str, payload: str) -> None:
+        for handler in self._handlers.get(channel, ()):
+            try:
+                handler(payload)
+            except Exception:
+                logger.exception("Invalidation handler for %s failed", channel)
+        metrics.increment(f"invalidation.{channel}")
+
+    def reset(self) -> None:
+        for on_reset in self._reset_handlers:
+            on_reset()
+        metrics.increment("invalidation.resets")
+
+    def _on_notification(self, connection, pid: int, channel: str, payload: str) -> None:
+        origin, _, payload = payload.partition(":")
+        if origin != self.worker_id:
+            self.deliver(channel, payload)
+
+    async def _listen(self) -> None:
+        import asyncpg
+
+        delay = 1.0
+        while True:
+            try:
+                connection = await asyncpg.connect(self.dsn)
+            except Exception as e:
+                logger.warning("Invalidation bus cannot connect: %s", e)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+                continue
+
+            delay = 1.0
+            closed = asyncio.Event()
+            connection.add_termination_listener(lambda _: closed.set())
+            try:
+                for channel in self._handlers:
+                    await connection.add_listener(channel, self._on_notification)
+                # Anything cached while we were not listening may be stale.
+                self.reset()
+                metrics.set_gauge("invalidation.connected", 1)
+                await closed.wait()
+            finally:
+                metrics.set_gauge("invalidation.connected", 0)
+                if not connection.is_closed():
+                    await connection.close()
+            logger.warning("Invalidation bus connection lost, reconnecting")
+
+    def start(self) -> None:
+        if self.dsn and self._handlers and self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+def _driver_dsn(url: str) -> str:
+    return make_url(url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+invalidation_bus = InvalidationBus(None if IS_SQLITE else _driver_dsn(DATABASE_URL))
+
+
+@event.listens_for(Session, "after_commit")
+def _deliver_locally(session: Session) -> None:
+    for channel, payload in session.info.pop(PENDING_KEY, ()):
+        invalidation_bus.deliver(channel, payload)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
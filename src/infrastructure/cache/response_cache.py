@@ -0,0 +1,58 @@
+import os
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+from src.infrastructure.metrics import metrics
+
+from .invalidation import invalidation_bus
+from .ttl_cache import TTLCache
+
+CATALOG_CACHE_SIZE = int(os.getenv("CATALOG_CACHE_SIZE", "1000"))
+# Backstop for writes no notification reaches, e.g. another process on SQLite.
+CATALOG_CACHE_TTL = float(os.getenv("CATALOG_CACHE_TTL", "300"))
+CATALOG_CHANNEL = "catalog"
+
+V = TypeVar("V")
+
+
+class ResponseCache(Generic[V]):
+    """
+    Serialized responses tagged with the catalog version they were built at.
+
+    `version` moves on whenever events, slots or bookings change: in this
+    worker as soon as a unit of work commits, and in every worker when the
+    database announces the committed write on the catalog channel. A hit
+    returns the stored value as is; entries of an older version are never
+    served again and age out of the LRU. Loads pass the version they started
+    at to `put`, so a result that raced with a write is not kept.
+    """
+
+    def __init__(self, name: str, max_size: int, ttl: float):
+        self.name = name
+        self._entries: TTLCache[Tuple[int, V]] = TTLCache(max_size, ttl)
+        self.version = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != self.version:
+            metrics.increment(f"{self.name}.misses")
+            return None
+        metrics.increment(f"{self.name}.hits")
+        return entry[1]
+
+    def put(self, key: Hashable, value: V, version: int) -> None:
+        if version == self.version:
+            self._entries.set(key, (version, value))
+            metrics.set_gauge(f"{self.name}.size", len(self._entries))
+
+    def bump(self) -> None:
+        self.version += 1
+
+    def on_notification(self, payload: str) -> None:
+        self.bump()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+catalog_cache: ResponseCache = ResponseCache("catalog_cache", CATALOG_CACHE_SIZE, CATALOG_CACHE_TTL)
+invalidation_bus.subscribe(CATALOG_CHANNEL, catalog_cache.on_notification, catalog_cache.bump)
@@ -0,0 +1,42 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+from src.infrastructure.metrics import metrics
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    Coalesces concurrent identical loads within a worker.
+
+    The first caller for a key starts the loader in its own task; callers
+    arriving while it is in flight await the same result instead of issuing
+    their own query. Nothing is kept once the load finishes, so this never
+    serves data older than a request that was already running. Because the
+    loader runs detached, a cancelled caller does not fail the others.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        future = self._in_flight.get(key)
+        if future is not None:
+            metrics.increment(f"single_flight.{self.name}.coalesced")
+            return await asyncio.shield(future)
+
+        metrics.increment(f"single_flight.{self.name}.loads")
+        future = self._in_flight[key] = asyncio.ensure_future(loader())
+        future.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(future)
+
+    def _finish(self, key: Hashable, future: asyncio.Future) -> None:
+        self._in_flight.pop(key, None)
+        # Mark a failure as retrieved even if every caller was cancelled.
+        if not future.cancelled():
+            future.exception()
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
@@ -1,4 +1,22 @@
-from .models import Base, EventModel, TimeSlotModel, BookingModel
-from .database import get_db, engine
+from .database import engine, get_db
+from .models import (
+    Base,
+    BookingGroupModel,
+    BookingModel,
+    ChangeLogModel,
+    EventModel,
+    OutboxMessageModel,
+    TimeSlotModel,
+)
 
-__all__ = ["Base", "EventModel", "TimeSlotModel", "BookingModel", "get_db", "engine"]
+__all__ = [
+    "Base",
+    "EventModel",
+    "TimeSlotModel",
+    "BookingModel",
+    "BookingGroupModel",
+    "OutboxMessageModel",
+    "ChangeLogModel",
+    "get_db",
+    "engine",
+]
@@ -0,0 +1,140 @@
+from typing import List, Tuple
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities import Event, TimeSlot
+from src.domain.repositories import EventImportRepository
+
+from .models import EventModel, TimeSlotModel
+
+EVENT_COLUMNS = ["id", "name", "event_date", "description", "template_id"]
+TIME_SLOT_COLUMNS = ["id", "event_id", "start_time", "end_time", "max_capacity", "current_bookings"]
+
+
+class PostgresEventImportRepository(EventImportRepository):
+    """
+    Loads events through asyncpg COPY into per-transaction staging tables.
+
+    Nothing becomes visible until `merge` copies the staged rows into the real
+    tables; the staging tables are dropped when the transaction ends.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._staging_ready = False
+
+    async def _ensure_staging(self) -> None:
+        if self._staging_ready:
+            return
+        # Issued through the session so the driver transaction is already open
+        # when COPY runs on the raw connection.
+        await self.session.execute(
+            text("CREATE TEMP TABLE import_events (LIKE events INCLUDING DEFAULTS) ON COMMIT DROP")
+        )
+        await self.session.execute(
+            text(
+                "CREATE TEMP TABLE import_time_slots "
+                "(LIKE time_slots INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+        )
+        self._staging_ready = True
+
+    async def _driver_connection(self):
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        return raw_connection.driver_connection
+
+    async def stage(self, events: List[Event], time_slots: List[TimeSlot]) -> None:
+        # COPY bypasses the session, so rows it references must be written first.
+        await self.session.flush()
+        await self._ensure_staging()
+        driver = await self._driver_connection()
+        if events:
+            await driver.copy_records_to_table(
+                "import_events",
+                records=[
+                    (event.id, event.name, event.event_date, event.description, event.template_id)
+                    for event in events
+                ],
+                columns=EVENT_COLUMNS,
+            )
+        if time_slots:
+            await driver.copy_records_to_table(
+                "import_time_slots",
+                records=[
+                    (
+                        slot.id,
+                        slot.event_id,
+                        slot.start_time,
+                        slot.end_time,
+                        slot.max_capacity,
+                        slot.current_bookings,
+                    )
+                    for slot in time_slots
+                ],
+                columns=TIME_SLOT_COLUMNS,
+            )
+
+    async def merge(self) -> Tuple[int, int]:
+        if not self._staging_ready:
+            return 0, 0
+        events = await self.session.execute(
+            text(
+                f"INSERT INTO events ({', '.join(EVENT_COLUMNS)}) "
+                f"SELECT {', '.join(EVENT_COLUMNS)} FROM import_events"
+            )
+        )
+        time_slots = await self.session.execute(
+            text(
+                f"INSERT INTO time_slots ({', '.join(TIME_SLOT_COLUMNS)}) "
+                f"SELECT {', '.join(TIME_SLOT_COLUMNS)} FROM import_time_slots"
+            )
+        )
+        return events.rowcount, time_slots.rowcount
+
+
+class SQLiteEventImportRepository(EventImportRepository):
+    """
+    Buffers staged rows and merges them with batched multi-row INSERTs.
+
+    SQLite has no COPY; its inserts are cheap within one transaction, and the
+    rows stay invisible until `merge` just as with the staging tables.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._events: List[dict] = []
+        self._time_slots: List[dict] = []
+
+    async def stage(self, events: List[Event], time_slots: List[TimeSlot]) -> None:
+        self._events.extend(
+            {
+                "id": event.id,
+                "name": event.name,
+                "event_date": event.event_date,
+                "description": event.description,
+                "template_id": event.template_id,
+            }
+            for event in events
+        )
+        self._time_slots.extend(
+            {
+                "id": slot.id,
+                "event_id": slot.event_id,
+                "start_time": slot.start_time,
+                "end_time": slot.end_time,
+                "max_capacity": slot.max_capacity,
+                "current_bookings": slot.current_bookings,
+            }
+            for slot in time_slots
+        )
+
+    async def merge(self) -> Tuple[int, int]:
+        events, time_slots = self._events, self._time_slots
+        self._events, self._time_slots = [], []
+        if events:
+            await self.session.execute(insert(EventModel.__table__), events)
+        if time_slots:
+            await self.session.execute(insert(TimeSlotModel.__table__), time_slots)
+        return len(events), len(time_slots)
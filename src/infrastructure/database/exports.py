@@ -0,0 +1,122 @@
+import asyncio
+import csv
+import io
+from typing import AsyncIterator, Awaitable, Callable, Optional
+from uuid import UUID
+
+from sqlalchemy import Date, DateTime, Time, Uuid, bindparam, text
+
+from .database import IS_SQLITE, async_session_maker
+
+# Booking tokens are deliberately absent: manifests are handed to event staff.
+MANIFEST_QUERY = """
+    SELECT
+        e.name AS event_name,
+        e.event_date,
+        ts.start_time,
+        ts.end_time,
+        b.attendee_name,
+        b.number_of_seats,
+        b.email,
+        b.created_at AS booked_at,
+        b.id AS booking_id
+    FROM bookings b
+    JOIN time_slots ts ON ts.id = b.time_slot_id
+    JOIN events e ON e.id = ts.event_id
+    WHERE {condition}
+    ORDER BY ts.start_time, b.attendee_name, b.id
+"""
+
+# Chunks buffered between COPY and the client; bounds memory per export.
+MANIFEST_QUEUE_SIZE = 16
+
+# Rows per chunk where the rows are fetched and written as CSV here (SQLite).
+MANIFEST_CHUNK_ROWS = 500
+
+_DONE = object()
+
+
+async def stream_attendee_manifest(
+    event_id: Optional[UUID] = None,
+    time_slot_id: Optional[UUID] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Stream the attendee manifest of an event or a single time slot as CSV.
+
+    Rows come straight from `COPY ... TO STDOUT` and pass through a small bounded
+    queue, so memory stays constant however many bookings there are. SQLite has
+    no COPY, so there the rows are streamed from a cursor and written in chunks.
+    A session of its own is used because the stream outlives the request's
+    dependencies.
+    """
+    if (event_id is None) == (time_slot_id is None):
+        raise ValueError("Exactly one of event_id or time_slot_id is required")
+    column, argument = ("ts.event_id", event_id) if event_id else ("b.time_slot_id", time_slot_id)
+    placeholder = ":target" if IS_SQLITE else "$1"
+    query = MANIFEST_QUERY.format(condition=f"{column} = {placeholder}")
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=MANIFEST_QUEUE_SIZE)
+
+    async def write(data: bytes) -> None:
+        await queue.put(bytes(data))
+
+    async def copy() -> None:
+        try:
+            if IS_SQLITE:
+                await _write_csv_rows(query, argument, write)
+            else:
+                async with async_session_maker() as session:
+                    connection = await session.connection()
+                    raw_connection = await connection.get_raw_connection()
+                    await raw_connection.driver_connection.copy_from_query(
+                        query,
+                        argument,
+                        output=write,
+                        format="csv",
+                        header=True,
+                    )
+            await queue.put(_DONE)
+        except Exception as e:
+            await queue.put(e)
+
+    task = asyncio.create_task(copy())
+    try:
+        while True:
+            chunk = await queue.get()
+            if chunk is _DONE:
+                break
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+    finally:
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+
+async def _write_csv_rows(
+    query: str, target: UUID, write: Callable[[bytes], Awaitable[None]]
+) -> None:
+    statement = (
+        text(query)
+        .bindparams(bindparam("target", type_=Uuid))
+        .columns(
+            event_date=Date,
+            start_time=Time,
+            end_time=Time,
+            booked_at=DateTime,
+            booking_id=Uuid,
+        )
+    )
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    async with async_session_maker() as session:
+        result = await session.stream(statement, {"target": target})
+        writer.writerow(result.keys())
+        async for rows in result.partitions(MANIFEST_CHUNK_ROWS):
+            writer.writerows(rows)
+            await write(buffer.getvalue().encode())
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            await write(buffer.getvalue().encode())
@@ -1,8 +1,27 @@
+import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Date, Time, DateTime, ForeignKey, Text
+from typing import Tuple
+
+from sqlalchemy import (
+    DDL,
+    JSON,
+    BigInteger,
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Table,
+    Text,
+    Time,
+    UniqueConstraint,
+    Uuid,
+    event,
+)
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID as PGUUID
-import uuid
 
 from .database import Base
 
@@ -10,37 +29,267 @@ from .database import Base
 class EventModel(Base):
     __tablename__ = "events"
 
-    id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     name = Column(String(255), nullable=False)
     event_date = Column(Date, nullable=False)
     description = Column(Text, nullable=True)
+    template_id = Column(
+        Uuid,
+        ForeignKey("event_templates.id", ondelete="SET NULL"),
+        nullable=True,
+    )
 
     time_slots = relationship("TimeSlotModel", back_populates="event", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # A template produces at most one event per day, however often generation runs.
+        UniqueConstraint("template_id", "event_date", name="uq_events_template_date"),
+        # Event listings page in (event_date, id) order.
+        Index("ix_events_date_id", "event_date", "id"),
+    )
+
+
+class EventTemplateModel(Base):
+    __tablename__ = "event_templates"
+
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    name = Column(String(255), nullable=False)
+    description = Column(Text, nullable=True)
+    frequency = Column(String(10), nullable=False)
+    interval = Column(Integer, nullable=False, default=1)
+    weekdays = Column(JSON, nullable=False)
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=True)
+    window_start = Column(Time, nullable=False)
+    window_end = Column(Time, nullable=False)
+    slot_capacity = Column(Integer, nullable=False)
+    exceptions = Column(JSON, nullable=False, default=list)
+    generated_until = Column(Date, nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
 
 class TimeSlotModel(Base):
     __tablename__ = "time_slots"
 
-    id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    event_id = Column(PGUUID(as_uuid=True), ForeignKey("events.id"), nullable=False)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    event_id = Column(Uuid, ForeignKey("events.id"), nullable=False, index=True)
     start_time = Column(Time, nullable=False)
     end_time = Column(Time, nullable=False)
     max_capacity = Column(Integer, nullable=False)
     current_bookings = Column(Integer, default=0)
 
     event = relationship("EventModel", back_populates="time_slots")
-    bookings = relationship("BookingModel", back_populates="time_slot", cascade="all, delete-orphan")
+    bookings = relationship(
+        "BookingModel", back_populates="time_slot", cascade="all, delete-orphan"
+    )
 
 
 class BookingModel(Base):
     __tablename__ = "bookings"
 
-    id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     attendee_name = Column(String(255), nullable=False)
-    time_slot_id = Column(PGUUID(as_uuid=True), ForeignKey("time_slots.id"), nullable=False)
+    time_slot_id = Column(Uuid, ForeignKey("time_slots.id"), nullable=False)
     number_of_seats = Column(Integer, nullable=False, default=1)
-    booking_token = Column(String(255), unique=True, nullable=False, index=True)
+    # SHA-256 of the token; the token itself is only ever known to the attendee.
+    booking_token_hash = Column(LargeBinary(32), unique=True, nullable=False, index=True)
     email = Column(String(255), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    group_id = Column(
+        Uuid,
+        ForeignKey("booking_groups.id", ondelete="CASCADE", name="fk_bookings_group_id"),
+        nullable=True,
+        index=True,
+    )
+    # Copied from the time slot so an event's bookings can be paged from one index.
+    event_id = Column(Uuid, ForeignKey("events.id", name="fk_bookings_event_id"), nullable=False)
 
     time_slot = relationship("TimeSlotModel", back_populates="bookings")
+
+    __table_args__ = (
+        # Keyset pagination: each page is one range scan in (created_at, id) order.
+        Index("ix_bookings_slot_created", "time_slot_id", "created_at", "id"),
+        Index("ix_bookings_event_created", "event_id", "created_at", "id"),
+    )
+
+
+class BookingGroupModel(Base):
+    __tablename__ = "booking_groups"
+
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    attendee_name = Column(String(255), nullable=False)
+    number_of_seats = Column(Integer, nullable=False)
+    booking_token_hash = Column(LargeBinary(32), unique=True, nullable=False, index=True)
+    email = Column(String(255), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class OutboxMessageModel(Base):
+    __tablename__ = "notification_outbox"
+
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    kind = Column(String(50), nullable=False)
+    recipient = Column(String(255), nullable=False)
+    payload = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    available_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+    sent_at = Column(DateTime, nullable=True)
+    failed_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # Only pending messages are ever polled, so keep the index to those.
+        Index(
+            "ix_notification_outbox_pending",
+            "available_at",
+            postgresql_where=(sent_at.is_(None) & failed_at.is_(None)),
+            sqlite_where=(sent_at.is_(None) & failed_at.is_(None)),
+        ),
+    )
+
+
+class ChangeLogModel(Base):
+    __tablename__ = "change_log"
+
+    # `id` follows insertion order; `seq` is the feed cursor and is only assigned
+    # after commit, so a reader never skips a change that committed late.
+    # SQLite only auto-increments a column declared exactly INTEGER PRIMARY KEY.
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    seq = Column(BigInteger, nullable=True, unique=True)
+    kind = Column(String(50), nullable=False)
+    payload = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+    __table_args__ = (
+        Index(
+            "ix_change_log_unsequenced",
+            "id",
+            postgresql_where=(seq.is_(None)),
+            sqlite_where=(seq.is_(None)),
+        ),
+    )
+
+
+class EventAvailabilityModel(Base):
+    __tablename__ = "event_availability"
+
+    # Derived from events and time_slots; see AvailabilityRefresher. No foreign
+    # key, since a summary is removed by the refresh after its event is gone.
+    event_id = Column(Uuid, primary_key=True)
+    event_name = Column(String(255), nullable=False)
+    event_date = Column(Date, nullable=False)
+    slot_count = Column(Integer, nullable=False)
+    open_slots = Column(Integer, nullable=False)
+    total_capacity = Column(Integer, nullable=False)
+    booked_seats = Column(Integer, nullable=False)
+    available_seats = Column(Integer, nullable=False)
+    refreshed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        # Date range listings are one range scan in (event_date, event_id) order.
+        Index("ix_event_availability_date", "event_date", "event_id"),
+    )
+
+
+class AvailabilityChangeModel(Base):
+    __tablename__ = "availability_changes"
+
+    # Events whose summary is stale, appended by database triggers on events and
+    # time_slots. Appends never contend, unlike updates to one summary row would.
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    event_id = Column(Uuid, nullable=False)
+
+
+# Triggers the migrations install are attached to their tables as well, so that
+# databases built by create_all (init_db, tests, benchmarks) get them too.
+# Keep both in step.
+
+
+def _after_create(table: Table, dialect: str, *statements: str) -> None:
+    for statement in statements:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect=dialect))
+
+
+# Any write to the catalog notifies every worker to drop its cached listings.
+NOTIFY_CATALOG_CHANGE = """
+    CREATE OR REPLACE FUNCTION notify_catalog_change() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM pg_notify('catalog', 'db:');
+        RETURN NULL;
+    END
+    $$
+"""
+
+for catalog_table in (EventModel.__table__, TimeSlotModel.__table__, BookingModel.__table__):
+    _after_create(
+        catalog_table,
+        "postgresql",
+        NOTIFY_CATALOG_CHANGE,
+        f"CREATE TRIGGER {catalog_table.name}_catalog_change "
+        f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {catalog_table.name} "
+        "FOR EACH STATEMENT EXECUTE FUNCTION notify_catalog_change()",
+    )
+
+
+def _queue_availability_changes(table: Table, event_column: str, watched: Tuple[str, ...]) -> None:
+    """Queue the event id of every write to `table` that can change its availability summary."""
+    name = table.name
+    # Statement-level on PostgreSQL, so a bulk write queues each event once, not once per row.
+    changed = " OR ".join(f"n.{column} IS DISTINCT FROM o.{column}" for column in watched)
+    _after_create(
+        table,
+        "postgresql",
+        f"""
+        CREATE OR REPLACE FUNCTION queue_{name}_availability() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO availability_changes (event_id)
+                SELECT DISTINCT {event_column} FROM new_rows;
+            ELSIF TG_OP = 'DELETE' THEN
+                INSERT INTO availability_changes (event_id)
+                SELECT DISTINCT {event_column} FROM old_rows;
+            ELSE
+                INSERT INTO availability_changes (event_id)
+                SELECT DISTINCT n.{event_column}
+                FROM new_rows n JOIN old_rows o ON o.id = n.id
+                WHERE {changed};
+            END IF;
+            RETURN NULL;
+        END
+        $$
+        """,
+        *(
+            f"CREATE TRIGGER {name}_availability_{operation.lower()} "
+            f"AFTER {operation} ON {name} REFERENCING {referencing} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION queue_{name}_availability()"
+            for operation, referencing in (
+                ("INSERT", "NEW TABLE AS new_rows"),
+                ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+                ("DELETE", "OLD TABLE AS old_rows"),
+            )
+        ),
+    )
+    changed = " OR ".join(f"NEW.{column} IS NOT OLD.{column}" for column in watched)
+    _after_create(
+        table,
+        "sqlite",
+        *(
+            f"CREATE TRIGGER {name}_availability_{operation.split()[0].lower()} "
+            f"AFTER {operation} ON {name} {condition} BEGIN "
+            f"INSERT INTO availability_changes (event_id) VALUES ({row}.{event_column}); "
+            "END"
+            for operation, row, condition in (
+                ("INSERT", "NEW", ""),
+                (f"UPDATE OF {', '.join(watched)}", "NEW", f"WHEN {changed}"),
+                ("DELETE", "OLD", ""),
+            )
+        ),
+    )
+
+
+_queue_availability_changes(EventModel.__table__, "id", ("name", "event_date"))
+_queue_availability_changes(
+    TimeSlotModel.__table__, "event_id", ("max_capacity", "current_bookings")
+)
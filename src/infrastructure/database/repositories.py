@@ -1,14 +1,181 @@
-from datetime import date
-from typing import List, Optional
+import hashlib
+from datetime import date, datetime
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    Uuid,
+    bindparam,
+    case,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from src.domain.entities import Event, TimeSlot, Booking
-from src.domain.repositories import EventRepository, TimeSlotRepository, BookingRepository
-from .models import EventModel, TimeSlotModel, BookingModel
+from src.domain.entities import (
+    Booking,
+    BookingGroup,
+    Change,
+    Event,
+    EventAvailability,
+    EventTemplate,
+    Notification,
+    TimeSlot,
+)
+from src.domain.repositories import (
+    AvailabilityRepository,
+    BookingGroupRepository,
+    BookingRepository,
+    ChangeLogRepository,
+    EventRepository,
+    EventTemplateRepository,
+    NotificationOutbox,
+    TimeSlotRepository,
+)
+
+from .database import IS_SQLITE
+from .models import (
+    AvailabilityChangeModel,
+    BookingGroupModel,
+    BookingModel,
+    ChangeLogModel,
+    EventAvailabilityModel,
+    EventModel,
+    EventTemplateModel,
+    OutboxMessageModel,
+    TimeSlotModel,
+)
+
+
+def token_digest(token: str) -> bytes:
+    """What is stored of a booking token: its SHA-256, never the token itself."""
+    return hashlib.sha256(token.encode()).digest()
+
+
+# Advisory lock serialising change feed sequencing across all workers.
+CHANGE_FEED_LOCK_KEY = 7_301_029
+# Advisory lock serialising availability refreshes, so no summary is written from a stale snapshot.
+AVAILABILITY_LOCK_KEY = 7_301_046
+
+# Moves a booking in one round trip. Both slots are locked in id order first;
+# the booking row is re-checked under its lock, so a booking that moved
+# concurrently is left alone, and seats are only released if they were reserved.
+MOVE_BOOKING_SQL = text("""
+    WITH locked AS (
+        SELECT id FROM time_slots
+        WHERE id IN (:old_slot_id, :new_slot_id)
+        ORDER BY id
+        FOR UPDATE
+    ),
+    booking AS (
+        SELECT id, number_of_seats FROM bookings
+        WHERE id = :booking_id
+          AND time_slot_id = :old_slot_id
+          AND (SELECT count(*) FROM locked) > 0
+        FOR UPDATE
+    ),
+    reserved AS (
+        UPDATE time_slots
+        SET current_bookings = time_slots.current_bookings + booking.number_of_seats
+        FROM booking
+        WHERE time_slots.id = :new_slot_id
+          AND time_slots.current_bookings + booking.number_of_seats <= time_slots.max_capacity
+        RETURNING time_slots.*
+    ),
+    released AS (
+        UPDATE time_slots
+        SET current_bookings = time_slots.current_bookings - booking.number_of_seats
+        FROM booking, reserved
+        WHERE time_slots.id = :old_slot_id
+    ),
+    moved AS (
+        UPDATE bookings
+        SET time_slot_id = reserved.id, event_id = reserved.event_id
+        FROM reserved
+        WHERE bookings.id = :booking_id
+    )
+    SELECT id, event_id, start_time, end_time, max_capacity, current_bookings FROM reserved
+    """).bindparams(
+    bindparam("booking_id", type_=Uuid),
+    bindparam("old_slot_id", type_=Uuid),
+    bindparam("new_slot_id", type_=Uuid),
+)
+
+
+# Sets many slot capacities in one round trip. The requested slots are locked in
+# id order and only updated where the new capacity still covers their bookings;
+# every locked slot comes back, flagged with whether it was changed.
+SET_CAPACITIES_SQL = text("""
+    WITH requested AS (
+        SELECT * FROM unnest(:slot_ids, :capacities) AS requested(id, max_capacity)
+    ),
+    locked AS (
+        SELECT id, event_id, start_time, end_time, max_capacity, current_bookings
+        FROM time_slots
+        WHERE id = ANY(:slot_ids)
+        ORDER BY id
+        FOR UPDATE
+    ),
+    changed AS (
+        UPDATE time_slots
+        SET max_capacity = requested.max_capacity
+        FROM requested, locked
+        WHERE time_slots.id = requested.id
+          AND locked.id = requested.id
+          AND requested.max_capacity <> locked.max_capacity
+          AND requested.max_capacity >= locked.current_bookings
+        RETURNING time_slots.id, time_slots.event_id, time_slots.start_time,
+                  time_slots.end_time, time_slots.max_capacity, time_slots.current_bookings
+    )
+    SELECT *, true AS changed FROM changed
+    UNION ALL
+    SELECT *, false FROM locked WHERE id NOT IN (SELECT id FROM changed)
+    """).bindparams(
+    bindparam("slot_ids", type_=ARRAY(Uuid)),
+    bindparam("capacities", type_=ARRAY(Integer)),
+)
+
+# The hottest statements, built once. Their compiled SQL is looked up by a cache
+# key memoized on the statement itself, and the SQL text stays the same, so the
+# driver's prepared statement is reused too.
+_slots = TimeSlotModel.__table__
+SLOT_BY_ID = select(_slots).where(_slots.c.id == bindparam("slot_id"))
+RESERVE_SPOTS = (
+    update(_slots)
+    .where(_slots.c.id == bindparam("slot_id"))
+    .where(_slots.c.current_bookings + bindparam("seats", type_=Integer) <= _slots.c.max_capacity)
+    .values(current_bookings=_slots.c.current_bookings + bindparam("seats", type_=Integer))
+)
+RELEASE_SPOTS = (
+    update(_slots)
+    .where(_slots.c.id == bindparam("slot_id"))
+    .where(_slots.c.current_bookings - bindparam("seats", type_=Integer) >= 0)
+    .values(current_bookings=_slots.c.current_bookings - bindparam("seats", type_=Integer))
+)
+BOOKING_BY_TOKEN_HASH = select(BookingModel).where(
+    BookingModel.booking_token_hash == bindparam("token_hash")
+)
+
+
+def _slot_from_row(row) -> TimeSlot:
+    return TimeSlot(
+        event_id=row.event_id,
+        start_time=row.start_time,
+        end_time=row.end_time,
+        max_capacity=row.max_capacity,
+        current_bookings=row.current_bookings,
+        slot_id=row.id,
+    )
 
 
 class SQLAlchemyEventRepository(EventRepository):
@@ -24,6 +191,7 @@ class SQLAlchemyEventRepository(EventRepository):
             event_date=model.event_date,
             description=model.description,
             event_id=model.id,
+            template_id=model.template_id,
         )
         for slot_model in model.time_slots:
             slot = TimeSlot(
@@ -44,17 +212,13 @@ class SQLAlchemyEventRepository(EventRepository):
             name=entity.name,
             event_date=entity.event_date,
             description=entity.description,
+            template_id=entity.template_id,
         )
 
     async def create(self, event: Event) -> Event:
         model = self._to_model(event)
         self.session.add(model)
-        if self.session.in_transaction():
-            await self.session.flush()
-        else:
-            await self.session.commit()
-        await self.session.refresh(model)
-        return self._to_entity(model)
+        return event
 
     async def get_by_id(self, event_id: UUID) -> Optional[Event]:
         stmt = (
@@ -82,6 +246,31 @@ class SQLAlchemyEventRepository(EventRepository):
         models = result.scalars().all()
         return [self._to_entity(model) for model in models]
 
+    async def get_page(
+        self,
+        after: Optional[Tuple[date, UUID]] = None,
+        limit: int = 100,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[Event]:
+        stmt = select(EventModel).options(selectinload(EventModel.time_slots))
+        if after is not None:
+            stmt = stmt.where(tuple_(EventModel.event_date, EventModel.id) > after)
+        if start_date is not None:
+            stmt = stmt.where(EventModel.event_date >= start_date)
+        if end_date is not None:
+            stmt = stmt.where(EventModel.event_date <= end_date)
+        stmt = stmt.order_by(EventModel.event_date, EventModel.id).limit(limit)
+        result = await self.session.execute(stmt)
+        return [self._to_entity(model) for model in result.scalars()]
+
+    async def find_existing(self, keys: List[Tuple[str, date]]) -> Set[Tuple[str, date]]:
+        stmt = select(EventModel.name, EventModel.event_date).where(
+            tuple_(EventModel.name, EventModel.event_date).in_(keys)
+        )
+        result = await self.session.execute(stmt)
+        return {(name, event_date) for name, event_date in result}
+
     async def update(self, event: Event) -> Event:
         stmt = select(EventModel).where(EventModel.id == event.id)
         result = await self.session.execute(stmt)
@@ -90,26 +279,25 @@ class SQLAlchemyEventRepository(EventRepository):
             model.name = event.name
             model.event_date = event.event_date
             model.description = event.description
-            if self.session.in_transaction():
-                await self.session.flush()
-            else:
-                await self.session.commit()
-            await self.session.refresh(model)
-            return self._to_entity(model)
+            return event
         raise ValueError("Event not found")
 
     async def delete(self, event_id: UUID) -> bool:
-        stmt = select(EventModel).where(EventModel.id == event_id)
-        result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-        if model:
-            await self.session.delete(model)
-            if self.session.in_transaction():
-                await self.session.flush()
-            else:
-                await self.session.commit()
-            return True
-        return False
+        # Set-based, children first: an ORM cascade would load and delete every
+        # slot and booking one row at a time. Groups take their bookings along.
+        event_bookings = select(BookingModel.group_id).where(BookingModel.event_id == event_id)
+        for stmt in (
+            delete(BookingGroupModel).where(BookingGroupModel.id.in_(event_bookings)),
+            delete(BookingModel).where(BookingModel.event_id == event_id),
+            delete(TimeSlotModel).where(TimeSlotModel.event_id == event_id),
+        ):
+            await self.session.execute(stmt.execution_options(synchronize_session=False))
+        result = await self.session.execute(
+            delete(EventModel)
+            .where(EventModel.id == event_id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
 
 
 class SQLAlchemyTimeSlotRepository(TimeSlotRepository):
@@ -143,18 +331,12 @@ class SQLAlchemyTimeSlotRepository(TimeSlotRepository):
     async def create(self, time_slot: TimeSlot) -> TimeSlot:
         model = self._to_model(time_slot)
         self.session.add(model)
-        if self.session.in_transaction():
-            await self.session.flush()
-        else:
-            await self.session.commit()
-        await self.session.refresh(model)
-        return self._to_entity(model)
+        return time_slot
 
     async def get_by_id(self, slot_id: UUID) -> Optional[TimeSlot]:
-        stmt = select(TimeSlotModel).where(TimeSlotModel.id == slot_id)
-        result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-        return self._to_entity(model) if model else None
+        result = await self.session.execute(SLOT_BY_ID, {"slot_id": slot_id})
+        row = result.one_or_none()
+        return _slot_from_row(row) if row else None
 
     async def get_by_event_id(self, event_id: UUID) -> List[TimeSlot]:
         stmt = select(TimeSlotModel).where(TimeSlotModel.event_id == event_id)
@@ -171,44 +353,141 @@ class SQLAlchemyTimeSlotRepository(TimeSlotRepository):
             model.end_time = time_slot.end_time
             model.max_capacity = time_slot.max_capacity
             model.current_bookings = time_slot.current_bookings
-            if self.session.in_transaction():
-                await self.session.flush()
-            else:
-                await self.session.commit()
-            await self.session.refresh(model)
-            return self._to_entity(model)
+            return time_slot
         raise ValueError("TimeSlot not found")
 
     async def reserve_spots(self, slot_id: UUID, seats: int) -> bool:
         if seats <= 0:
             return False
+        result = await self.session.execute(RESERVE_SPOTS, {"slot_id": slot_id, "seats": seats})
+        return result.rowcount == 1
+
+    async def reserve_spots_together(self, slot_ids: List[UUID], seats: int) -> List[TimeSlot]:
+        if seats <= 0 or not slot_ids:
+            return []
+        # The CTE takes the row locks in id order before anything is updated, and
+        # sees the rows as they are once locked; the update only goes ahead if
+        # every slot was found with room to spare.
+        locked = (
+            select(
+                TimeSlotModel.id,
+                TimeSlotModel.current_bookings,
+                TimeSlotModel.max_capacity,
+            )
+            .where(TimeSlotModel.id.in_(slot_ids))
+            .order_by(TimeSlotModel.id)
+            .with_for_update()
+            .cte("locked")
+        )
+        available = (
+            select(func.count())
+            .select_from(locked)
+            .where(locked.c.current_bookings + seats <= locked.c.max_capacity)
+            .scalar_subquery()
+        )
         stmt = (
             update(TimeSlotModel)
-            .where(TimeSlotModel.id == slot_id)
-            .where(TimeSlotModel.current_bookings + seats <= TimeSlotModel.max_capacity)
+            .where(TimeSlotModel.id.in_(select(locked.c.id)))
+            .where(available == len(slot_ids))
             .values(current_bookings=TimeSlotModel.current_bookings + seats)
+            .returning(
+                TimeSlotModel.id,
+                TimeSlotModel.event_id,
+                TimeSlotModel.start_time,
+                TimeSlotModel.end_time,
+                TimeSlotModel.max_capacity,
+                TimeSlotModel.current_bookings,
+            )
         )
         result = await self.session.execute(stmt)
-        if self.session.in_transaction():
-            await self.session.flush()
-        else:
-            await self.session.commit()
-        return result.rowcount == 1
+        return [_slot_from_row(row) for row in result]
+
+    async def set_capacities(
+        self, capacities: Dict[UUID, int]
+    ) -> Tuple[List[TimeSlot], List[TimeSlot]]:
+        if not capacities:
+            return [], []
+        if IS_SQLITE:
+            # No data-modifying CTEs; the unit holds the write lock, so reads are current.
+            return await self._set_capacities_in_steps(capacities)
+        result = await self.session.execute(
+            SET_CAPACITIES_SQL,
+            {"slot_ids": list(capacities), "capacities": list(capacities.values())},
+        )
+        changed: List[TimeSlot] = []
+        unchanged: List[TimeSlot] = []
+        for row in result:
+            (changed if row.changed else unchanged).append(_slot_from_row(row))
+        return changed, unchanged
+
+    async def _set_capacities_in_steps(
+        self, capacities: Dict[UUID, int]
+    ) -> Tuple[List[TimeSlot], List[TimeSlot]]:
+        table = TimeSlotModel.__table__
+        result = await self.session.execute(select(table).where(table.c.id.in_(list(capacities))))
+        changed: List[TimeSlot] = []
+        unchanged: List[TimeSlot] = []
+        for time_slot in map(_slot_from_row, result):
+            capacity = capacities[time_slot.id]
+            if capacity == time_slot.max_capacity or capacity < time_slot.current_bookings:
+                unchanged.append(time_slot)
+            else:
+                time_slot.max_capacity = capacity
+                changed.append(time_slot)
+        if changed:
+            await self.session.execute(
+                update(table)
+                .where(table.c.id == bindparam("slot_id"))
+                .values(max_capacity=bindparam("capacity")),
+                [{"slot_id": slot.id, "capacity": slot.max_capacity} for slot in changed],
+            )
+        return changed, unchanged
+
+    async def reconcile_bookings(
+        self, after: Optional[UUID], limit: int, fix: bool
+    ) -> Tuple[List[UUID], List[Tuple[UUID, Optional[int], int]]]:
+        """
+        Compare the booked seat counters of the next slots after `after` with their bookings.
+
+        Must run inside a transaction. The slots are locked before their
+        bookings are summed, so a change in flight is never seen half done;
+        slots a booking holds right now are skipped and left to the next pass.
+        With `fix`, drifted counters are set to the sum. Returns the ids of the
+        slots checked and (slot id, recorded, booked) for every drifted one.
+        """
+        stmt = select(TimeSlotModel.id).order_by(TimeSlotModel.id).limit(limit)
+        if after is not None:
+            stmt = stmt.where(TimeSlotModel.id > after)
+        if not IS_SQLITE:
+            # SQLite's writer already has the whole database to itself.
+            stmt = stmt.with_for_update(skip_locked=True)
+        slot_ids = list(await self.session.scalars(stmt))
+        if not slot_ids:
+            return [], []
+
+        booked = func.coalesce(func.sum(BookingModel.number_of_seats), 0)
+        result = await self.session.execute(
+            select(TimeSlotModel.id, TimeSlotModel.current_bookings, booked)
+            .outerjoin(BookingModel, BookingModel.time_slot_id == TimeSlotModel.id)
+            .where(TimeSlotModel.id.in_(slot_ids))
+            .group_by(TimeSlotModel.id, TimeSlotModel.current_bookings)
+            .having(booked != func.coalesce(TimeSlotModel.current_bookings, -1))
+        )
+        drifted = [tuple(row) for row in result]
+        if fix and drifted:
+            table = TimeSlotModel.__table__
+            await self.session.execute(
+                update(table)
+                .where(table.c.id == bindparam("slot_id"))
+                .values(current_bookings=bindparam("booked")),
+                [{"slot_id": slot_id, "booked": seats} for slot_id, _, seats in drifted],
+            )
+        return slot_ids, drifted
 
     async def release_spots(self, slot_id: UUID, seats: int) -> None:
         if seats <= 0:
             return
-        stmt = (
-            update(TimeSlotModel)
-            .where(TimeSlotModel.id == slot_id)
-            .where(TimeSlotModel.current_bookings - seats >= 0)
-            .values(current_bookings=TimeSlotModel.current_bookings - seats)
-        )
-        await self.session.execute(stmt)
-        if self.session.in_transaction():
-            await self.session.flush()
-        else:
-            await self.session.commit()
+        await self.session.execute(RELEASE_SPOTS, {"slot_id": slot_id, "seats": seats})
 
     async def delete(self, slot_id: UUID) -> bool:
         stmt = select(TimeSlotModel).where(TimeSlotModel.id == slot_id)
@@ -216,10 +495,6 @@ class SQLAlchemyTimeSlotRepository(TimeSlotRepository):
         model = result.scalar_one_or_none()
         if model:
             await self.session.delete(model)
-            if self.session.in_transaction():
-                await self.session.flush()
-            else:
-                await self.session.commit()
             return True
         return False
 
@@ -230,17 +505,21 @@ class SQLAlchemyBookingRepository(BookingRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    def _to_entity(self, model: BookingModel) -> Booking:
+    def _to_entity(self, model: BookingModel, token: Optional[str] = None) -> Booking:
         """Convert model to entity."""
-        return Booking(
+        booking = Booking(
             attendee_name=model.attendee_name,
             time_slot_id=model.time_slot_id,
             number_of_seats=model.number_of_seats,
-            booking_token=model.booking_token,
             booking_id=model.id,
             created_at=model.created_at,
             email=model.email,
+            group_id=model.group_id,
+            event_id=model.event_id,
         )
+        # Only the token's digest is stored, so the token is known only to a lookup by token.
+        booking.booking_token = token
+        return booking
 
     def _to_model(self, entity: Booking) -> BookingModel:
         """Convert entity to model."""
@@ -249,20 +528,17 @@ class SQLAlchemyBookingRepository(BookingRepository):
             attendee_name=entity.attendee_name,
             time_slot_id=entity.time_slot_id,
             number_of_seats=entity.number_of_seats,
-            booking_token=entity.booking_token,
+            booking_token_hash=token_digest(entity.booking_token),
             email=entity.email,
             created_at=entity.created_at,
+            group_id=entity.group_id,
+            event_id=entity.event_id,
         )
 
     async def create(self, booking: Booking) -> Booking:
         model = self._to_model(booking)
         self.session.add(model)
-        if self.session.in_transaction():
-            await self.session.flush()
-        else:
-            await self.session.commit()
-        await self.session.refresh(model)
-        return self._to_entity(model)
+        return booking
 
     async def get_by_id(self, booking_id: UUID) -> Optional[Booking]:
         stmt = select(BookingModel).where(BookingModel.id == booking_id)
@@ -271,10 +547,11 @@ class SQLAlchemyBookingRepository(BookingRepository):
         return self._to_entity(model) if model else None
 
     async def get_by_token(self, token: str) -> Optional[Booking]:
-        stmt = select(BookingModel).where(BookingModel.booking_token == token)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(
+            BOOKING_BY_TOKEN_HASH, {"token_hash": token_digest(token)}
+        )
         model = result.scalar_one_or_none()
-        return self._to_entity(model) if model else None
+        return self._to_entity(model, token) if model else None
 
     async def get_by_time_slot_id(self, time_slot_id: UUID) -> List[Booking]:
         stmt = select(BookingModel).where(BookingModel.time_slot_id == time_slot_id)
@@ -282,6 +559,44 @@ class SQLAlchemyBookingRepository(BookingRepository):
         models = result.scalars().all()
         return [self._to_entity(model) for model in models]
 
+    async def get_page_by_time_slot_id(
+        self,
+        time_slot_id: UUID,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 100,
+        name_prefix: Optional[str] = None,
+    ) -> List[Booking]:
+        return await self._get_page(
+            BookingModel.time_slot_id == time_slot_id, after, limit, name_prefix
+        )
+
+    async def get_page_by_event_id(
+        self,
+        event_id: UUID,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 100,
+        name_prefix: Optional[str] = None,
+    ) -> List[Booking]:
+        return await self._get_page(BookingModel.event_id == event_id, after, limit, name_prefix)
+
+    async def _get_page(
+        self,
+        condition,
+        after: Optional[Tuple[datetime, UUID]],
+        limit: int,
+        name_prefix: Optional[str],
+    ) -> List[Booking]:
+        # The row comparison continues the (key, created_at, id) index range
+        # where the previous page stopped; the name prefix only filters it.
+        stmt = select(BookingModel).where(condition)
+        if after is not None:
+            stmt = stmt.where(tuple_(BookingModel.created_at, BookingModel.id) > after)
+        if name_prefix:
+            stmt = stmt.where(BookingModel.attendee_name.istartswith(name_prefix, autoescape=True))
+        stmt = stmt.order_by(BookingModel.created_at, BookingModel.id).limit(limit)
+        result = await self.session.execute(stmt)
+        return [self._to_entity(model) for model in result.scalars()]
+
     async def update(self, booking: Booking) -> Booking:
         stmt = select(BookingModel).where(BookingModel.id == booking.id)
         result = await self.session.execute(stmt)
@@ -291,23 +606,517 @@ class SQLAlchemyBookingRepository(BookingRepository):
             model.time_slot_id = booking.time_slot_id
             model.number_of_seats = booking.number_of_seats
             model.email = booking.email
-            if self.session.in_transaction():
-                await self.session.flush()
-            else:
-                await self.session.commit()
-            await self.session.refresh(model)
-            return self._to_entity(model)
+            if booking.event_id:
+                model.event_id = booking.event_id
+            return booking
         raise ValueError("Booking not found")
 
+    async def move(self, booking: Booking, new_time_slot_id: UUID) -> Optional[TimeSlot]:
+        if IS_SQLITE:
+            # SQLite has no data-modifying CTEs, and its writers never interleave.
+            return await self._move_in_steps(booking, new_time_slot_id)
+        row = (
+            await self.session.execute(
+                MOVE_BOOKING_SQL,
+                {
+                    "booking_id": booking.id,
+                    "old_slot_id": booking.time_slot_id,
+                    "new_slot_id": new_time_slot_id,
+                },
+            )
+        ).first()
+        return _slot_from_row(row) if row else None
+
+    async def _move_in_steps(self, booking: Booking, new_time_slot_id: UUID) -> Optional[TimeSlot]:
+        # The unit began with the write lock, so the booking read earlier in it is current.
+        seats = booking.number_of_seats
+        row = (
+            await self.session.execute(
+                update(TimeSlotModel)
+                .where(TimeSlotModel.id == new_time_slot_id)
+                .where(TimeSlotModel.current_bookings + seats <= TimeSlotModel.max_capacity)
+                .values(current_bookings=TimeSlotModel.current_bookings + seats)
+                .returning(
+                    TimeSlotModel.id,
+                    TimeSlotModel.event_id,
+                    TimeSlotModel.start_time,
+                    TimeSlotModel.end_time,
+                    TimeSlotModel.max_capacity,
+                    TimeSlotModel.current_bookings,
+                )
+            )
+        ).first()
+        if row is None:
+            return None
+        await self.session.execute(
+            update(TimeSlotModel)
+            .where(TimeSlotModel.id == booking.time_slot_id)
+            .values(current_bookings=TimeSlotModel.current_bookings - seats)
+        )
+        await self.session.execute(
+            update(BookingModel)
+            .where(BookingModel.id == booking.id)
+            .values(time_slot_id=new_time_slot_id, event_id=row.event_id)
+        )
+        return _slot_from_row(row)
+
     async def delete(self, booking_id: UUID) -> bool:
         stmt = select(BookingModel).where(BookingModel.id == booking_id)
         result = await self.session.execute(stmt)
         model = result.scalar_one_or_none()
         if model:
             await self.session.delete(model)
-            if self.session.in_transaction():
-                await self.session.flush()
-            else:
-                await self.session.commit()
             return True
         return False
+
+    async def delete_by_event(
+        self, event_id: UUID, chunk_size: int = 1000
+    ) -> AsyncIterator[List[Booking]]:
+        # Slots before the event, as bookings and moves lock them, so none of those can deadlock
+        # with this; the event lock keeps slots from being added meanwhile.
+        await self.session.execute(
+            select(TimeSlotModel.id)
+            .where(TimeSlotModel.event_id == event_id)
+            .order_by(TimeSlotModel.id)
+            .with_for_update()
+        )
+        locked = await self.session.scalar(
+            select(EventModel.id).where(EventModel.id == event_id).with_for_update()
+        )
+        if locked is None:
+            return
+
+        # One statement per chunk, so neither side holds more than a chunk of rows.
+        chunk = select(BookingModel.id).where(BookingModel.event_id == event_id).limit(chunk_size)
+        stmt = (
+            delete(BookingModel)
+            .where(BookingModel.id.in_(chunk))
+            .returning(
+                BookingModel.id,
+                BookingModel.attendee_name,
+                BookingModel.time_slot_id,
+                BookingModel.number_of_seats,
+                BookingModel.email,
+                BookingModel.created_at,
+                BookingModel.group_id,
+                BookingModel.event_id,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        group_ids = set()
+        while True:
+            rows = (await self.session.execute(stmt)).all()
+            if rows:
+                # The rows carry the model's attribute names, so they convert like models.
+                bookings = [self._to_entity(row) for row in rows]
+                group_ids.update(booking.group_id for booking in bookings if booking.group_id)
+                yield bookings
+            if len(rows) < chunk_size:
+                break
+        # Only once all bookings are gone: a group's cascade would take members not yet returned.
+        groups = sorted(group_ids)
+        for start in range(0, len(groups), chunk_size):
+            await self.session.execute(
+                delete(BookingGroupModel)
+                .where(BookingGroupModel.id.in_(groups[start : start + chunk_size]))
+                .execution_options(synchronize_session=False)
+            )
+
+
+class SQLAlchemyBookingGroupRepository(BookingGroupRepository):
+    """SQLAlchemy implementation of BookingGroupRepository."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.bookings = SQLAlchemyBookingRepository(session)
+
+    async def create(self, group: BookingGroup) -> BookingGroup:
+        self.session.add(
+            BookingGroupModel(
+                id=group.id,
+                attendee_name=group.attendee_name,
+                number_of_seats=group.number_of_seats,
+                booking_token_hash=token_digest(group.booking_token),
+                email=group.email,
+                created_at=group.created_at,
+            )
+        )
+        for booking in group.bookings:
+            await self.bookings.create(booking)
+        return group
+
+    async def get_by_token(self, token: str) -> Optional[BookingGroup]:
+        stmt = select(BookingGroupModel).where(
+            BookingGroupModel.booking_token_hash == token_digest(token)
+        )
+        model = (await self.session.execute(stmt)).scalar_one_or_none()
+        if not model:
+            return None
+        members = await self.session.execute(
+            select(BookingModel)
+            .join(TimeSlotModel, TimeSlotModel.id == BookingModel.time_slot_id)
+            .where(BookingModel.group_id == model.id)
+            .order_by(TimeSlotModel.start_time, TimeSlotModel.id)
+        )
+        return BookingGroup(
+            attendee_name=model.attendee_name,
+            number_of_seats=model.number_of_seats,
+            bookings=[self.bookings._to_entity(member) for member in members.scalars()],
+            booking_token=token,
+            group_id=model.id,
+            created_at=model.created_at,
+            email=model.email,
+        )
+
+    async def delete(self, group_id: UUID) -> bool:
+        # Members first and explicitly, so SQLite needs no cascade; a concurrent
+        # delete of the same group waits on their row locks and then finds nothing.
+        await self.session.execute(delete(BookingModel).where(BookingModel.group_id == group_id))
+        result = await self.session.execute(
+            delete(BookingGroupModel).where(BookingGroupModel.id == group_id)
+        )
+        return result.rowcount == 1
+
+
+class SQLAlchemyNotificationOutbox(NotificationOutbox):
+    """SQLAlchemy implementation of NotificationOutbox."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def enqueue(self, notification: Notification) -> None:
+        self.session.add(
+            OutboxMessageModel(
+                id=notification.id,
+                kind=notification.kind,
+                recipient=notification.recipient,
+                payload=notification.payload,
+                created_at=notification.created_at,
+                available_at=notification.created_at,
+            )
+        )
+
+
+class SQLAlchemyChangeLogRepository(ChangeLogRepository):
+    """SQLAlchemy implementation of ChangeLogRepository."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def _to_entity(self, model: ChangeLogModel) -> Change:
+        """Convert model to entity."""
+        return Change(
+            kind=model.kind,
+            payload=model.payload,
+            seq=model.seq,
+            occurred_at=model.created_at,
+        )
+
+    async def append(self, change: Change) -> None:
+        self.session.add(
+            ChangeLogModel(kind=change.kind, payload=change.payload, created_at=change.occurred_at)
+        )
+
+    async def get_after(self, after: int, limit: int) -> List[Change]:
+        stmt = (
+            select(ChangeLogModel)
+            .where(ChangeLogModel.seq > after)
+            .order_by(ChangeLogModel.seq)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return [self._to_entity(model) for model in result.scalars().all()]
+
+    async def sequence_pending(self, limit: int = 10_000, wait: bool = True) -> int:
+        """
+        Give committed, unsequenced changes the next feed sequence numbers.
+
+        Sequence numbers are handed out under a transaction-level advisory lock,
+        so they are committed strictly in order and a cursor never jumps past a
+        change that becomes visible later. Must run inside a transaction; with
+        `wait=False` it returns 0 immediately if another worker holds the lock.
+        SQLite needs no lock since its writers are serialized anyway.
+        """
+        if not IS_SQLITE:
+            lock = "pg_advisory_xact_lock" if wait else "pg_try_advisory_xact_lock"
+            acquired = await self.session.scalar(
+                text(f"SELECT {lock}(:key)").bindparams(key=CHANGE_FEED_LOCK_KEY)
+            )
+            if acquired is False:
+                return 0
+        result = await self.session.execute(text("""
+                WITH base AS (
+                    SELECT COALESCE(MAX(seq), 0) AS seq FROM change_log
+                ),
+                pending AS (
+                    SELECT id, row_number() OVER (ORDER BY id) AS n
+                    FROM (
+                        SELECT id FROM change_log WHERE seq IS NULL ORDER BY id LIMIT :limit
+                    ) unsequenced
+                )
+                UPDATE change_log
+                SET seq = base.seq + pending.n
+                FROM base, pending
+                WHERE change_log.id = pending.id
+                """).bindparams(limit=limit))
+        return result.rowcount
+
+    async def prune(self, before: datetime, batch_size: int = 10_000) -> int:
+        """Delete one batch of sequenced changes older than `before`; returns rows deleted."""
+        newest = select(func.max(ChangeLogModel.seq)).scalar_subquery()
+        expired = (
+            select(ChangeLogModel.id)
+            .where(
+                ChangeLogModel.created_at < before,
+                # The newest entry always survives so sequence numbers keep growing.
+                ChangeLogModel.seq < newest,
+            )
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            delete(ChangeLogModel).where(ChangeLogModel.id.in_(expired))
+        )
+        return result.rowcount
+
+
+class SQLAlchemyEventTemplateRepository(EventTemplateRepository):
+    """SQLAlchemy implementation of EventTemplateRepository."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def _to_entity(self, model: EventTemplateModel) -> EventTemplate:
+        """Convert model to entity."""
+        return EventTemplate(
+            name=model.name,
+            description=model.description,
+            frequency=model.frequency,
+            interval=model.interval,
+            weekdays=model.weekdays,
+            start_date=model.start_date,
+            end_date=model.end_date,
+            window_start=model.window_start,
+            window_end=model.window_end,
+            slot_capacity=model.slot_capacity,
+            exceptions=[date.fromisoformat(day) for day in model.exceptions],
+            generated_until=model.generated_until,
+            template_id=model.id,
+            created_at=model.created_at,
+        )
+
+    def _to_model(self, entity: EventTemplate) -> EventTemplateModel:
+        """Convert entity to model."""
+        return EventTemplateModel(
+            id=entity.id,
+            name=entity.name,
+            description=entity.description,
+            frequency=entity.frequency,
+            interval=entity.interval,
+            weekdays=entity.weekdays,
+            start_date=entity.start_date,
+            end_date=entity.end_date,
+            window_start=entity.window_start,
+            window_end=entity.window_end,
+            slot_capacity=entity.slot_capacity,
+            exceptions=[day.isoformat() for day in entity.exceptions],
+            generated_until=entity.generated_until,
+            created_at=entity.created_at,
+        )
+
+    async def create(self, template: EventTemplate) -> EventTemplate:
+        model = self._to_model(template)
+        self.session.add(model)
+        return template
+
+    async def get_by_id(self, template_id: UUID) -> Optional[EventTemplate]:
+        model = await self.session.get(EventTemplateModel, template_id)
+        return self._to_entity(model) if model else None
+
+    async def get_for_update(self, template_id: UUID) -> Optional[EventTemplate]:
+        stmt = (
+            select(EventTemplateModel).where(EventTemplateModel.id == template_id).with_for_update()
+        )
+        result = await self.session.execute(stmt)
+        model = result.scalar_one_or_none()
+        return self._to_entity(model) if model else None
+
+    async def get_all(self) -> List[EventTemplate]:
+        stmt = select(EventTemplateModel).order_by(EventTemplateModel.created_at)
+        result = await self.session.execute(stmt)
+        return [self._to_entity(model) for model in result.scalars().all()]
+
+    async def claim_due(self, until: date, limit: int) -> List[EventTemplate]:
+        stmt = (
+            select(EventTemplateModel)
+            .where(
+                EventTemplateModel.generated_until < until,
+                (EventTemplateModel.end_date.is_(None))
+                | (EventTemplateModel.generated_until < EventTemplateModel.end_date),
+            )
+            .order_by(EventTemplateModel.generated_until)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(stmt)
+        return [self._to_entity(model) for model in result.scalars().all()]
+
+    async def update(self, template: EventTemplate) -> EventTemplate:
+        await self.session.execute(
+            update(EventTemplateModel)
+            .where(EventTemplateModel.id == template.id)
+            .values(
+                exceptions=[day.isoformat() for day in template.exceptions],
+                generated_until=template.generated_until,
+            )
+        )
+        return template
+
+    async def delete(self, template_id: UUID) -> bool:
+        result = await self.session.execute(
+            delete(EventTemplateModel).where(EventTemplateModel.id == template_id)
+        )
+        return result.rowcount > 0
+
+    async def remove_unbooked_event(self, template_id: UUID, event_date: date) -> bool:
+        event_id = await self.session.scalar(
+            select(EventModel.id).where(
+                EventModel.template_id == template_id, EventModel.event_date == event_date
+            )
+        )
+        if event_id is None:
+            return True
+        # Slots before the event, as bookings, moves and event cancellation lock them. With
+        # the slots locked no booking can be added, so the check below holds until the delete.
+        await self.session.execute(
+            select(TimeSlotModel.id)
+            .where(TimeSlotModel.event_id == event_id)
+            .order_by(TimeSlotModel.id)
+            .with_for_update()
+        )
+        if (
+            await self.session.scalar(
+                select(EventModel.id).where(EventModel.id == event_id).with_for_update()
+            )
+            is None
+        ):
+            return True
+        booked = select(TimeSlotModel.id).where(
+            TimeSlotModel.event_id == event_id, TimeSlotModel.current_bookings > 0
+        )
+        has_bookings = select(BookingModel.id).where(BookingModel.event_id == event_id)
+        if await self.session.scalar(select(booked.exists() | has_bookings.exists())):
+            return False
+        await self.session.execute(delete(TimeSlotModel).where(TimeSlotModel.event_id == event_id))
+        await self.session.execute(delete(EventModel).where(EventModel.id == event_id))
+        return True
+
+
+class SQLAlchemyAvailabilityRepository(AvailabilityRepository):
+    """SQLAlchemy implementation of AvailabilityRepository over the event_availability table."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def _to_entity(self, model: EventAvailabilityModel) -> EventAvailability:
+        """Convert model to entity."""
+        return EventAvailability(
+            event_id=model.event_id,
+            event_name=model.event_name,
+            event_date=model.event_date,
+            slot_count=model.slot_count,
+            open_slots=model.open_slots,
+            total_capacity=model.total_capacity,
+            booked_seats=model.booked_seats,
+            available_seats=model.available_seats,
+            refreshed_at=model.refreshed_at,
+        )
+
+    async def get_page(
+        self,
+        after: Optional[Tuple[date, UUID]] = None,
+        limit: int = 100,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[EventAvailability]:
+        summary = EventAvailabilityModel
+        stmt = select(summary)
+        if after is not None:
+            stmt = stmt.where(tuple_(summary.event_date, summary.event_id) > after)
+        if start_date is not None:
+            stmt = stmt.where(summary.event_date >= start_date)
+        if end_date is not None:
+            stmt = stmt.where(summary.event_date <= end_date)
+        stmt = stmt.order_by(summary.event_date, summary.event_id).limit(limit)
+        result = await self.session.execute(stmt)
+        return [self._to_entity(model) for model in result.scalars()]
+
+    async def refresh_pending(self, limit: int = 1000) -> Tuple[int, int]:
+        """
+        Fold up to `limit` queued changes into the summaries of their events.
+
+        The oldest queued changes are claimed and deleted, and the summary of
+        each event they name is recomputed from its slots, or dropped if the
+        event is gone. Must run inside a transaction; refreshes take turns
+        under a transaction-level advisory lock, and this returns (0, 0) at
+        once if another worker holds it. Returns the number of changes folded
+        and of events refreshed.
+        """
+        if not IS_SQLITE and not await self.session.scalar(
+            text("SELECT pg_try_advisory_xact_lock(:key)").bindparams(key=AVAILABILITY_LOCK_KEY)
+        ):
+            return 0, 0
+        claimed = (
+            select(AvailabilityChangeModel.id).order_by(AvailabilityChangeModel.id).limit(limit)
+        )
+        result = await self.session.execute(
+            delete(AvailabilityChangeModel)
+            .where(AvailabilityChangeModel.id.in_(claimed))
+            .returning(AvailabilityChangeModel.event_id)
+            # Otherwise the ORM adds the primary key to RETURNING, ahead of event_id.
+            .execution_options(synchronize_session=False)
+        )
+        event_ids = result.scalars().all()
+        if not event_ids:
+            return 0, 0
+        stale = set(event_ids)
+
+        slot = TimeSlotModel
+        booked = func.coalesce(slot.current_bookings, 0)
+        is_open = slot.max_capacity > booked
+        summaries = (
+            select(
+                EventModel.id,
+                EventModel.name,
+                EventModel.event_date,
+                func.count(slot.id),
+                func.coalesce(func.sum(case((is_open, 1), else_=0)), 0),
+                func.coalesce(func.sum(slot.max_capacity), 0),
+                func.coalesce(func.sum(booked), 0),
+                func.coalesce(func.sum(case((is_open, slot.max_capacity - booked), else_=0)), 0),
+                literal(datetime.utcnow(), DateTime),
+            )
+            .outerjoin(slot, slot.event_id == EventModel.id)
+            .where(EventModel.id.in_(stale))
+            .group_by(EventModel.id, EventModel.name, EventModel.event_date)
+        )
+        await self.session.execute(
+            delete(EventAvailabilityModel).where(EventAvailabilityModel.event_id.in_(stale))
+        )
+        await self.session.execute(
+            insert(EventAvailabilityModel).from_select(
+                [
+                    "event_id",
+                    "event_name",
+                    "event_date",
+                    "slot_count",
+                    "open_slots",
+                    "total_capacity",
+                    "booked_seats",
+                    "available_seats",
+                    "refreshed_at",
+                ],
+                summaries,
+            )
+        )
+        return len(event_ids), len(stale)
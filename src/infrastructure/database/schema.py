@@ -0,0 +1,91 @@
+import ast
+import logging
+import os
+from pathlib import Path
+from typing import Set
+
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# What to do at startup when the database is not at the latest migration:
+# "fail" refuses to start, "warn" logs and carries on, "off" skips the check.
+DB_SCHEMA_CHECK = os.getenv("DB_SCHEMA_CHECK", "fail").lower()
+
+MIGRATIONS_PATH = Path(
+    os.getenv("MIGRATIONS_PATH", str(Path(__file__).resolve().parents[3] / "alembic" / "versions"))
+)
+
+VERSION_TABLE = "alembic_version"
+
+
+class SchemaOutOfDate(RuntimeError):
+    """The database revision does not match the migrations shipped with the code."""
+
+
+def _revision_ids(value) -> Set[str]:
+    if value is None:
+        return set()
+    if isinstance(value, str):
+        return {value}
+    return set(value)
+
+
+def expected_heads(path: Path = MIGRATIONS_PATH) -> Set[str]:
+    """
+    Revisions no other migration builds on.
+
+    Read from the `revision`/`down_revision` literals of the scripts, which is
+    all Alembic needs for this too; importing Alembic would cost more than the
+    rest of the check.
+    """
+    revisions: Set[str] = set()
+    parents: Set[str] = set()
+    for script in path.glob("*.py"):
+        values = {}
+        for node in ast.parse(script.read_text()).body:
+            if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+                target, value = node.target.id, node.value
+            elif isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name):
+                target, value = node.targets[0].id, node.value
+            else:
+                continue
+            if target in ("revision", "down_revision"):
+                values[target] = ast.literal_eval(value)
+        if "revision" in values:
+            revisions.add(values["revision"])
+            parents |= _revision_ids(values.get("down_revision"))
+    return revisions - parents
+
+
+async def current_heads(engine: AsyncEngine) -> Set[str]:
+    """Revisions recorded in the database's version table."""
+    async with engine.connect() as connection:
+        if not await connection.run_sync(lambda sync: inspect(sync).has_table(VERSION_TABLE)):
+            return set()
+        result = await connection.execute(text(f"SELECT version_num FROM {VERSION_TABLE}"))
+        return set(result.scalars())
+
+
+async def check_schema(engine: AsyncEngine, mode: str = DB_SCHEMA_CHECK) -> None:
+    """
+    Verify the database is at the latest migration instead of creating tables.
+
+    Two cheap reads however large the schema grows. Migrations themselves run
+    once per release (`alembic upgrade head`), not in every process that boots.
+    """
+    if mode == "off":
+        return
+    expected = expected_heads()
+    current = await current_heads(engine)
+    if current == expected:
+        return
+    message = (
+        f"Database schema is at {sorted(current) or 'no revision'}, "
+        f"expected {sorted(expected)}; run `alembic upgrade head`"
+    )
+    if mode == "warn":
+        logger.warning(message)
+        return
+    raise SchemaOutOfDate(message)
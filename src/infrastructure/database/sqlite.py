@@ -0,0 +1,66 @@
+import asyncio
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infrastructure.metrics import metrics
+
+# Set on every new connection. WAL lets readers proceed while a write commits,
+# and with WAL, synchronous=NORMAL only risks the last commits on power loss,
+# never corruption. busy_timeout covers writers in other processes.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "foreign_keys": "ON",
+    "busy_timeout": "5000",
+    "temp_store": "MEMORY",
+    "cache_size": "-65536",
+    "mmap_size": "268435456",
+}
+
+# Execution option making a connection's transaction take the write lock up front.
+IMMEDIATE = "sqlite_immediate"
+
+
+def configure_sqlite(engine: AsyncEngine) -> None:
+    """Apply the pragmas and let SQLAlchemy, not the driver, emit BEGIN."""
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record) -> None:
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _on_begin(connection) -> None:
+        # A deferred transaction that reads before writing fails with SQLITE_BUSY
+        # instead of waiting when another writer committed in between.
+        immediate = connection.get_execution_options().get(IMMEDIATE)
+        connection.exec_driver_sql("BEGIN IMMEDIATE" if immediate else "BEGIN")
+
+
+class SQLiteWriter:
+    """
+    FIFO queue of the write transactions of this process.
+
+    SQLite allows one writer at a time; queueing units of work here hands the
+    lock over in order instead of having every contender poll busy_timeout,
+    which matters most when many bookings race for the same slot.
+    """
+
+    def __init__(self) -> None:
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        started = time.perf_counter()
+        await self._lock.acquire()
+        metrics.observe("sqlite.writer_wait", time.perf_counter() - started)
+
+    def release(self) -> None:
+        self._lock.release()
+
+
+sqlite_writer = SQLiteWriter()
@@ -0,0 +1,95 @@
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.unit_of_work import UnitOfWork
+from src.infrastructure.cache.booking_cache import CachedBookingRepository
+from src.infrastructure.cache.response_cache import catalog_cache
+
+from .bulk_import import PostgresEventImportRepository, SQLiteEventImportRepository
+from .database import IS_SQLITE
+from .repositories import (
+    SQLAlchemyAvailabilityRepository,
+    SQLAlchemyBookingGroupRepository,
+    SQLAlchemyBookingRepository,
+    SQLAlchemyChangeLogRepository,
+    SQLAlchemyEventRepository,
+    SQLAlchemyEventTemplateRepository,
+    SQLAlchemyNotificationOutbox,
+    SQLAlchemyTimeSlotRepository,
+)
+from .sqlite import IMMEDIATE, sqlite_writer
+
+# serialization_failure and deadlock_detected: the transaction may succeed if retried.
+RETRYABLE_SQLSTATES = ("40001", "40P01")
+
+
+class SQLAlchemyUnitOfWork(UnitOfWork):
+    """
+    UnitOfWork over one AsyncSession.
+
+    Repositories add objects to the session without flushing; everything
+    pending is written in one flush when the unit commits. Booking lookups go
+    through the booking cache, and changes evict it once committed. Every
+    commit also moves on the catalog version, so this worker's cached event
+    listings reflect the write before the database's notification arrives;
+    units that never touch the catalog, such as the change feed and
+    availability jobs, pass `changes_catalog=False` to leave it alone.
+
+    On SQLite the unit waits its turn in the process-wide writer queue and
+    takes the database write lock when it begins.
+    """
+
+    def __init__(self, session: AsyncSession, changes_catalog: bool = True):
+        self.session = session
+        self.changes_catalog = changes_catalog
+        self.events = SQLAlchemyEventRepository(session)
+        self.time_slots = SQLAlchemyTimeSlotRepository(session)
+        self.bookings = CachedBookingRepository(SQLAlchemyBookingRepository(session))
+        self.booking_groups = SQLAlchemyBookingGroupRepository(session)
+        self.outbox = SQLAlchemyNotificationOutbox(session)
+        self.change_log = SQLAlchemyChangeLogRepository(session)
+        self.templates = SQLAlchemyEventTemplateRepository(session)
+        self.event_imports = (
+            SQLiteEventImportRepository(session)
+            if IS_SQLITE
+            else PostgresEventImportRepository(session)
+        )
+        self.availability = SQLAlchemyAvailabilityRepository(session)
+
+    async def begin(self) -> None:
+        if IS_SQLITE:
+            await sqlite_writer.acquire()
+        try:
+            # A read before the unit started may have opened the transaction already.
+            if not self.session.in_transaction():
+                await self.session.begin()
+                if IS_SQLITE:
+                    await self.session.connection(execution_options={IMMEDIATE: True})
+        except BaseException:
+            self._release_writer()
+            raise
+
+    async def commit(self) -> None:
+        try:
+            await self.session.commit()
+        finally:
+            self._release_writer()
+        if self.changes_catalog:
+            catalog_cache.bump()
+
+    async def rollback(self) -> None:
+        try:
+            await self.session.rollback()
+        finally:
+            self._release_writer()
+
+    def is_retryable(self, error: Exception) -> bool:
+        if not isinstance(error, DBAPIError):
+            return False
+        if IS_SQLITE:
+            return "database is locked" in str(error.orig)
+        return getattr(error.orig, "sqlstate", None) in RETRYABLE_SQLSTATES
+
+    def _release_writer(self) -> None:
+        if IS_SQLITE:
+            sqlite_writer.release()
@@ -0,0 +1,3 @@
+from .parsers import SUPPORTED_FORMATS, iter_file_chunks, iter_rows
+
+__all__ = ["SUPPORTED_FORMATS", "iter_file_chunks", "iter_rows"]
@@ -0,0 +1,114 @@
+import asyncio
+import codecs
+import csv
+import json
+from pathlib import Path
+from typing import AsyncIterator, Tuple
+
+from src.application.use_cases.import_events import ROW_ERROR
+
+CHUNK_SIZE = 64 * 1024
+
+SUPPORTED_FORMATS = ("csv", "ndjson")
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode a byte stream incrementally and yield complete lines."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def iter_csv_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, dict]]:
+    """
+    Stream CSV rows as (line number, dict) using the first line as header.
+
+    Quoted fields spanning several lines are joined before parsing; the line
+    number reported is the one the record starts on.
+    """
+    header = None
+    record = ""
+    record_line = 0
+    line_number = 0
+    async for line in iter_lines(chunks):
+        line_number += 1
+        if not record:
+            record_line = line_number
+            record = line
+        else:
+            record += "\n" + line
+        # An odd number of quotes means a quoted field continues on the next line.
+        if record.count('"') % 2:
+            continue
+
+        values = next(csv.reader([record]), [])
+        record = ""
+        if not any(value.strip() for value in values):
+            continue
+        if header is None:
+            header = [value.strip() for value in values]
+            continue
+        yield record_line, dict(zip(header, values))
+
+    if record:
+        raise ValueError(f"Unterminated quoted field starting on line {record_line}")
+
+
+async def iter_ndjson_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, dict]]:
+    """
+    Stream NDJSON rows as (line number, dict).
+
+    A line may hold one flat slot row, or an event object with a nested
+    `time_slots` list, which is expanded into one row per slot.
+    """
+    line_number = 0
+    async for line in iter_lines(chunks):
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            obj = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, {ROW_ERROR: f"Invalid JSON: {e.msg}"}
+            continue
+        if not isinstance(obj, dict):
+            yield line_number, {ROW_ERROR: "Expected a JSON object"}
+            continue
+
+        slots = obj.pop("time_slots", None)
+        if slots is None:
+            yield line_number, obj
+            continue
+        if "name" in obj and "event_name" not in obj:
+            obj["event_name"] = obj.pop("name")
+        if not isinstance(slots, list):
+            yield line_number, {ROW_ERROR: "time_slots must be a list"}
+            continue
+        for slot in slots:
+            if isinstance(slot, dict):
+                yield line_number, {**obj, **slot}
+            else:
+                yield line_number, {ROW_ERROR: "time_slots entries must be objects"}
+
+
+def iter_rows(fmt: str, chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, dict]]:
+    """Pick the row parser for an input format."""
+    if fmt == "csv":
+        return iter_csv_rows(chunks)
+    if fmt == "ndjson":
+        return iter_ndjson_rows(chunks)
+    raise ValueError(f"Unsupported import format: {fmt}")
+
+
+async def iter_file_chunks(path: Path, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Read a file in chunks without blocking the event loop."""
+    with open(path, "rb") as f:
+        while chunk := await asyncio.to_thread(f.read, chunk_size):
+            yield chunk
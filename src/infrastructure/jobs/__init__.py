@@ -0,0 +1,14 @@
+from .availability import AvailabilityRefresher
+from .change_feed import ChangeFeedSequencer, ChangeLogPruner
+from .periodic import PeriodicJob
+from .reconciler import CapacityReconciler
+from .templates import TemplateEventGenerator
+
+__all__ = [
+    "PeriodicJob",
+    "ChangeFeedSequencer",
+    "ChangeLogPruner",
+    "TemplateEventGenerator",
+    "CapacityReconciler",
+    "AvailabilityRefresher",
+]
@@ -0,0 +1,48 @@
+import os
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.infrastructure.database.repositories import SQLAlchemyAvailabilityRepository
+from src.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+from src.infrastructure.metrics import metrics
+
+from .periodic import PeriodicJob
+
+# How far availability summaries may lag the slots, at most, while the job keeps up.
+AVAILABILITY_REFRESH_INTERVAL = float(os.getenv("AVAILABILITY_REFRESH_INTERVAL", "1"))
+AVAILABILITY_REFRESH_BATCH = int(os.getenv("AVAILABILITY_REFRESH_BATCH", "1000"))
+
+
+class AvailabilityRefresher(PeriodicJob):
+    """
+    Folds queued event changes into the event_availability summaries.
+
+    Database triggers queue an event's id whenever the event, or the capacity
+    or bookings of its slots, change; each batch recomputes only those events,
+    in one short unit of work, retried on conflicts, until the queue is drained.
+    """
+
+    name = "availability_refresher"
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        interval: float = AVAILABILITY_REFRESH_INTERVAL,
+        batch_size: int = AVAILABILITY_REFRESH_BATCH,
+    ):
+        super().__init__(interval)
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+
+    async def run_once(self) -> None:
+        while not self._stopping.is_set():
+            async with self.session_factory() as session:
+                uow = SQLAlchemyUnitOfWork(session, changes_catalog=False)
+                availability = SQLAlchemyAvailabilityRepository(session)
+                folded, refreshed = await uow.run(
+                    lambda: availability.refresh_pending(self.batch_size)
+                )
+            metrics.increment("availability.changes_folded", folded)
+            metrics.increment("availability.events_refreshed", refreshed)
+            if folded < self.batch_size:
+                break
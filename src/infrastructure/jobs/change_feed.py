@@ -0,0 +1,64 @@
+import os
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.infrastructure.database.repositories import SQLAlchemyChangeLogRepository
+from src.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+from src.infrastructure.metrics import metrics
+
+from .periodic import PeriodicJob
+
+CHANGE_FEED_SEQUENCE_INTERVAL = float(os.getenv("CHANGE_FEED_SEQUENCE_INTERVAL", "0.5"))
+CHANGE_FEED_PRUNE_INTERVAL = float(os.getenv("CHANGE_FEED_PRUNE_INTERVAL", "3600"))
+CHANGE_FEED_RETENTION_HOURS = float(os.getenv("CHANGE_FEED_RETENTION_HOURS", "168"))
+
+
+class ChangeFeedSequencer(PeriodicJob):
+    """Assigns feed sequence numbers to newly committed changes."""
+
+    name = "change_feed_sequencer"
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        interval: float = CHANGE_FEED_SEQUENCE_INTERVAL,
+    ):
+        super().__init__(interval)
+        self.session_factory = session_factory
+
+    async def run_once(self) -> None:
+        async with self.session_factory() as session:
+            uow = SQLAlchemyUnitOfWork(session, changes_catalog=False)
+            sequenced = await uow.run(lambda: uow.change_log.sequence_pending(wait=False))
+        metrics.increment("change_feed.sequenced", sequenced)
+
+
+class ChangeLogPruner(PeriodicJob):
+    """Deletes change feed entries older than the retention window, in batches."""
+
+    name = "change_log_pruner"
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        interval: float = CHANGE_FEED_PRUNE_INTERVAL,
+        retention: timedelta = timedelta(hours=CHANGE_FEED_RETENTION_HOURS),
+        batch_size: int = 10_000,
+    ):
+        super().__init__(interval)
+        self.session_factory = session_factory
+        self.retention = retention
+        self.batch_size = batch_size
+
+    async def run_once(self) -> None:
+        before = datetime.utcnow() - self.retention
+        while True:
+            # One short transaction per batch keeps locks and WAL bursts small.
+            async with self.session_factory() as session:
+                uow = SQLAlchemyUnitOfWork(session, changes_catalog=False)
+                change_log = SQLAlchemyChangeLogRepository(session)
+                pruned = await uow.run(lambda: change_log.prune(before, self.batch_size))
+            metrics.increment("change_feed.pruned", pruned)
+            if pruned < self.batch_size:
+                break
@@ -0,0 +1,54 @@
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.infrastructure.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicJob(ABC):
+    """
+    Base class for background jobs that run `run_once` every `interval` seconds.
+
+    Failures are logged and counted but never stop the loop; each run's
+    duration is recorded under `jobs.<name>`.
+    """
+
+    name = "job"
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    @abstractmethod
+    async def run_once(self) -> None:
+        """Do one round of the job's work."""
+        pass
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            started = time.perf_counter()
+            try:
+                await self.run_once()
+            except Exception:
+                metrics.increment(f"jobs.{self.name}.failures")
+                logger.exception("Background job %s failed", self.name)
+            metrics.observe(f"jobs.{self.name}", time.perf_counter() - started)
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._task:
+            await self._task
+            self._task = None
@@ -0,0 +1,124 @@
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.infrastructure.database.database import IS_SQLITE
+from src.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+from src.infrastructure.metrics import metrics
+
+from .periodic import PeriodicJob
+
+logger = logging.getLogger(__name__)
+
+RECONCILE_INTERVAL = float(os.getenv("RECONCILE_INTERVAL", "900"))
+RECONCILE_CHUNK_SIZE = int(os.getenv("RECONCILE_CHUNK_SIZE", "500"))
+# "fix" corrects drifted counters, "report" only logs and counts them.
+RECONCILE_MODE = os.getenv("RECONCILE_MODE", "fix").lower()
+
+# Session-level advisory lock held for a whole pass, so one worker reconciles at a time.
+RECONCILE_LOCK_KEY = 7_301_045
+
+
+@dataclass
+class ReconcilePass:
+    """Outcome of one pass over all time slots."""
+
+    slots_checked: int = 0
+    chunks: int = 0
+    drifted: int = 0
+    corrected: int = 0
+    seconds: float = 0.0
+    skipped: bool = False
+
+
+class CapacityReconciler(PeriodicJob):
+    """
+    Checks every slot's `current_bookings` against the seats actually booked.
+
+    Slots are walked in id order, one short transaction per chunk; each chunk
+    locks its slots and sums their bookings in one grouped query, so no lock
+    is held longer than that. Slots busy with a booking are skipped until the
+    next pass. Drift is logged per slot and, in "fix" mode, corrected.
+    """
+
+    name = "capacity_reconciler"
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        interval: float = RECONCILE_INTERVAL,
+        chunk_size: int = RECONCILE_CHUNK_SIZE,
+        fix: bool = RECONCILE_MODE == "fix",
+    ):
+        super().__init__(interval)
+        self.session_factory = session_factory
+        self.chunk_size = chunk_size
+        self.fix = fix
+
+    async def run_once(self) -> None:
+        await self.reconcile()
+
+    async def reconcile(self) -> ReconcilePass:
+        started = time.perf_counter()
+        async with self.session_factory() as lock_session:
+            if not IS_SQLITE and not await lock_session.scalar(
+                text("SELECT pg_try_advisory_lock(:key)").bindparams(key=RECONCILE_LOCK_KEY)
+            ):
+                metrics.increment("reconciler.passes_skipped")
+                return ReconcilePass(skipped=True)
+            try:
+                result = await self._reconcile_all()
+            finally:
+                if not IS_SQLITE:
+                    await lock_session.execute(
+                        text("SELECT pg_advisory_unlock(:key)").bindparams(key=RECONCILE_LOCK_KEY)
+                    )
+        result.seconds = time.perf_counter() - started
+        metrics.set_gauge("reconciler.last_pass_slots", result.slots_checked)
+        metrics.set_gauge("reconciler.last_pass_drifted", result.drifted)
+        metrics.set_gauge("reconciler.last_pass_seconds", result.seconds)
+        if result.drifted:
+            logger.warning(
+                "Reconciler found %d of %d slots drifted, corrected %d",
+                result.drifted,
+                result.slots_checked,
+                result.corrected,
+            )
+        return result
+
+    async def _reconcile_all(self) -> ReconcilePass:
+        result = ReconcilePass()
+        after: Optional[UUID] = None
+        while not self._stopping.is_set():
+            chunk_started = time.perf_counter()
+            async with self.session_factory() as session:
+                uow = SQLAlchemyUnitOfWork(session)
+                async with uow:
+                    slot_ids, drifted = await uow.time_slots.reconcile_bookings(
+                        after, self.chunk_size, self.fix
+                    )
+            metrics.observe("reconciler.chunk", time.perf_counter() - chunk_started)
+            if not slot_ids:
+                break
+            after = slot_ids[-1]
+            result.chunks += 1
+            result.slots_checked += len(slot_ids)
+            result.drifted += len(drifted)
+            for slot_id, recorded, booked in drifted:
+                logger.warning(
+                    "Time slot %s records %s booked seats but has %d", slot_id, recorded, booked
+                )
+            corrected = len(drifted) if self.fix else 0
+            result.corrected += corrected
+            metrics.increment("reconciler.slots_checked", len(slot_ids))
+            metrics.increment("reconciler.drifted", len(drifted))
+            metrics.increment("reconciler.corrected", corrected)
+            if len(slot_ids) < self.chunk_size:
+                break
+        return result
@@ -0,0 +1,47 @@
+import os
+from datetime import date
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.application.use_cases.generate_template_events import GenerateTemplateEventsUseCase
+from src.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+from src.infrastructure.metrics import metrics
+
+from .periodic import PeriodicJob
+
+TEMPLATE_GENERATION_INTERVAL = float(os.getenv("TEMPLATE_GENERATION_INTERVAL", "3600"))
+TEMPLATE_HORIZON_DAYS = int(os.getenv("TEMPLATE_HORIZON_DAYS", "28"))
+
+
+class TemplateEventGenerator(PeriodicJob):
+    """Keeps events of recurring templates generated up to the rolling horizon."""
+
+    name = "template_event_generator"
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        interval: float = TEMPLATE_GENERATION_INTERVAL,
+        horizon_days: int = TEMPLATE_HORIZON_DAYS,
+        batch_size: int = 100,
+    ):
+        super().__init__(interval)
+        self.session_factory = session_factory
+        self.horizon_days = horizon_days
+        self.batch_size = batch_size
+
+    async def run_once(self) -> None:
+        while True:
+            # One transaction per batch of templates; other workers skip the
+            # templates this one has claimed.
+            async with self.session_factory() as session:
+                use_case = GenerateTemplateEventsUseCase(
+                    SQLAlchemyUnitOfWork(session),
+                    horizon_days=self.horizon_days,
+                    batch_size=self.batch_size,
+                )
+                templates, events, slots = await use_case.execute(date.today())
+            metrics.increment("templates.events_generated", events)
+            metrics.increment("templates.slots_generated", slots)
+            if templates < self.batch_size:
+                break
@@ -0,0 +1,27 @@
+from .repositories import (
+    MemoryBookingGroupRepository,
+    MemoryBookingRepository,
+    MemoryChangeLogRepository,
+    MemoryEventImportRepository,
+    MemoryEventRepository,
+    MemoryEventTemplateRepository,
+    MemoryNotificationOutbox,
+    MemoryTimeSlotRepository,
+)
+from .store import MemoryStore, MemoryTransaction, memory_store
+from .unit_of_work import MemoryUnitOfWork
+
+__all__ = [
+    "MemoryStore",
+    "MemoryTransaction",
+    "memory_store",
+    "MemoryBookingGroupRepository",
+    "MemoryBookingRepository",
+    "MemoryChangeLogRepository",
+    "MemoryEventImportRepository",
+    "MemoryEventRepository",
+    "MemoryEventTemplateRepository",
+    "MemoryNotificationOutbox",
+    "MemoryTimeSlotRepository",
+    "MemoryUnitOfWork",
+]
@@ -0,0 +1,620 @@
+import bisect
+import copy
+from contextlib import AsyncExitStack
+from datetime import date, datetime
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from src.domain.entities import (
+    Booking,
+    BookingGroup,
+    Change,
+    Event,
+    EventAvailability,
+    EventTemplate,
+    Notification,
+    TimeSlot,
+)
+from src.domain.repositories import (
+    AvailabilityRepository,
+    BookingGroupRepository,
+    BookingRepository,
+    ChangeLogRepository,
+    EventImportRepository,
+    EventRepository,
+    EventTemplateRepository,
+    NotificationOutbox,
+    TimeSlotRepository,
+)
+
+from .store import MemoryStore, MemoryTransaction
+
+
+class _MemoryRepository:
+    """Shared plumbing: the store, and the undo log of the current unit of work."""
+
+    def __init__(self, store: MemoryStore, transaction: MemoryTransaction):
+        self.store = store
+        self.transaction = transaction
+
+
+class MemoryTimeSlotRepository(_MemoryRepository, TimeSlotRepository):
+    """In-memory implementation of TimeSlotRepository."""
+
+    def _insert(self, time_slot: TimeSlot) -> None:
+        self.store.time_slots[time_slot.id] = time_slot
+        self.store.slot_ids_by_event[time_slot.event_id][time_slot.id] = None
+
+    def _remove(self, slot_id: UUID) -> Optional[TimeSlot]:
+        time_slot = self.store.time_slots.pop(slot_id, None)
+        if time_slot:
+            self.store.slot_ids_by_event[time_slot.event_id].pop(slot_id, None)
+        return time_slot
+
+    async def create(self, time_slot: TimeSlot) -> TimeSlot:
+        self._insert(copy.copy(time_slot))
+        self.transaction.undo.append(lambda: self._remove(time_slot.id))
+        return time_slot
+
+    async def get_by_id(self, slot_id: UUID) -> Optional[TimeSlot]:
+        time_slot = self.store.time_slots.get(slot_id)
+        return copy.copy(time_slot) if time_slot else None
+
+    async def get_by_event_id(self, event_id: UUID) -> List[TimeSlot]:
+        return [
+            copy.copy(self.store.time_slots[slot_id])
+            for slot_id in self.store.slot_ids_by_event.get(event_id, ())
+        ]
+
+    async def update(self, time_slot: TimeSlot) -> TimeSlot:
+        previous = self.store.time_slots.get(time_slot.id)
+        if not previous:
+            raise ValueError("TimeSlot not found")
+        self.store.time_slots[time_slot.id] = copy.copy(time_slot)
+        self.transaction.undo.append(
+            lambda: self.store.time_slots.__setitem__(previous.id, previous)
+        )
+        return time_slot
+
+    async def reserve_spots(self, slot_id: UUID, seats: int) -> bool:
+        if seats <= 0:
+            return False
+        async with self.store.slot_locks[slot_id]:
+            time_slot = self.store.time_slots.get(slot_id)
+            if not time_slot or not time_slot.is_available(seats):
+                return False
+            time_slot.current_bookings += seats
+        self.transaction.undo.append(lambda: self._adjust(slot_id, -seats))
+        return True
+
+    async def reserve_spots_together(self, slot_ids: List[UUID], seats: int) -> List[TimeSlot]:
+        if seats <= 0 or not slot_ids:
+            return []
+        async with AsyncExitStack() as locks:
+            for slot_id in sorted(slot_ids):
+                await locks.enter_async_context(self.store.slot_locks[slot_id])
+            time_slots = [self.store.time_slots.get(slot_id) for slot_id in slot_ids]
+            if not all(time_slot and time_slot.is_available(seats) for time_slot in time_slots):
+                return []
+            for time_slot in time_slots:
+                time_slot.current_bookings += seats
+
+        def undo() -> None:
+            for slot_id in slot_ids:
+                self._adjust(slot_id, -seats)
+
+        self.transaction.undo.append(undo)
+        return [copy.copy(time_slot) for time_slot in time_slots]
+
+    async def set_capacities(
+        self, capacities: Dict[UUID, int]
+    ) -> Tuple[List[TimeSlot], List[TimeSlot]]:
+        changed: List[TimeSlot] = []
+        unchanged: List[TimeSlot] = []
+        previous: Dict[UUID, int] = {}
+        async with AsyncExitStack() as locks:
+            for slot_id in sorted(capacities):
+                await locks.enter_async_context(self.store.slot_locks[slot_id])
+            for slot_id, capacity in capacities.items():
+                time_slot = self.store.time_slots.get(slot_id)
+                if not time_slot:
+                    continue
+                if capacity == time_slot.max_capacity or capacity < time_slot.current_bookings:
+                    unchanged.append(copy.copy(time_slot))
+                    continue
+                previous[slot_id] = time_slot.max_capacity
+                time_slot.max_capacity = capacity
+                changed.append(copy.copy(time_slot))
+
+        def undo() -> None:
+            for slot_id, capacity in previous.items():
+                time_slot = self.store.time_slots.get(slot_id)
+                if time_slot:
+                    time_slot.max_capacity = capacity
+
+        self.transaction.undo.append(undo)
+        return changed, unchanged
+
+    async def release_spots(self, slot_id: UUID, seats: int) -> None:
+        if seats <= 0:
+            return
+        async with self.store.slot_locks[slot_id]:
+            time_slot = self.store.time_slots.get(slot_id)
+            if not time_slot or time_slot.current_bookings < seats:
+                return
+            time_slot.current_bookings -= seats
+        self.transaction.undo.append(lambda: self._adjust(slot_id, seats))
+
+    def _adjust(self, slot_id: UUID, seats: int) -> None:
+        time_slot = self.store.time_slots.get(slot_id)
+        if time_slot:
+            time_slot.current_bookings += seats
+
+    async def delete(self, slot_id: UUID) -> bool:
+        time_slot = self._remove(slot_id)
+        if not time_slot:
+            return False
+        self.transaction.undo.append(lambda: self._insert(time_slot))
+        return True
+
+
+class MemoryEventRepository(_MemoryRepository, EventRepository):
+    """In-memory implementation of EventRepository."""
+
+    def _insert(self, event: Event) -> None:
+        self.store.events[event.id] = event
+        if event.template_id:
+            self.store.event_ids_by_template_date[(event.template_id, event.event_date)] = event.id
+
+    def _remove(self, event_id: UUID) -> Optional[Event]:
+        event = self.store.events.pop(event_id, None)
+        if event and event.template_id:
+            self.store.event_ids_by_template_date.pop((event.template_id, event.event_date), None)
+        return event
+
+    def _with_slots(self, event: Event) -> Event:
+        result = copy.copy(event)
+        result.time_slots = [
+            copy.copy(self.store.time_slots[slot_id])
+            for slot_id in self.store.slot_ids_by_event.get(event.id, ())
+        ]
+        return result
+
+    async def create(self, event: Event) -> Event:
+        if event.template_id and (
+            (event.template_id, event.event_date) in self.store.event_ids_by_template_date
+        ):
+            raise ValueError("Template already has an event on this date")
+        stored = copy.copy(event)
+        stored.time_slots = []
+        self._insert(stored)
+        self.transaction.undo.append(lambda: self._remove(event.id))
+        return event
+
+    async def get_by_id(self, event_id: UUID) -> Optional[Event]:
+        event = self.store.events.get(event_id)
+        return self._with_slots(event) if event else None
+
+    async def get_all(self) -> List[Event]:
+        return [self._with_slots(event) for event in self.store.events.values()]
+
+    async def get_by_date_range(self, start_date: date, end_date: date) -> List[Event]:
+        return [
+            self._with_slots(event)
+            for event in self.store.events.values()
+            if start_date <= event.event_date <= end_date
+        ]
+
+    async def get_page(
+        self,
+        after: Optional[Tuple[date, UUID]] = None,
+        limit: int = 100,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[Event]:
+        keys = sorted(
+            (event.event_date, event.id)
+            for event in self.store.events.values()
+            if (start_date is None or event.event_date >= start_date)
+            and (end_date is None or event.event_date <= end_date)
+        )
+        start = bisect.bisect_right(keys, after) if after is not None else 0
+        return [self._with_slots(self.store.events[key[1]]) for key in keys[start : start + limit]]
+
+    async def find_existing(self, keys: List[Tuple[str, date]]) -> Set[Tuple[str, date]]:
+        wanted = set(keys)
+        return {
+            (event.name, event.event_date)
+            for event in self.store.events.values()
+            if (event.name, event.event_date) in wanted
+        }
+
+    async def update(self, event: Event) -> Event:
+        previous = self._remove(event.id)
+        if not previous:
+            raise ValueError("Event not found")
+        stored = copy.copy(event)
+        stored.time_slots = []
+        self._insert(stored)
+
+        def undo() -> None:
+            self._remove(event.id)
+            self._insert(previous)
+
+        self.transaction.undo.append(undo)
+        return event
+
+    async def delete(self, event_id: UUID) -> bool:
+        event = self._remove(event_id)
+        if not event:
+            return False
+        self.transaction.undo.append(lambda: self._insert(event))
+        # Time slots and their bookings go with the event, as in the database.
+        time_slots = MemoryTimeSlotRepository(self.store, self.transaction)
+        bookings = MemoryBookingRepository(self.store, self.transaction)
+        for slot_id in list(self.store.slot_ids_by_event.get(event_id, ())):
+            for booking_id in list(self.store.booking_ids_by_slot.get(slot_id, ())):
+                await bookings.delete(booking_id)
+            await time_slots.delete(slot_id)
+        return True
+
+
+class MemoryBookingRepository(_MemoryRepository, BookingRepository):
+    """In-memory implementation of BookingRepository."""
+
+    def _insert(self, booking: Booking) -> None:
+        self.store.bookings[booking.id] = booking
+        self.store.booking_ids_by_token[booking.booking_token] = booking.id
+        self.store.booking_ids_by_slot[booking.time_slot_id][booking.id] = None
+        if booking.group_id:
+            self.store.booking_ids_by_group[booking.group_id][booking.id] = None
+        if booking.event_id:
+            self.store.booking_ids_by_event[booking.event_id][booking.id] = None
+
+    def _remove(self, booking_id: UUID) -> Optional[Booking]:
+        booking = self.store.bookings.pop(booking_id, None)
+        if booking:
+            self.store.booking_ids_by_token.pop(booking.booking_token, None)
+            self.store.booking_ids_by_slot[booking.time_slot_id].pop(booking_id, None)
+            if booking.group_id:
+                self.store.booking_ids_by_group[booking.group_id].pop(booking_id, None)
+            if booking.event_id:
+                self.store.booking_ids_by_event[booking.event_id].pop(booking_id, None)
+        return booking
+
+    async def create(self, booking: Booking) -> Booking:
+        if booking.booking_token in self.store.booking_ids_by_token:
+            raise ValueError("Booking token already exists")
+        self._insert(copy.copy(booking))
+        self.transaction.undo.append(lambda: self._remove(booking.id))
+        return booking
+
+    async def get_by_id(self, booking_id: UUID) -> Optional[Booking]:
+        booking = self.store.bookings.get(booking_id)
+        return copy.copy(booking) if booking else None
+
+    async def get_by_token(self, token: str) -> Optional[Booking]:
+        booking_id = self.store.booking_ids_by_token.get(token)
+        return copy.copy(self.store.bookings[booking_id]) if booking_id else None
+
+    async def get_by_time_slot_id(self, time_slot_id: UUID) -> List[Booking]:
+        return [
+            copy.copy(self.store.bookings[booking_id])
+            for booking_id in self.store.booking_ids_by_slot.get(time_slot_id, ())
+        ]
+
+    async def get_page_by_time_slot_id(
+        self,
+        time_slot_id: UUID,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 100,
+        name_prefix: Optional[str] = None,
+    ) -> List[Booking]:
+        booking_ids = self.store.booking_ids_by_slot.get(time_slot_id, ())
+        return self._page(booking_ids, after, limit, name_prefix)
+
+    async def get_page_by_event_id(
+        self,
+        event_id: UUID,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 100,
+        name_prefix: Optional[str] = None,
+    ) -> List[Booking]:
+        booking_ids = self.store.booking_ids_by_event.get(event_id, ())
+        return self._page(booking_ids, after, limit, name_prefix)
+
+    def _page(
+        self,
+        booking_ids: Iterable[UUID],
+        after: Optional[Tuple[datetime, UUID]],
+        limit: int,
+        name_prefix: Optional[str],
+    ) -> List[Booking]:
+        prefix = name_prefix.lower() if name_prefix else None
+        keys = sorted(
+            (booking.created_at, booking.id)
+            for booking in map(self.store.bookings.__getitem__, booking_ids)
+            if prefix is None or booking.attendee_name.lower().startswith(prefix)
+        )
+        start = bisect.bisect_right(keys, after) if after is not None else 0
+        return [copy.copy(self.store.bookings[key[1]]) for key in keys[start : start + limit]]
+
+    async def update(self, booking: Booking) -> Booking:
+        previous = self._remove(booking.id)
+        if not previous:
+            raise ValueError("Booking not found")
+        self._insert(copy.copy(booking))
+
+        def undo() -> None:
+            self._remove(booking.id)
+            self._insert(previous)
+
+        self.transaction.undo.append(undo)
+        return booking
+
+    async def move(self, booking: Booking, new_time_slot_id: UUID) -> Optional[TimeSlot]:
+        old_time_slot_id = booking.time_slot_id
+        async with AsyncExitStack() as locks:
+            for slot_id in sorted({old_time_slot_id, new_time_slot_id}):
+                await locks.enter_async_context(self.store.slot_locks[slot_id])
+            stored = self.store.bookings.get(booking.id)
+            new_slot = self.store.time_slots.get(new_time_slot_id)
+            old_slot = self.store.time_slots.get(old_time_slot_id)
+            seats = booking.number_of_seats
+            if (
+                not stored
+                or stored.time_slot_id != old_time_slot_id
+                or not new_slot
+                or not new_slot.is_available(seats)
+            ):
+                return None
+            new_slot.current_bookings += seats
+            if old_slot:
+                old_slot.current_bookings -= seats
+            moved = copy.copy(stored)
+            moved.time_slot_id = new_time_slot_id
+            moved.event_id = new_slot.event_id
+            self._remove(booking.id)
+            self._insert(moved)
+
+        def undo() -> None:
+            new_slot.current_bookings -= seats
+            if old_slot:
+                old_slot.current_bookings += seats
+            self._remove(booking.id)
+            self._insert(stored)
+
+        self.transaction.undo.append(undo)
+        return copy.copy(new_slot)
+
+    async def delete(self, booking_id: UUID) -> bool:
+        booking = self._remove(booking_id)
+        if not booking:
+            return False
+        self.transaction.undo.append(lambda: self._insert(booking))
+        return True
+
+    async def delete_by_event(
+        self, event_id: UUID, chunk_size: int = 1000
+    ) -> AsyncIterator[List[Booking]]:
+        if event_id not in self.store.events:
+            return
+        booking_ids = list(self.store.booking_ids_by_event.get(event_id, ()))
+        group_ids = set()
+        for start in range(0, len(booking_ids), chunk_size):
+            bookings = []
+            for booking_id in booking_ids[start : start + chunk_size]:
+                booking = copy.copy(self.store.bookings[booking_id])
+                await self.delete(booking_id)
+                # As from the database, which keeps only digests of the tokens.
+                booking.booking_token = None
+                if booking.group_id:
+                    group_ids.add(booking.group_id)
+                bookings.append(booking)
+            yield bookings
+        groups = MemoryBookingGroupRepository(self.store, self.transaction)
+        for group_id in group_ids:
+            await groups.delete(group_id)
+
+
+class MemoryBookingGroupRepository(_MemoryRepository, BookingGroupRepository):
+    """In-memory implementation of BookingGroupRepository."""
+
+    def __init__(self, store: MemoryStore, transaction: MemoryTransaction):
+        super().__init__(store, transaction)
+        self.bookings = MemoryBookingRepository(store, transaction)
+
+    def _insert(self, group: BookingGroup) -> None:
+        self.store.booking_groups[group.id] = group
+        self.store.group_ids_by_token[group.booking_token] = group.id
+
+    def _remove(self, group_id: UUID) -> Optional[BookingGroup]:
+        group = self.store.booking_groups.pop(group_id, None)
+        if group:
+            self.store.group_ids_by_token.pop(group.booking_token, None)
+        return group
+
+    async def create(self, group: BookingGroup) -> BookingGroup:
+        if group.booking_token in self.store.group_ids_by_token:
+            raise ValueError("Booking token already exists")
+        stored = copy.copy(group)
+        stored.bookings = []
+        self._insert(stored)
+        self.transaction.undo.append(lambda: self._remove(group.id))
+        for booking in group.bookings:
+            await self.bookings.create(booking)
+        return group
+
+    async def get_by_token(self, token: str) -> Optional[BookingGroup]:
+        group_id = self.store.group_ids_by_token.get(token)
+        if not group_id:
+            return None
+        result = copy.copy(self.store.booking_groups[group_id])
+        result.bookings = sorted(
+            (
+                copy.copy(self.store.bookings[booking_id])
+                for booking_id in self.store.booking_ids_by_group.get(group_id, ())
+            ),
+            key=lambda booking: (
+                self.store.time_slots[booking.time_slot_id].start_time,
+                booking.time_slot_id,
+            ),
+        )
+        return result
+
+    async def delete(self, group_id: UUID) -> bool:
+        group = self._remove(group_id)
+        if not group:
+            return False
+        self.transaction.undo.append(lambda: self._insert(group))
+        for booking_id in list(self.store.booking_ids_by_group.get(group_id, ())):
+            await self.bookings.delete(booking_id)
+        return True
+
+
+class MemoryNotificationOutbox(_MemoryRepository, NotificationOutbox):
+    """In-memory implementation of NotificationOutbox; messages are kept, never sent."""
+
+    async def enqueue(self, notification: Notification) -> None:
+        self.transaction.on_commit.append(lambda: self.store.outbox.append(notification))
+
+
+class MemoryChangeLogRepository(_MemoryRepository, ChangeLogRepository):
+    """In-memory implementation of ChangeLogRepository; changes are sequenced on commit."""
+
+    async def append(self, change: Change) -> None:
+        def publish() -> None:
+            change.seq = self.store.next_seq
+            self.store.next_seq += 1
+            self.store.changes.append(change)
+
+        self.transaction.on_commit.append(publish)
+
+    async def get_after(self, after: int, limit: int) -> List[Change]:
+        changes = self.store.changes
+        # Sequence numbers are dense and start at 1, so the position is known.
+        start = max(0, after - changes[0].seq + 1) if changes else 0
+        return changes[start : start + limit]
+
+    async def sequence_pending(self, limit: int = 10_000, wait: bool = True) -> int:
+        # Every change is sequenced as its unit commits; none is ever pending.
+        return 0
+
+
+class MemoryEventTemplateRepository(_MemoryRepository, EventTemplateRepository):
+    """In-memory implementation of EventTemplateRepository."""
+
+    async def create(self, template: EventTemplate) -> EventTemplate:
+        self.store.templates[template.id] = copy.deepcopy(template)
+        self.transaction.undo.append(lambda: self.store.templates.pop(template.id, None))
+        return template
+
+    async def get_by_id(self, template_id: UUID) -> Optional[EventTemplate]:
+        template = self.store.templates.get(template_id)
+        return copy.deepcopy(template) if template else None
+
+    async def get_for_update(self, template_id: UUID) -> Optional[EventTemplate]:
+        return await self.get_by_id(template_id)
+
+    async def get_all(self) -> List[EventTemplate]:
+        templates = sorted(self.store.templates.values(), key=lambda t: t.created_at)
+        return [copy.deepcopy(template) for template in templates]
+
+    async def claim_due(self, until: date, limit: int) -> List[EventTemplate]:
+        due = sorted(
+            (
+                template
+                for template in self.store.templates.values()
+                if template.generated_until < until
+                and (template.end_date is None or template.generated_until < template.end_date)
+            ),
+            key=lambda t: t.generated_until,
+        )
+        return [copy.deepcopy(template) for template in due[:limit]]
+
+    async def update(self, template: EventTemplate) -> EventTemplate:
+        previous = self.store.templates.get(template.id)
+        if previous:
+            self.store.templates[template.id] = copy.deepcopy(template)
+            self.transaction.undo.append(
+                lambda: self.store.templates.__setitem__(previous.id, previous)
+            )
+        return template
+
+    async def delete(self, template_id: UUID) -> bool:
+        template = self.store.templates.pop(template_id, None)
+        if not template:
+            return False
+        self.transaction.undo.append(
+            lambda: self.store.templates.__setitem__(template_id, template)
+        )
+        return True
+
+    async def remove_unbooked_event(self, template_id: UUID, event_date: date) -> bool:
+        event_id = self.store.event_ids_by_template_date.get((template_id, event_date))
+        if event_id is None:
+            return True
+        slot_ids = self.store.slot_ids_by_event.get(event_id, ())
+        if any(self.store.time_slots[slot_id].current_bookings for slot_id in slot_ids):
+            return False
+        return await MemoryEventRepository(self.store, self.transaction).delete(event_id)
+
+
+class MemoryEventImportRepository(_MemoryRepository, EventImportRepository):
+    """In-memory implementation of EventImportRepository."""
+
+    def __init__(self, store: MemoryStore, transaction: MemoryTransaction):
+        super().__init__(store, transaction)
+        self._events: List[Event] = []
+        self._time_slots: List[TimeSlot] = []
+
+    async def stage(self, events: List[Event], time_slots: List[TimeSlot]) -> None:
+        self._events.extend(events)
+        self._time_slots.extend(time_slots)
+
+    async def merge(self) -> Tuple[int, int]:
+        events = MemoryEventRepository(self.store, self.transaction)
+        time_slots = MemoryTimeSlotRepository(self.store, self.transaction)
+        for event in self._events:
+            await events.create(event)
+        for time_slot in self._time_slots:
+            await time_slots.create(time_slot)
+        merged = len(self._events), len(self._time_slots)
+        self._events, self._time_slots = [], []
+        return merged
+
+
+class MemoryAvailabilityRepository(_MemoryRepository, AvailabilityRepository):
+    """In-memory implementation of AvailabilityRepository; summaries are computed when read."""
+
+    def _summarise(self, event: Event) -> EventAvailability:
+        slots = [
+            self.store.time_slots[slot_id]
+            for slot_id in self.store.slot_ids_by_event.get(event.id, ())
+        ]
+        return EventAvailability(
+            event_id=event.id,
+            event_name=event.name,
+            event_date=event.event_date,
+            slot_count=len(slots),
+            open_slots=sum(1 for slot in slots if slot.available_spots() > 0),
+            total_capacity=sum(slot.max_capacity for slot in slots),
+            booked_seats=sum(slot.current_bookings for slot in slots),
+            available_seats=sum(max(0, slot.available_spots()) for slot in slots),
+        )
+
+    async def get_page(
+        self,
+        after: Optional[Tuple[date, UUID]] = None,
+        limit: int = 100,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[EventAvailability]:
+        keys = sorted(
+            (event.event_date, event.id)
+            for event in self.store.events.values()
+            if (start_date is None or event.event_date >= start_date)
+            and (end_date is None or event.event_date <= end_date)
+        )
+        start = bisect.bisect_right(keys, after) if after is not None else 0
+        return [self._summarise(self.store.events[key[1]]) for key in keys[start : start + limit]]
@@ -0,0 +1,74 @@
+import asyncio
+from collections import defaultdict
+from datetime import date
+from typing import Callable, Dict, List, Tuple
+from uuid import UUID
+
+from src.domain.entities import (
+    Booking,
+    BookingGroup,
+    Change,
+    Event,
+    EventTemplate,
+    Notification,
+    TimeSlot,
+)
+
+
+class MemoryStore:
+    """
+    Process-local tables and hash indexes backing the in-memory repositories.
+
+    Entities are stored as private copies and indexed by id, booking token,
+    event id, time slot id and booking group id, and bookings also by event id;
+    "sets" are dicts so iteration keeps insertion order. One lock per time slot makes capacity changes atomic.
+    """
+
+    def __init__(self) -> None:
+        self.events: Dict[UUID, Event] = {}
+        self.time_slots: Dict[UUID, TimeSlot] = {}
+        self.bookings: Dict[UUID, Booking] = {}
+        self.booking_groups: Dict[UUID, BookingGroup] = {}
+        self.templates: Dict[UUID, EventTemplate] = {}
+        self.outbox: List[Notification] = []
+        self.changes: List[Change] = []
+        self.next_seq = 1
+
+        self.booking_ids_by_token: Dict[str, UUID] = {}
+        self.group_ids_by_token: Dict[str, UUID] = {}
+        self.slot_ids_by_event: Dict[UUID, Dict[UUID, None]] = defaultdict(dict)
+        self.booking_ids_by_slot: Dict[UUID, Dict[UUID, None]] = defaultdict(dict)
+        self.booking_ids_by_group: Dict[UUID, Dict[UUID, None]] = defaultdict(dict)
+        self.booking_ids_by_event: Dict[UUID, Dict[UUID, None]] = defaultdict(dict)
+        self.event_ids_by_template_date: Dict[Tuple[UUID, date], UUID] = {}
+        self.slot_locks: Dict[UUID, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    def clear(self) -> None:
+        self.__init__()
+
+
+class MemoryTransaction:
+    """
+    Undo log of one in-memory unit of work.
+
+    Every write registers its inverse; rollback replays them newest first.
+    Callbacks in `on_commit` run once the unit commits.
+    """
+
+    def __init__(self) -> None:
+        self.undo: List[Callable[[], None]] = []
+        self.on_commit: List[Callable[[], None]] = []
+
+    def commit(self) -> None:
+        for callback in self.on_commit:
+            callback()
+        self.undo.clear()
+        self.on_commit.clear()
+
+    def rollback(self) -> None:
+        while self.undo:
+            self.undo.pop()()
+        self.on_commit.clear()
+
+
+memory_store = MemoryStore()
@@ -0,0 +1,48 @@
+from src.application.unit_of_work import UnitOfWork
+from src.infrastructure.cache.response_cache import catalog_cache
+
+from .repositories import (
+    MemoryAvailabilityRepository,
+    MemoryBookingGroupRepository,
+    MemoryBookingRepository,
+    MemoryChangeLogRepository,
+    MemoryEventImportRepository,
+    MemoryEventRepository,
+    MemoryEventTemplateRepository,
+    MemoryNotificationOutbox,
+    MemoryTimeSlotRepository,
+)
+from .store import MemoryStore, MemoryTransaction, memory_store
+
+
+class MemoryUnitOfWork(UnitOfWork):
+    """
+    UnitOfWork over a MemoryStore.
+
+    Writes apply to the store immediately and are undone on rollback. Units
+    are not isolated from each other: only capacity changes are atomic, which
+    is all the booking use cases rely on.
+    """
+
+    def __init__(self, store: MemoryStore = memory_store):
+        self.store = store
+        self.transaction = MemoryTransaction()
+        self.events = MemoryEventRepository(store, self.transaction)
+        self.time_slots = MemoryTimeSlotRepository(store, self.transaction)
+        self.bookings = MemoryBookingRepository(store, self.transaction)
+        self.booking_groups = MemoryBookingGroupRepository(store, self.transaction)
+        self.outbox = MemoryNotificationOutbox(store, self.transaction)
+        self.change_log = MemoryChangeLogRepository(store, self.transaction)
+        self.templates = MemoryEventTemplateRepository(store, self.transaction)
+        self.event_imports = MemoryEventImportRepository(store, self.transaction)
+        self.availability = MemoryAvailabilityRepository(store, self.transaction)
+
+    async def begin(self) -> None:
+        pass
+
+    async def commit(self) -> None:
+        self.transaction.commit()
+        catalog_cache.bump()
+
+    async def rollback(self) -> None:
+        self.transaction.rollback()
@@ -0,0 +1,58 @@
+from collections import defaultdict
+from typing import Dict
+
+
+class Timing:
+    """Aggregate of observed durations."""
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_seconds": round(self.total, 6),
+            "max_seconds": round(self.max, 6),
+            "avg_seconds": round(self.total / self.count, 6) if self.count else 0.0,
+        }
+
+
+class Metrics:
+    """In-process counters, gauges and timings for a single worker."""
+
+    def __init__(self) -> None:
+        self._counters: Dict[str, int] = defaultdict(int)
+        self._gauges: Dict[str, float] = {}
+        self._timings: Dict[str, Timing] = defaultdict(Timing)
+
+    def increment(self, name: str, value: int = 1) -> None:
+        self._counters[name] += value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        self._gauges[name] = value
+
+    def observe(self, name: str, seconds: float) -> None:
+        self._timings[name].observe(seconds)
+
+    def counter(self, name: str) -> int:
+        return self._counters.get(name, 0)
+
+    def snapshot(self) -> dict:
+        return {
+            "counters": dict(self._counters),
+            "gauges": dict(self._gauges),
+            "timings": {name: timing.as_dict() for name, timing in self._timings.items()},
+        }
+
+
+metrics = Metrics()
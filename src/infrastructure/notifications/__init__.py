@@ -0,0 +1,12 @@
+from .dispatcher import OutboxDispatcher, build_dispatcher
+from .smtp import PermanentDeliveryError, SMTPConnectionPool, SMTPSettings
+from .smtp_sink import SMTPSink
+
+__all__ = [
+    "OutboxDispatcher",
+    "build_dispatcher",
+    "PermanentDeliveryError",
+    "SMTPConnectionPool",
+    "SMTPSettings",
+    "SMTPSink",
+]
@@ -0,0 +1,189 @@
+import asyncio
+import logging
+import os
+import random
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.database.models import OutboxMessageModel
+from src.infrastructure.metrics import metrics
+
+from .smtp import PermanentDeliveryError, SMTPConnectionPool, SMTPSettings
+from .templates import render
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxDispatcher:
+    """
+    Background sender for the notification outbox.
+
+    Each round claims a batch of due messages with `FOR UPDATE SKIP LOCKED` and
+    leases them by pushing `available_at` forward, so several dispatchers can
+    run side by side and a crashed one only delays its batch. Messages are then
+    sent outside any transaction over the SMTP pool; failures are retried with
+    exponential backoff until `max_attempts` is reached.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        pool: SMTPConnectionPool,
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        max_attempts: int = 8,
+        lease_seconds: float = 300.0,
+        base_backoff: float = 5.0,
+        max_backoff: float = 3600.0,
+    ):
+        self.session_factory = session_factory
+        self.pool = pool
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    def backoff(self, attempts: int) -> timedelta:
+        """Delay before the next attempt, doubling per attempt with jitter."""
+        delay = min(self.max_backoff, self.base_backoff * 2 ** max(0, attempts - 1))
+        return timedelta(seconds=delay * random.uniform(0.5, 1.0))
+
+    async def _claim(self, session: AsyncSession) -> List[OutboxMessageModel]:
+        now = datetime.utcnow()
+        due = (
+            select(OutboxMessageModel.id)
+            .where(
+                OutboxMessageModel.sent_at.is_(None),
+                OutboxMessageModel.failed_at.is_(None),
+                OutboxMessageModel.available_at <= now,
+            )
+            .order_by(OutboxMessageModel.available_at)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(OutboxMessageModel)
+            .where(OutboxMessageModel.id.in_(due.scalar_subquery()))
+            .values(
+                available_at=now + timedelta(seconds=self.lease_seconds),
+                attempts=OutboxMessageModel.attempts + 1,
+            )
+            .returning(
+                OutboxMessageModel.id,
+                OutboxMessageModel.kind,
+                OutboxMessageModel.recipient,
+                OutboxMessageModel.payload,
+                OutboxMessageModel.attempts,
+            )
+        )
+        async with session.begin():
+            result = await session.execute(stmt)
+            return list(result.all())
+
+    async def _deliver(self, message) -> Optional[Exception]:
+        try:
+            await self.pool.send(
+                render(message.kind, message.recipient, message.payload, self.pool.settings.sender)
+            )
+            return None
+        except Exception as e:
+            return e
+
+    async def run_once(self) -> int:
+        """Claim and send one batch; returns the number of messages processed."""
+        started = time.perf_counter()
+        async with self.session_factory() as session:
+            claimed = await self._claim(session)
+            if not claimed:
+                return 0
+
+            outcomes = await asyncio.gather(*(self._deliver(message) for message in claimed))
+
+            now = datetime.utcnow()
+            sent_ids = [message.id for message, error in zip(claimed, outcomes) if error is None]
+            async with session.begin():
+                if sent_ids:
+                    await session.execute(
+                        update(OutboxMessageModel)
+                        .where(OutboxMessageModel.id.in_(sent_ids))
+                        .values(sent_at=now, last_error=None)
+                    )
+                for message, error in zip(claimed, outcomes):
+                    if error is None:
+                        continue
+                    give_up = (
+                        isinstance(error, PermanentDeliveryError)
+                        or message.attempts >= self.max_attempts
+                    )
+                    values = {"last_error": f"{type(error).__name__}: {error}"[:1000]}
+                    if give_up:
+                        values["failed_at"] = now
+                    else:
+                        values["available_at"] = now + self.backoff(message.attempts)
+                    await session.execute(
+                        update(OutboxMessageModel)
+                        .where(OutboxMessageModel.id == message.id)
+                        .values(**values)
+                    )
+                    metrics.increment("outbox.failed" if give_up else "outbox.retried")
+                    logger.warning("Delivery of %s failed: %s", message.id, error)
+
+        elapsed = time.perf_counter() - started
+        metrics.increment("outbox.sent", len(sent_ids))
+        metrics.observe("outbox.batch", elapsed)
+        if elapsed > 0:
+            metrics.set_gauge("outbox.last_batch_messages_per_second", len(claimed) / elapsed)
+        return len(claimed)
+
+    async def drain(self) -> int:
+        """Send until nothing is due; returns the number of messages processed."""
+        total = 0
+        while processed := await self.run_once():
+            total += processed
+        return total
+
+    async def run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                processed = await self.run_once()
+            except Exception:
+                logger.exception("Outbox dispatch round failed")
+                processed = 0
+            if processed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self) -> None:
+        self._stopping.clear()
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._task:
+            await self._task
+            self._task = None
+        await self.pool.close()
+
+
+def build_dispatcher(session_factory: async_sessionmaker) -> Optional[OutboxDispatcher]:
+    """Create a dispatcher from the environment; None when SMTP is not configured."""
+    settings = SMTPSettings.from_env()
+    if settings is None or os.getenv("OUTBOX_DISPATCHER_ENABLED", "true").lower() != "true":
+        return None
+    return OutboxDispatcher(
+        session_factory,
+        SMTPConnectionPool(settings, size=int(os.getenv("SMTP_POOL_SIZE", "4"))),
+        batch_size=int(os.getenv("OUTBOX_BATCH_SIZE", "100")),
+        poll_interval=float(os.getenv("OUTBOX_POLL_INTERVAL", "1.0")),
+        max_attempts=int(os.getenv("OUTBOX_MAX_ATTEMPTS", "8")),
+    )
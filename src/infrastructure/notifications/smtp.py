@@ -0,0 +1,127 @@
+import asyncio
+import os
+import smtplib
+from email.message import EmailMessage
+from typing import Optional
+
+
+class PermanentDeliveryError(Exception):
+    """The SMTP server rejected a message in a way retrying will not fix."""
+
+
+class SMTPSettings:
+    """Connection settings for the outgoing mail server."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 25,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        starttls: bool = False,
+        timeout: float = 10.0,
+        sender: str = "bookings@localhost",
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self.sender = sender
+
+    @classmethod
+    def from_env(cls) -> Optional["SMTPSettings"]:
+        """Read settings from SMTP_* variables; None when SMTP_HOST is unset."""
+        host = os.getenv("SMTP_HOST")
+        if not host:
+            return None
+        return cls(
+            host=host,
+            port=int(os.getenv("SMTP_PORT", "25")),
+            username=os.getenv("SMTP_USERNAME") or None,
+            password=os.getenv("SMTP_PASSWORD") or None,
+            starttls=os.getenv("SMTP_STARTTLS", "false").lower() == "true",
+            timeout=float(os.getenv("SMTP_TIMEOUT", "10")),
+            sender=os.getenv("SMTP_FROM", "bookings@localhost"),
+        )
+
+
+class SMTPConnectionPool:
+    """
+    A fixed number of reusable SMTP connections.
+
+    smtplib is blocking, so each send runs in a worker thread; at most `size`
+    messages are in flight and connections are opened lazily and kept open
+    between batches.
+    """
+
+    def __init__(self, settings: SMTPSettings, size: int = 4):
+        self.settings = settings
+        self.size = size
+        self._idle: asyncio.Queue = asyncio.Queue()
+        for _ in range(size):
+            self._idle.put_nowait(None)
+
+    def _connect(self) -> smtplib.SMTP:
+        connection = smtplib.SMTP(
+            self.settings.host, self.settings.port, timeout=self.settings.timeout
+        )
+        if self.settings.starttls:
+            connection.starttls()
+        if self.settings.username:
+            connection.login(self.settings.username, self.settings.password or "")
+        return connection
+
+    def _send_sync(
+        self, connection: Optional[smtplib.SMTP], message: EmailMessage
+    ) -> Optional[smtplib.SMTP]:
+        for attempt in range(2):
+            if connection is None:
+                connection = self._connect()
+            try:
+                connection.send_message(message)
+                return connection
+            except smtplib.SMTPServerDisconnected:
+                # Idle connections get dropped by servers; reconnect once.
+                connection = None
+                if attempt:
+                    raise
+            except smtplib.SMTPRecipientsRefused as e:
+                codes = [code for code, _ in e.recipients.values()]
+                if codes and all(code >= 500 for code in codes):
+                    raise PermanentDeliveryError(str(e.recipients))
+                raise
+            except smtplib.SMTPResponseException as e:
+                if e.smtp_code >= 500:
+                    raise PermanentDeliveryError(f"{e.smtp_code} {e.smtp_error!r}")
+                raise
+        return connection
+
+    async def send(self, message: EmailMessage) -> None:
+        connection = await self._idle.get()
+        try:
+            connection = await asyncio.to_thread(self._send_sync, connection, message)
+        except PermanentDeliveryError:
+            raise
+        except Exception:
+            connection = _close_quietly(connection)
+            raise
+        finally:
+            self._idle.put_nowait(connection)
+
+    async def close(self) -> None:
+        while not self._idle.empty():
+            connection = self._idle.get_nowait()
+            if connection is not None:
+                await asyncio.to_thread(_close_quietly, connection)
+
+
+def _close_quietly(connection: Optional[smtplib.SMTP]) -> None:
+    if connection is None:
+        return None
+    try:
+        connection.quit()
+    except Exception:
+        connection.close()
+    return None
@@ -0,0 +1,68 @@
+import asyncio
+import email
+from collections import deque
+from email.message import Message
+from typing import Deque, Optional
+
+
+class SMTPSink:
+    """
+    Minimal local SMTP server that accepts and keeps every message.
+
+    Meant for tests and throughput measurements of the outbox dispatcher; it
+    speaks just enough SMTP for smtplib and never relays anything.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 1025, keep: int = 1000):
+        self.host = host
+        self.port = port
+        self.messages: Deque[Message] = deque(maxlen=keep)
+        self.received = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        if self.port == 0:
+            self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        async def reply(line: str) -> None:
+            writer.write(line.encode() + b"\r\n")
+            await writer.drain()
+
+        await reply("220 smtp-sink ready")
+        try:
+            while line := await reader.readline():
+                command = line.decode("utf-8", "replace").strip().split(" ", 1)[0].upper()
+                if command in ("HELO", "EHLO"):
+                    await reply("250 smtp-sink")
+                elif command in ("MAIL", "RCPT", "RSET", "NOOP"):
+                    await reply("250 OK")
+                elif command == "DATA":
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    lines = []
+                    while (data := await reader.readline()) not in (b".\r\n", b".\n", b""):
+                        lines.append(data[1:] if data.startswith(b"..") else data)
+                    self.messages.append(email.message_from_bytes(b"".join(lines)))
+                    self.received += 1
+                    await reply("250 OK")
+                elif command == "QUIT":
+                    await reply("221 Bye")
+                    break
+                else:
+                    await reply("502 Command not implemented")
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
@@ -0,0 +1,56 @@
+from email.message import EmailMessage
+
+from src.domain.entities import Notification
+
+SUBJECTS = {
+    Notification.BOOKING_CREATED: "Your booking is confirmed",
+    Notification.BOOKING_UPDATED: "Your booking has been moved",
+    Notification.BOOKING_CANCELLED: "Your booking has been cancelled",
+    Notification.GROUP_BOOKING_CREATED: "Your booking is confirmed",
+    Notification.GROUP_BOOKING_CANCELLED: "Your booking has been cancelled",
+    Notification.EVENT_CANCELLED: "Your event has been cancelled",
+}
+
+BODIES = {
+    Notification.BOOKING_CREATED: (
+        "Hello {attendee_name},\n\n"
+        "your booking of {number_of_seats} seat(s) from {start_time} to {end_time} is confirmed.\n"
+    ),
+    Notification.BOOKING_UPDATED: (
+        "Hello {attendee_name},\n\n"
+        "your booking of {number_of_seats} seat(s) now runs from {start_time} to {end_time}.\n"
+    ),
+    Notification.BOOKING_CANCELLED: (
+        "Hello {attendee_name},\n\n"
+        "your booking of {number_of_seats} seat(s) has been cancelled.\n"
+    ),
+    Notification.GROUP_BOOKING_CREATED: (
+        "Hello {attendee_name},\n\n"
+        "your booking of {number_of_seats} seat(s) in {slot_count} time slots "
+        "from {start_time} to {end_time} is confirmed.\n"
+    ),
+    Notification.GROUP_BOOKING_CANCELLED: (
+        "Hello {attendee_name},\n\n"
+        "your booking of {number_of_seats} seat(s) in {slot_count} time slots has been cancelled.\n"
+    ),
+    Notification.EVENT_CANCELLED: (
+        "Hello {attendee_name},\n\n"
+        "{event_name} on {event_date} has been cancelled, "
+        "and with it your booking of {number_of_seats} seat(s).\n"
+    ),
+}
+
+
+class _Defaults(dict):
+    def __missing__(self, key: str) -> str:
+        return "?"
+
+
+def render(kind: str, recipient: str, payload: dict, sender: str) -> EmailMessage:
+    """Render an outbox entry into an email message."""
+    message = EmailMessage()
+    message["From"] = sender
+    message["To"] = recipient
+    message["Subject"] = SUBJECTS.get(kind, "Booking update")
+    message.set_content(BODIES.get(kind, "Hello {attendee_name},\n").format_map(_Defaults(payload)))
+    return message
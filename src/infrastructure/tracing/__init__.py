@@ -0,0 +1,31 @@
+from .exporter import FileSpanSink, OTLPSpanSink, SpanExporter, build_span_exporter, encode_spans
+from .instrumentation import instrument
+from .tracer import (
+    SPAN_CLIENT,
+    SPAN_INTERNAL,
+    SPAN_SERVER,
+    TRACING_ENABLED,
+    Span,
+    Tracer,
+    current_span,
+    traced,
+    tracer,
+)
+
+__all__ = [
+    "SPAN_CLIENT",
+    "SPAN_INTERNAL",
+    "SPAN_SERVER",
+    "TRACING_ENABLED",
+    "Span",
+    "Tracer",
+    "current_span",
+    "traced",
+    "tracer",
+    "FileSpanSink",
+    "OTLPSpanSink",
+    "SpanExporter",
+    "build_span_exporter",
+    "encode_spans",
+    "instrument",
+]
@@ -0,0 +1,154 @@
+import asyncio
+import json
+import logging
+import os
+import urllib.request
+from typing import Dict, List, Optional
+
+from src.infrastructure.jobs.periodic import PeriodicJob
+from src.infrastructure.metrics import metrics
+
+from .tracer import TRACING_ENABLED, Span, Tracer, tracer
+
+logger = logging.getLogger(__name__)
+
+# "file" appends OTLP/JSON batches to TRACE_FILE, one per line; "otlp" posts them to a collector.
+TRACE_EXPORTER = os.getenv("TRACE_EXPORTER", "file").lower()
+TRACE_FILE = os.getenv("TRACE_FILE", "traces.jsonl")
+TRACE_OTLP_ENDPOINT = os.getenv("TRACE_OTLP_ENDPOINT", "http://localhost:4318/v1/traces")
+TRACE_EXPORT_INTERVAL = float(os.getenv("TRACE_EXPORT_INTERVAL", "1"))
+TRACE_BATCH_SIZE = int(os.getenv("TRACE_BATCH_SIZE", "512"))
+TRACE_SERVICE_NAME = os.getenv("TRACE_SERVICE_NAME", "event-booking-api")
+EXPORTERS = ("file", "otlp")
+
+OTLP_TIMEOUT = 5.0
+
+
+def _encode_attributes(attributes: Dict[str, object]) -> str:
+    # Keys are this module's own dotted names and never need escaping.
+    encoded = []
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            encoded.append(
+                f'{{"key":"{key}","value":{{"boolValue":{"true" if value else "false"}}}}}'
+            )
+        elif isinstance(value, int):
+            encoded.append(f'{{"key":"{key}","value":{{"intValue":"{value}"}}}}')
+        else:
+            encoded.append(f'{{"key":"{key}","value":{{"stringValue":{json.dumps(str(value))}}}}}')
+    return ",".join(encoded)
+
+
+def _encode_span(span: Span) -> str:
+    parent = f"{span.parent_id:016x}" if span.parent_id else ""
+    # STATUS_CODE_ERROR, or STATUS_CODE_UNSET
+    status = f'{{"code":2,"message":{json.dumps(span.error)}}}' if span.error else "{}"
+    return (
+        f'{{"traceId":"{span.trace_id:032x}","spanId":"{span.span_id:016x}",'
+        f'"parentSpanId":"{parent}","name":{json.dumps(span.name)},"kind":{span.kind},'
+        f'"startTimeUnixNano":"{span.start_ns}","endTimeUnixNano":"{span.end_ns}",'
+        f'"attributes":[{_encode_attributes(span.attributes or {})}],"status":{status}}}'
+    )
+
+
+def encode_spans(spans: List[Span], service_name: str) -> bytes:
+    """
+    An OTLP/JSON ExportTraceServiceRequest carrying `spans`.
+
+    Written out directly rather than through nested dicts and `json.dumps`,
+    which took several times as long per span.
+    """
+    resource = _encode_attributes({"service.name": service_name})
+    return (
+        f'{{"resourceSpans":[{{"resource":{{"attributes":[{resource}]}},'
+        f'"scopeSpans":[{{"scope":{{"name":"src.infrastructure.tracing"}},'
+        f'"spans":[{",".join(map(_encode_span, spans))}]}}]}}]}}'
+    ).encode()
+
+
+class FileSpanSink:
+    """Appends each batch to a file as one line of OTLP/JSON."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def write(self, body: bytes) -> None:
+        with open(self.path, "ab") as out:
+            out.write(body + b"\n")
+
+
+class OTLPSpanSink:
+    """Posts each batch to an OTLP/HTTP collector as JSON."""
+
+    def __init__(self, endpoint: str, timeout: float = OTLP_TIMEOUT):
+        self.endpoint = endpoint
+        self.timeout = timeout
+
+    def write(self, body: bytes) -> None:
+        request = urllib.request.Request(
+            self.endpoint, data=body, headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class SpanExporter(PeriodicJob):
+    """
+    Exports finished spans in batches, off the request path.
+
+    Every `interval` seconds the tracer's queue is drained in batches of up
+    to `batch_size`, each serialized and written in a worker thread. A batch
+    that fails to export is dropped and counted; the queue stays bounded
+    either way. What is left is exported on shutdown.
+    """
+
+    name = "span_exporter"
+
+    def __init__(
+        self,
+        sink,
+        interval: float = TRACE_EXPORT_INTERVAL,
+        batch_size: int = TRACE_BATCH_SIZE,
+        service_name: str = TRACE_SERVICE_NAME,
+        source: Tracer = tracer,
+    ):
+        super().__init__(interval)
+        self.sink = sink
+        self.batch_size = batch_size
+        self.service_name = service_name
+        self.source = source
+
+    async def run_once(self) -> None:
+        while True:
+            spans = self.source.drain(self.batch_size)
+            if not spans:
+                break
+            try:
+                await asyncio.to_thread(self._export, spans)
+            except Exception as e:
+                metrics.increment("tracing.export_failures")
+                metrics.increment("tracing.spans_dropped", len(spans))
+                logger.warning("Exporting %d spans failed: %s", len(spans), e)
+            else:
+                metrics.increment("tracing.spans_exported", len(spans))
+            if len(spans) < self.batch_size:
+                break
+        metrics.set_gauge("tracing.queued", len(self.source))
+
+    def _export(self, spans: List[Span]) -> None:
+        self.sink.write(encode_spans(spans, self.service_name))
+
+    async def stop(self) -> None:
+        await super().stop()
+        await self.run_once()
+
+
+def build_span_exporter() -> Optional[SpanExporter]:
+    """Create the span exporter from the environment; None when tracing is disabled."""
+    if not TRACING_ENABLED:
+        return None
+    if TRACE_EXPORTER not in EXPORTERS:
+        raise ValueError(f"TRACE_EXPORTER must be one of: {', '.join(EXPORTERS)}")
+    if TRACE_EXPORTER == "otlp":
+        return SpanExporter(OTLPSpanSink(TRACE_OTLP_ENDPOINT))
+    return SpanExporter(FileSpanSink(TRACE_FILE))
@@ -0,0 +1,126 @@
+import importlib
+import inspect
+import pkgutil
+from typing import Iterable, Iterator, List
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .tracer import SPAN_CLIENT, Span, Tracer, current_span, traced, tracer
+
+# Statements are cut to this length in span attributes; IN lists can run on for pages.
+STATEMENT_ATTRIBUTE_CHARS = 300
+
+# Where the unit of work and repository implementations live.
+IMPLEMENTATION_MODULES = ("src.infrastructure.database.unit_of_work", "src.infrastructure.memory")
+
+_instrumented = False
+
+
+def instrument(engine: AsyncEngine, source: Tracer = tracer) -> None:
+    """
+    Trace every use case, unit of work, repository method and SQL statement.
+
+    Use-case `execute` methods and the public async methods of all unit of
+    work and repository implementations are wrapped in place, once per
+    process; nothing is wrapped unless tracing is enabled. SQL statements
+    become spans through engine events.
+    """
+    global _instrumented
+    if _instrumented:
+        return
+    _instrumented = True
+
+    # Loaded here so every implementation is defined before its methods are wrapped.
+    for module in IMPLEMENTATION_MODULES:
+        importlib.import_module(module)
+    from src.application import use_cases
+    from src.application.unit_of_work import UnitOfWork
+    from src.domain import repositories
+
+    for cls in _use_case_classes(use_cases):
+        _wrap(cls, ["execute"], source)
+    for cls in _subclasses([UnitOfWork]):
+        _wrap(cls, _public_async_methods(cls), source)
+    abstract = [getattr(repositories, name) for name in repositories.__all__]
+    for cls in _subclasses(abstract):
+        _wrap(cls, _public_async_methods(cls), source)
+    _trace_statements(engine, source)
+
+
+def _use_case_classes(package) -> Iterator[type]:
+    for module_info in pkgutil.iter_modules(package.__path__):
+        module = importlib.import_module(f"{package.__name__}.{module_info.name}")
+        for cls in vars(module).values():
+            if (
+                inspect.isclass(cls)
+                and cls.__module__ == module.__name__
+                and cls.__name__.endswith("UseCase")
+            ):
+                yield cls
+
+
+def _subclasses(bases: Iterable[type]) -> List[type]:
+    found: List[type] = []
+    pending = list(bases)
+    while pending:
+        for cls in pending.pop().__subclasses__():
+            if cls not in found:
+                found.append(cls)
+                pending.append(cls)
+    return found
+
+
+def _public_async_methods(cls: type) -> List[str]:
+    return [
+        name
+        for name, attribute in vars(cls).items()
+        if not name.startswith("_")
+        and (inspect.iscoroutinefunction(attribute) or inspect.isasyncgenfunction(attribute))
+    ]
+
+
+def _wrap(cls: type, names: Iterable[str], source: Tracer) -> None:
+    for name in names:
+        function = vars(cls).get(name)
+        if function is None or getattr(function, "__traced__", False):
+            continue
+        setattr(cls, name, traced(f"{cls.__name__}.{name}", function, source))
+
+
+def _trace_statements(engine: AsyncEngine, source: Tracer) -> None:
+    system = engine.dialect.name
+
+    def start(connection, cursor, statement, parameters, context, executemany) -> None:
+        parent = current_span.get()
+        if parent is not None:
+            # Named by its leading keyword: SELECT, INSERT, WITH, ...
+            operation = statement.lstrip().split(None, 1)[0].upper() if statement else "SQL"
+            context._trace_span = Span(
+                f"SQL {operation}",
+                parent.trace_id,
+                parent.span_id,
+                SPAN_CLIENT,
+                {
+                    "db.system": system,
+                    "db.statement": statement[:STATEMENT_ATTRIBUTE_CHARS],
+                    "db.executemany": executemany,
+                },
+            )
+
+    def finish(connection, cursor, statement, parameters, context, executemany) -> None:
+        span = getattr(context, "_trace_span", None)
+        if span is not None:
+            context._trace_span = None
+            source.end(span)
+
+    def fail(exception_context) -> None:
+        context = exception_context.execution_context
+        span = getattr(context, "_trace_span", None) if context is not None else None
+        if span is not None:
+            context._trace_span = None
+            source.end(span, exception_context.original_exception)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", start)
+    event.listen(engine.sync_engine, "after_cursor_execute", finish)
+    event.listen(engine.sync_engine, "handle_error", fail)
@@ -0,0 +1,176 @@
+import functools
+import inspect
+import os
+import random
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Callable, Deque, Dict, List, Optional
+
+from src.infrastructure.metrics import metrics
+
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "false").lower() == "true"
+# Share of requests traced; requests arriving with a traceparent follow its decision.
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "0.1"))
+# Finished spans waiting for export; spans beyond it are dropped and counted.
+TRACE_QUEUE_SIZE = int(os.getenv("TRACE_QUEUE_SIZE", "10000"))
+
+# OTLP span kinds.
+SPAN_INTERNAL = 1
+SPAN_SERVER = 2
+SPAN_CLIENT = 3
+
+
+class Span:
+    """One timed operation of a trace; ids are kept as integers until export."""
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "kind",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "error",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: int,
+        parent_id: Optional[int] = None,
+        kind: int = SPAN_INTERNAL,
+        attributes: Optional[Dict[str, object]] = None,
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = random.getrandbits(64) or 1
+        self.parent_id = parent_id
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes = attributes
+        self.error: Optional[str] = None
+
+
+current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """
+    Starts spans for sampled requests and queues them for export once they end.
+
+    The sampling decision is made once per request, by the root span; below
+    it, spans are only opened while a sampled span is current, so code
+    outside a sampled request pays a single context variable lookup.
+    Finished spans wait in a bounded queue for the exporter.
+    """
+
+    def __init__(self, sample_rate: float, queue_size: int):
+        self.sample_rate = sample_rate
+        self.queue_size = queue_size
+        self._finished: Deque[Span] = deque()
+
+    def start_trace(
+        self,
+        name: str,
+        trace_id: Optional[int] = None,
+        parent_id: Optional[int] = None,
+        sampled: Optional[bool] = None,
+        kind: int = SPAN_SERVER,
+    ) -> Optional[Span]:
+        """Open the root span of a request, or return None if it is not sampled."""
+        if sampled is None:
+            sampled = random.random() < self.sample_rate
+        if not sampled:
+            return None
+        return Span(name, trace_id or random.getrandbits(128) or 1, parent_id, kind)
+
+    def start_span(self, name: str, kind: int = SPAN_INTERNAL) -> Optional[Span]:
+        """Open a child of the current span, or return None outside a sampled request."""
+        parent = current_span.get()
+        if parent is None:
+            return None
+        return Span(name, parent.trace_id, parent.span_id, kind)
+
+    def end(self, span: Span, error: Optional[BaseException] = None) -> None:
+        span.end_ns = time.time_ns()
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+        if len(self._finished) >= self.queue_size:
+            metrics.increment("tracing.spans_dropped")
+            return
+        self._finished.append(span)
+
+    def drain(self, limit: int) -> List[Span]:
+        """Take up to `limit` finished spans, oldest first."""
+        finished = self._finished
+        return [finished.popleft() for _ in range(min(limit, len(finished)))]
+
+    def __len__(self) -> int:
+        return len(self._finished)
+
+
+tracer = Tracer(TRACE_SAMPLE_RATE, TRACE_QUEUE_SIZE)
+
+
+def traced(name: str, function: Callable, tracer: Tracer = tracer) -> Callable:
+    """
+    Wrap an async function or async generator function in a span called `name`.
+
+    The span is current while the function runs, so spans it opens become its
+    children; for a generator that is while each item is produced, not while
+    the caller works on it.
+    """
+    if inspect.isasyncgenfunction(function):
+
+        @functools.wraps(function)
+        async def generator_wrapper(*args, **kwargs):
+            span = tracer.start_span(name)
+            iterator = function(*args, **kwargs)
+            error = None
+            try:
+                while True:
+                    token = current_span.set(span) if span else None
+                    try:
+                        item = await iterator.__anext__()
+                    except StopAsyncIteration:
+                        break
+                    finally:
+                        if token:
+                            current_span.reset(token)
+                    yield item
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                # Closed here, not left to the garbage collector, so the wrapped
+                # generator's cleanup runs as soon as the caller stops early.
+                await iterator.aclose()
+                if span:
+                    tracer.end(span, error)
+
+        generator_wrapper.__traced__ = True
+        return generator_wrapper
+
+    @functools.wraps(function)
+    async def wrapper(*args, **kwargs):
+        parent = current_span.get()
+        if parent is None:
+            return await function(*args, **kwargs)
+        span = Span(name, parent.trace_id, parent.span_id)
+        token = current_span.set(span)
+        error = None
+        try:
+            return await function(*args, **kwargs)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            current_span.reset(token)
+            tracer.end(span, error)
+
+    wrapper.__traced__ = True
+    return wrapper
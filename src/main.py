@@ -1,21 +1,68 @@
+import os
 from contextlib import asynccontextmanager
 
-import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.infrastructure.api.routes import router
-from src.infrastructure.database.database import init_db
+from src.infrastructure.api.admin import admin_router
+from src.infrastructure.api.profiling import ProfilingMiddleware
+from src.infrastructure.api.routes import NEXT_CURSOR_HEADER, router
+from src.infrastructure.api.tracing import TracingMiddleware
+from src.infrastructure.backend import uses_database
+from src.infrastructure.cache import invalidation_bus
+from src.infrastructure.database.database import async_session_maker, engine, warm_up_pool
+from src.infrastructure.database.schema import check_schema
+from src.infrastructure.jobs import (
+    AvailabilityRefresher,
+    CapacityReconciler,
+    ChangeFeedSequencer,
+    ChangeLogPruner,
+    TemplateEventGenerator,
+)
+from src.infrastructure.notifications import build_dispatcher
+from src.infrastructure.tracing import TRACING_ENABLED, build_span_exporter, instrument
+
+if TRACING_ENABLED:
+    instrument(engine)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan events for startup and shutdown."""
     # Startup
-    await init_db()
+    span_exporter = build_span_exporter()
+    if span_exporter:
+        span_exporter.start()
+    if not uses_database():
+        # The in-memory backend has no schema, feed or outbox to maintain.
+        yield
+        if span_exporter:
+            await span_exporter.stop()
+        return
+    # Migrations run once per release, not in every process that boots.
+    await check_schema(engine)
+    await warm_up_pool()
+    jobs = [
+        ChangeFeedSequencer(async_session_maker),
+        ChangeLogPruner(async_session_maker),
+        TemplateEventGenerator(async_session_maker),
+        CapacityReconciler(async_session_maker),
+        AvailabilityRefresher(async_session_maker),
+    ]
+    dispatcher = build_dispatcher(async_session_maker)
+    if dispatcher:
+        jobs.append(dispatcher)
+    for job in jobs:
+        job.start()
+    invalidation_bus.start()
     yield
     # Shutdown
-    pass
+    await invalidation_bus.stop()
+    for job in jobs:
+        await job.stop()
+    if span_exporter:
+        await span_exporter.stop()
+    await engine.dispose()
 
 
 app = FastAPI(
@@ -32,10 +79,20 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Browsers hide response headers from scripts unless they are listed here.
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+# Profiles requests on demand (X-Profile with an admin token) or by sampling
+app.add_middleware(ProfilingMiddleware)
+
+# Outermost, so a request's root span covers everything below it
+if TRACING_ENABLED:
+    app.add_middleware(TracingMiddleware)
+
 # Include routes
 app.include_router(router, prefix="/api/v1", tags=["bookings"])
+app.include_router(admin_router, prefix="/api/v1/admin", tags=["admin"])
 
 
 @app.get("/")
@@ -55,4 +112,12 @@ async def health_check():
 
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    # Development server; use `booking serve --workers N` in production.
+    import uvicorn
+
+    uvicorn.run(
+        "src.main:app",
+        host=os.getenv("API_HOST", "0.0.0.0"),
+        port=int(os.getenv("API_PORT", "8000")),
+        reload=os.getenv("API_RELOAD", "true").lower() == "true",
+    )
@@ -0,0 +1,190 @@
+"""Command line entry points for operating the booking service."""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import List, Optional
+
+
+def _guess_format(path: Path) -> str:
+    suffix = path.suffix.lower().lstrip(".")
+    return "ndjson" if suffix in ("ndjson", "jsonl") else "csv"
+
+
+async def _import_events(args: argparse.Namespace) -> int:
+    from src.application.use_cases.import_events import ImportEventsUseCase
+    from src.infrastructure.database.database import async_session_maker, engine
+    from src.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+    from src.infrastructure.importing import iter_file_chunks, iter_rows
+
+    path = Path(args.path)
+    fmt = args.format or _guess_format(path)
+    try:
+        async with async_session_maker() as session:
+            use_case = ImportEventsUseCase(
+                SQLAlchemyUnitOfWork(session),
+                batch_size=args.batch_size,
+            )
+            result = await use_case.execute(
+                iter_rows(fmt, iter_file_chunks(path)),
+                strict=args.strict,
+            )
+    finally:
+        await engine.dispose()
+
+    print(json.dumps(asdict(result), indent=2))
+    return 1 if result.rows_rejected else 0
+
+
+async def _dispatch_outbox(args: argparse.Namespace) -> int:
+    import time
+
+    from src.infrastructure.database.database import async_session_maker, engine
+    from src.infrastructure.notifications import build_dispatcher
+
+    dispatcher = build_dispatcher(async_session_maker)
+    if dispatcher is None:
+        print("SMTP_HOST is not configured", file=sys.stderr)
+        return 1
+    try:
+        if not args.once:
+            await dispatcher.run()
+            return 0
+        started = time.perf_counter()
+        processed = await dispatcher.drain()
+        elapsed = time.perf_counter() - started
+        print(f"processed {processed} messages in {elapsed:.2f}s")
+    finally:
+        await dispatcher.stop()
+        await engine.dispose()
+    return 0
+
+
+async def _reconcile_capacity(args: argparse.Namespace) -> int:
+    from src.infrastructure.database.database import async_session_maker, engine
+    from src.infrastructure.jobs.reconciler import CapacityReconciler
+
+    reconciler = CapacityReconciler(async_session_maker, chunk_size=args.chunk_size, fix=args.fix)
+    try:
+        result = await reconciler.reconcile()
+    finally:
+        await engine.dispose()
+
+    print(json.dumps(asdict(result), indent=2))
+    return 1 if result.drifted > result.corrected else 0
+
+
+async def _smtp_sink(args: argparse.Namespace) -> int:
+    from src.infrastructure.notifications import SMTPSink
+
+    sink = SMTPSink(args.host, args.port)
+    print(f"SMTP sink listening on {args.host}:{args.port}")
+    await sink.serve_forever()
+    return 0
+
+
+def _serve(args: argparse.Namespace) -> int:
+    import uvicorn
+
+    from src.infrastructure.database.database import IS_SQLITE
+
+    if args.workers is None:
+        args.workers = 1 if IS_SQLITE else int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    if IS_SQLITE and args.workers > 1:
+        # Caches are only invalidated across workers through PostgreSQL.
+        print("SQLite deployments run a single worker", file=sys.stderr)
+        return 2
+
+    # Read by each worker at import time to size its share of the connection pool.
+    os.environ["WEB_CONCURRENCY"] = str(args.workers)
+    uvicorn.run(
+        "src.main:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        proxy_headers=args.proxy_headers,
+        forwarded_allow_ips=args.forwarded_allow_ips,
+        log_level=args.log_level,
+    )
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="booking", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_events = commands.add_parser(
+        "import-events", help="Bulk import events and time slots from CSV or NDJSON"
+    )
+    import_events.add_argument("path", help="Input file")
+    import_events.add_argument(
+        "--format", choices=["csv", "ndjson"], help="Input format (default: from file suffix)"
+    )
+    import_events.add_argument(
+        "--strict", action="store_true", help="Import nothing if any row is rejected"
+    )
+    import_events.add_argument(
+        "--batch-size", type=int, default=1000, help="Rows validated and loaded per batch"
+    )
+    import_events.set_defaults(handler=_import_events)
+
+    dispatch = commands.add_parser(
+        "dispatch-outbox", help="Send queued notification emails (needs SMTP_HOST)"
+    )
+    dispatch.add_argument(
+        "--once", action="store_true", help="Drain what is due, report throughput and exit"
+    )
+    dispatch.set_defaults(handler=_dispatch_outbox)
+
+    reconcile = commands.add_parser(
+        "reconcile-capacity",
+        help="Check booked seat counters against bookings; exits 1 if drift is left uncorrected",
+    )
+    reconcile.add_argument("--fix", action="store_true", help="Correct drifted counters")
+    reconcile.add_argument("--chunk-size", type=int, default=500, help="Slots locked per chunk")
+    reconcile.set_defaults(handler=_reconcile_capacity)
+
+    sink = commands.add_parser("smtp-sink", help="Run a local SMTP server that discards mail")
+    sink.add_argument("--host", default="127.0.0.1")
+    sink.add_argument("--port", type=int, default=1025)
+    sink.set_defaults(handler=_smtp_sink)
+
+    serve = commands.add_parser("serve", help="Run the API with multiple worker processes")
+    serve.add_argument("--host", default=os.getenv("API_HOST", "0.0.0.0"))
+    serve.add_argument("--port", type=int, default=int(os.getenv("API_PORT", "8000")))
+    serve.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes (default: WEB_CONCURRENCY or the CPU count; 1 on SQLite)",
+    )
+    serve.add_argument(
+        "--graceful-timeout",
+        type=int,
+        default=30,
+        help="Seconds to let in-flight requests finish on shutdown",
+    )
+    serve.add_argument(
+        "--proxy-headers",
+        action="store_true",
+        help="Trust X-Forwarded-* headers from --forwarded-allow-ips",
+    )
+    serve.add_argument("--forwarded-allow-ips", default="127.0.0.1")
+    serve.add_argument("--log-level", default="info")
+    serve.set_defaults(handler=_serve)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    result = args.handler(args)
+    return asyncio.run(result) if asyncio.iscoroutine(result) else result
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+import os
+import tempfile
+
+# The engine is created from DATABASE_URL on import, so the tests' own SQLite
+# database has to be configured before anything from src is imported.
+_database_dir = tempfile.mkdtemp(prefix="event-booking-tests-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_database_dir}/test.db"
+
+from contextlib import asynccontextmanager  # noqa: E402
+from typing import AsyncIterator  # noqa: E402
+
+import pytest  # noqa: E402
+
+from src.application.unit_of_work import UnitOfWork  # noqa: E402
+from src.infrastructure.database import unit_of_work as sqlalchemy_unit_of_work  # noqa: E402
+from src.infrastructure.database.database import async_session_maker, engine, init_db  # noqa: E402
+from src.infrastructure.database.sqlite import SQLiteWriter  # noqa: E402
+from src.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork  # noqa: E402
+from src.infrastructure.memory import MemoryUnitOfWork  # noqa: E402
+from src.infrastructure.memory.store import MemoryStore  # noqa: E402
+
+from .helpers import OpenUnitOfWork  # noqa: E402
+
+
+@pytest.fixture
+def memory_uow() -> OpenUnitOfWork:
+    """Opens units of work on a fresh memory store."""
+    store = MemoryStore()
+
+    @asynccontextmanager
+    async def open_memory_uow() -> AsyncIterator[UnitOfWork]:
+        yield MemoryUnitOfWork(store)
+
+    return open_memory_uow
+
+
+@pytest.fixture
+async def sqlite_uow(monkeypatch) -> AsyncIterator[OpenUnitOfWork]:
+    """Opens units of work on the test SQLite database, shared by all tests."""
+    await init_db()
+    # Each test runs in its own event loop; the writer queue must not outlive it.
+    monkeypatch.setattr(sqlalchemy_unit_of_work, "sqlite_writer", SQLiteWriter())
+
+    @asynccontextmanager
+    async def open_sqlalchemy_uow() -> AsyncIterator[UnitOfWork]:
+        async with async_session_maker() as session:
+            yield SQLAlchemyUnitOfWork(session)
+
+    yield open_sqlalchemy_uow
+    await engine.dispose()
+
+
+@pytest.fixture(params=["memory_uow", "sqlite_uow"])
+def open_uow(request) -> OpenUnitOfWork:
+    """Runs a test once on each backend."""
+    return request.getfixturevalue(request.param)
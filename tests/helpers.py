@@ -0,0 +1,50 @@
+from datetime import date, time, timedelta
+from typing import AsyncContextManager, Callable, List
+from uuid import UUID
+
+from src.application.unit_of_work import UnitOfWork
+from src.application.use_cases.create_event import CreateEventUseCase
+from src.domain.entities import Event
+
+OpenUnitOfWork = Callable[[], AsyncContextManager[UnitOfWork]]
+
+
+async def create_event(open_uow: OpenUnitOfWork, *capacities: int) -> Event:
+    """An event with one 30 minute slot per capacity, from 09:00 on."""
+    slots = []
+    for i, capacity in enumerate(capacities):
+        start = 9 * 60 + 30 * i
+        end = start + 30
+        slots.append(
+            {
+                "start_time": time(start // 60, start % 60),
+                "end_time": time(end // 60, end % 60),
+                "max_capacity": capacity,
+            }
+        )
+    async with open_uow() as uow:
+        return await CreateEventUseCase(uow).execute(
+            name="Test event",
+            event_date=date.today() + timedelta(days=30),
+            time_slots=slots,
+        )
+
+
+async def seats(open_uow: OpenUnitOfWork, time_slot_id: UUID) -> int:
+    """
+    The booked seats a slot records, checked against its bookings.
+
+    Fails the test if the slot's counter and the seats of its bookings differ.
+    """
+    async with open_uow() as uow:
+        time_slot = await uow.time_slots.get_by_id(time_slot_id)
+        bookings = await uow.bookings.get_by_time_slot_id(time_slot_id)
+    assert time_slot is not None
+    booked = sum(booking.number_of_seats for booking in bookings)
+    assert time_slot.current_bookings == booked
+    assert 0 <= time_slot.current_bookings <= time_slot.max_capacity
+    return booked
+
+
+def slot_ids(event: Event) -> List[UUID]:
+    return [time_slot.id for time_slot in event.time_slots]
@@ -0,0 +1,65 @@
+from src.application.use_cases.adjust_slot_capacities import AdjustSlotCapacitiesUseCase
+from src.application.use_cases.cancel_booking import CancelBookingUseCase
+from src.application.use_cases.create_booking import CreateBookingUseCase
+from src.infrastructure.database.database import async_session_maker
+from src.infrastructure.jobs.availability import AvailabilityRefresher
+from src.infrastructure.memory import MemoryUnitOfWork
+
+from .helpers import create_event, slot_ids
+
+
+async def summary(open_uow, event):
+    async with open_uow() as uow:
+        # The memory backend computes summaries when read; the database has them
+        # refreshed from the queue its triggers fill.
+        if not isinstance(uow, MemoryUnitOfWork):
+            await AvailabilityRefresher(async_session_maker).run_once()
+        summaries = await uow.availability.get_page(
+            limit=100_000, start_date=event.event_date, end_date=event.event_date
+        )
+    found = [summary for summary in summaries if summary.event_id == event.id]
+    return found[0] if found else None
+
+
+def seats(summary):
+    return (
+        summary.slot_count,
+        summary.open_slots,
+        summary.total_capacity,
+        summary.booked_seats,
+        summary.available_seats,
+    )
+
+
+async def test_booking_and_capacity_changes_reach_the_summary(open_uow):
+    event = await create_event(open_uow, 2, 3)
+    first, second = slot_ids(event)
+    assert seats(await summary(open_uow, event)) == (2, 2, 5, 0, 5)
+
+    async with open_uow() as uow:
+        booking = await CreateBookingUseCase(uow).execute("Attendee", first, 2)
+    assert seats(await summary(open_uow, event)) == (2, 1, 5, 2, 3)
+
+    async with open_uow() as uow:
+        await AdjustSlotCapacitiesUseCase(uow).execute({second: 6})
+    assert seats(await summary(open_uow, event)) == (2, 1, 8, 2, 6)
+
+    async with open_uow() as uow:
+        await CancelBookingUseCase(uow).execute(booking.booking_token)
+    assert seats(await summary(open_uow, event)) == (2, 2, 8, 0, 8)
+
+
+async def test_renamed_and_deleted_events_reach_the_summaries(open_uow):
+    event = await create_event(open_uow, 2)
+    assert (await summary(open_uow, event)).event_name == "Test event"
+
+    event.name = "Renamed"
+    async with open_uow() as uow:
+        async with uow:
+            await uow.events.update(event)
+    assert (await summary(open_uow, event)).event_name == "Renamed"
+
+    async with open_uow() as uow:
+        async with uow:
+            await uow.events.delete(event.id)
+    assert await summary(open_uow, event) is None
@@ -0,0 +1,94 @@
+from uuid import uuid4
+
+from src.domain.entities import Booking
+from src.infrastructure.cache import BookingCache, TTLCache
+from src.infrastructure.cache.booking_cache import ALL_BOOKINGS
+
+
+def booking(name="Attendee"):
+    return Booking(attendee_name=name, time_slot_id=uuid4(), number_of_seats=2, event_id=uuid4())
+
+
+def test_hits_return_a_fresh_copy():
+    cache = BookingCache(max_size=10, ttl=60)
+    stored = booking()
+    cache.put(stored, cache.generation)
+
+    found = cache.get(stored.booking_token)
+    found.number_of_seats = 5
+
+    assert found is not stored
+    assert (found.id, found.event_id) == (stored.id, stored.event_id)
+    assert cache.get(stored.booking_token).number_of_seats == 2
+    assert cache.get("unknown") is None
+
+
+def test_a_lookup_racing_an_invalidation_is_not_cached():
+    cache = BookingCache(max_size=10, ttl=60)
+    stale = booking()
+    generation = cache.generation
+
+    # Another request changes some booking between the read and the put.
+    cache.invalidate(uuid4())
+    cache.put(stale, generation)
+
+    assert cache.get(stale.booking_token) is None
+
+
+def test_invalidation_by_id_and_by_notification():
+    cache = BookingCache(max_size=10, ttl=60)
+    first, second, third = booking("First"), booking("Second"), booking("Third")
+    for stored in (first, second, third):
+        cache.put(stored, cache.generation)
+
+    cache.invalidate(first.id)
+    cache.on_notification(str(second.id))
+
+    assert cache.get(first.booking_token) is None
+    assert cache.get(second.booking_token) is None
+    assert cache.get(third.booking_token) is not None
+    cache.on_notification(ALL_BOOKINGS)
+    assert cache.get(third.booking_token) is None
+
+
+def test_least_recently_used_bookings_are_evicted():
+    cache = BookingCache(max_size=2, ttl=60)
+    first, second, third = booking("First"), booking("Second"), booking("Third")
+    cache.put(first, cache.generation)
+    cache.put(second, cache.generation)
+    cache.get(first.booking_token)
+
+    cache.put(third, cache.generation)
+
+    assert cache.get(second.booking_token) is None
+    assert cache.get(first.booking_token) is not None
+    assert cache.get(third.booking_token) is not None
+
+
+def test_trimming_the_id_index_keeps_the_lru_order():
+    cache = BookingCache(max_size=3, ttl=60)
+    bookings = [booking(f"Attendee {i}") for i in range(8)]
+    for stored in bookings[:6]:
+        cache.put(stored, cache.generation)
+    cache.get(bookings[4].booking_token)
+    cache.get(bookings[3].booking_token)
+
+    # Evicts bookings[5], the least recently used, and trims the index to the other three.
+    cache.put(bookings[6], cache.generation)
+    assert len(cache._keys_by_id) == 3
+    cache.put(bookings[7], cache.generation)
+
+    assert cache.get(bookings[4].booking_token) is None
+    assert cache.get(bookings[3].booking_token) is not None
+
+
+def test_ttl_cache_membership_does_not_refresh_entries():
+    cache = TTLCache(max_size=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    assert "a" in cache
+    cache.set("c", 3)
+
+    assert "a" not in cache
+    assert "b" in cache
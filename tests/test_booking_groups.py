@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from src.application.use_cases.cancel_booking_group import CancelBookingGroupUseCase
+from src.application.use_cases.create_booking import CreateBookingUseCase
+from src.application.use_cases.create_booking_group import CreateBookingGroupUseCase
+from src.application.use_cases.get_booking_group import GetBookingGroupUseCase
+
+from .helpers import create_event, seats, slot_ids
+
+
+async def book_group(open_uow, time_slot_ids, number_of_seats=1, name="Party"):
+    async with open_uow() as uow:
+        return await CreateBookingGroupUseCase(uow).execute(name, time_slot_ids, number_of_seats)
+
+
+async def test_group_books_every_slot(open_uow):
+    event = await create_event(open_uow, 4, 4, 4)
+    slots = slot_ids(event)
+
+    group = await book_group(open_uow, slots, 2)
+
+    assert sorted(booking.time_slot_id for booking in group.bookings) == sorted(slots)
+    for slot in slots:
+        assert await seats(open_uow, slot) == 2
+    async with open_uow() as uow:
+        found = await GetBookingGroupUseCase(uow.booking_groups).execute(group.booking_token)
+    assert len(found.bookings) == 3
+
+
+async def test_group_books_no_slot_if_one_is_full(open_uow):
+    event = await create_event(open_uow, 4, 1, 4)
+    first, second, third = slot_ids(event)
+    async with open_uow() as uow:
+        await CreateBookingUseCase(uow).execute("Solo", second, 1)
+
+    with pytest.raises(ValueError, match="full"):
+        await book_group(open_uow, [first, second, third], 1)
+
+    assert await seats(open_uow, first) == 0
+    assert await seats(open_uow, second) == 1
+    assert await seats(open_uow, third) == 0
+
+
+async def test_concurrent_groups_are_all_or_nothing(open_uow):
+    event = await create_event(open_uow, 3, 5)
+    first, second = slot_ids(event)
+
+    results = await asyncio.gather(
+        # Half of them list the slots the other way round.
+        *(
+            book_group(open_uow, [first, second] if i % 2 else [second, first], 1, f"Party {i}")
+            for i in range(8)
+        ),
+        return_exceptions=True,
+    )
+
+    assert sum(not isinstance(result, Exception) for result in results) == 3
+    assert await seats(open_uow, first) == 3
+    assert await seats(open_uow, second) == 3
+
+
+async def test_cancelling_a_group_releases_every_slot(open_uow):
+    event = await create_event(open_uow, 2, 2)
+    first, second = slot_ids(event)
+    group = await book_group(open_uow, [first, second], 2)
+
+    async with open_uow() as uow:
+        assert await CancelBookingGroupUseCase(uow).execute(group.booking_token)
+
+    assert await seats(open_uow, first) == 0
+    assert await seats(open_uow, second) == 0
+    await book_group(open_uow, [first, second], 2)
+    assert await seats(open_uow, first) == 2
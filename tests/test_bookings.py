@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from src.application.use_cases.cancel_booking import CancelBookingUseCase
+from src.application.use_cases.create_booking import CreateBookingUseCase
+from src.application.use_cases.get_booking import GetBookingUseCase
+from src.application.use_cases.update_booking import UpdateBookingUseCase
+
+from .helpers import create_event, seats, slot_ids
+
+
+async def book(open_uow, time_slot_id, number_of_seats=1, name="Attendee"):
+    async with open_uow() as uow:
+        return await CreateBookingUseCase(uow).execute(name, time_slot_id, number_of_seats)
+
+
+async def test_booking_reserves_seats_until_the_slot_is_full(open_uow):
+    event = await create_event(open_uow, 3)
+    (slot,) = slot_ids(event)
+
+    await book(open_uow, slot, 2)
+    await book(open_uow, slot, 1)
+    with pytest.raises(ValueError, match="full"):
+        await book(open_uow, slot, 1)
+
+    assert await seats(open_uow, slot) == 3
+
+
+async def test_concurrent_bookings_never_overbook(open_uow):
+    event = await create_event(open_uow, 5)
+    (slot,) = slot_ids(event)
+
+    results = await asyncio.gather(
+        *(book(open_uow, slot, 1, f"Attendee {i}") for i in range(20)), return_exceptions=True
+    )
+
+    booked = [result for result in results if not isinstance(result, Exception)]
+    failed = [result for result in results if isinstance(result, Exception)]
+    assert len(booked) == 5
+    assert all(isinstance(error, ValueError) for error in failed)
+    assert await seats(open_uow, slot) == 5
+
+
+async def test_move_transfers_seats_between_slots(open_uow):
+    event = await create_event(open_uow, 4, 4)
+    first, second = slot_ids(event)
+    booking = await book(open_uow, first, 3)
+
+    async with open_uow() as uow:
+        moved = await UpdateBookingUseCase(uow).execute(booking.booking_token, second)
+
+    assert moved.time_slot_id == second
+    assert await seats(open_uow, first) == 0
+    assert await seats(open_uow, second) == 3
+    async with open_uow() as uow:
+        found = await GetBookingUseCase(uow.bookings).execute(booking.booking_token)
+    assert found.time_slot_id == second
+
+
+async def test_move_to_a_full_slot_leaves_the_booking_in_place(open_uow):
+    event = await create_event(open_uow, 4, 2)
+    first, second = slot_ids(event)
+    booking = await book(open_uow, first, 3)
+    await book(open_uow, second, 1)
+
+    async with open_uow() as uow:
+        with pytest.raises(ValueError, match="full"):
+            await UpdateBookingUseCase(uow).execute(booking.booking_token, second)
+
+    assert await seats(open_uow, first) == 3
+    assert await seats(open_uow, second) == 1
+
+
+async def test_concurrent_moves_keep_both_counters_consistent(open_uow):
+    event = await create_event(open_uow, 10, 10)
+    first, second = slot_ids(event)
+    forth = [await book(open_uow, first, 1, f"Forth {i}") for i in range(5)]
+    back = [await book(open_uow, second, 1, f"Back {i}") for i in range(5)]
+
+    async def move(booking, time_slot_id):
+        async with open_uow() as uow:
+            return await UpdateBookingUseCase(uow).execute(booking.booking_token, time_slot_id)
+
+    await asyncio.gather(
+        *(move(booking, second) for booking in forth),
+        *(move(booking, first) for booking in back),
+    )
+
+    assert await seats(open_uow, first) == 5
+    assert await seats(open_uow, second) == 5
+
+
+async def test_cancel_releases_the_seats(open_uow):
+    event = await create_event(open_uow, 2)
+    (slot,) = slot_ids(event)
+    booking = await book(open_uow, slot, 2)
+
+    async with open_uow() as uow:
+        assert await CancelBookingUseCase(uow).execute(booking.booking_token)
+    async with open_uow() as uow:
+        assert not await CancelBookingUseCase(uow).execute(booking.booking_token)
+
+    assert await seats(open_uow, slot) == 0
+    await book(open_uow, slot, 2)
+    assert await seats(open_uow, slot) == 2
@@ -0,0 +1,73 @@
+from uuid import uuid4
+
+import pytest
+
+from src.application.use_cases.cancel_event import CancelEventUseCase
+from src.application.use_cases.create_booking import CreateBookingUseCase
+from src.application.use_cases.create_booking_group import CreateBookingGroupUseCase
+from src.domain.entities import Change
+
+from .helpers import create_event, seats, slot_ids
+
+
+async def book_event(open_uow, event):
+    first, second = slot_ids(event)
+    tokens = []
+    async with open_uow() as uow:
+        for i in range(5):
+            booking = await CreateBookingUseCase(uow).execute(f"Attendee {i}", first, 1)
+            tokens.append(booking.booking_token)
+    async with open_uow() as uow:
+        group = await CreateBookingGroupUseCase(uow).execute("Party", [first, second], 2)
+    return tokens, group.booking_token
+
+
+async def test_cancelling_an_event_deletes_it_with_its_slots_and_bookings(open_uow):
+    event = await create_event(open_uow, 10, 10)
+    other = await create_event(open_uow, 10, 10)
+    tokens, group_token = await book_event(open_uow, event)
+    await book_event(open_uow, other)
+
+    async with open_uow() as uow:
+        cancelled = await CancelEventUseCase(uow, chunk_size=2).execute(event.id)
+
+    assert len(cancelled) == 7
+    assert all(booking.event_id == event.id for booking in cancelled)
+    async with open_uow() as uow:
+        assert await uow.events.get_by_id(event.id) is None
+        for time_slot_id in slot_ids(event):
+            assert await uow.time_slots.get_by_id(time_slot_id) is None
+        for token in tokens:
+            assert await uow.bookings.get_by_token(token) is None
+        assert await uow.booking_groups.get_by_token(group_token) is None
+    # The other event is untouched.
+    first, second = slot_ids(other)
+    assert await seats(open_uow, first) == 7
+    assert await seats(open_uow, second) == 2
+
+
+async def test_a_cancellation_has_committed_when_it_returns(open_uow):
+    event = await create_event(open_uow, 10, 10)
+    await book_event(open_uow, event)
+
+    async with open_uow() as uow:
+        cancelled = await CancelEventUseCase(uow, chunk_size=2).execute(event.id)
+        # Seen from another unit of work while this one is still open.
+        async with open_uow() as other:
+            assert await other.events.get_by_id(event.id) is None
+            async with other:
+                await other.change_log.sequence_pending()
+            entries = await other.change_log.get_after(0, 100_000)
+
+    cancellations = [
+        entry
+        for entry in entries
+        if entry.kind == Change.EVENT_CANCELLED and entry.payload["event_id"] == str(event.id)
+    ]
+    assert [entry.payload["bookings_cancelled"] for entry in cancellations] == [len(cancelled)]
+
+
+async def test_cancelling_an_unknown_event_fails(open_uow):
+    async with open_uow() as uow:
+        with pytest.raises(ValueError, match="not found"):
+            await CancelEventUseCase(uow).execute(uuid4())
@@ -0,0 +1,85 @@
+from datetime import date, time, timedelta
+
+import httpx
+import pytest
+
+from src.application.use_cases.create_event import CreateEventUseCase
+from src.infrastructure.cache import ResponseCache, catalog_cache
+from src.main import app
+
+START = date(2045, 1, 2)
+
+
+def test_response_cache_serves_only_the_current_version():
+    cache = ResponseCache("test_cache", max_size=10, ttl=60)
+    version = cache.version
+
+    cache.put("page", b"[]", version)
+    assert cache.get("page") == b"[]"
+
+    cache.on_notification("db:")
+    assert cache.get("page") is None
+    # A load that started before the write is not kept.
+    cache.put("page", b"stale", version)
+    assert cache.get("page") is None
+    cache.put("page", b"fresh", cache.version)
+    assert cache.get("page") == b"fresh"
+
+
+@pytest.fixture
+async def client(sqlite_uow):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+async def add_event(open_uow, day):
+    async with open_uow() as uow:
+        return await CreateEventUseCase(uow).execute(
+            name=f"Listed {day}",
+            event_date=START + timedelta(days=day),
+            time_slots=[{"start_time": time(9), "end_time": time(9, 30), "max_capacity": 5}],
+        )
+
+
+async def list_events(client, first_day=0, **params):
+    # Each test lists its own week, apart from the events of the others.
+    start_date = START + timedelta(days=first_day)
+    params = {"start_date": start_date, "end_date": start_date + timedelta(days=6), **params}
+    response = await client.get("/api/v1/events", params=params)
+    assert response.status_code == 200
+    return [event["name"] for event in response.json()], response.headers.get("X-Next-Cursor")
+
+
+async def test_events_are_listed_whole_unless_paged(client, sqlite_uow):
+    for day in (2, 0, 1):
+        await add_event(sqlite_uow, day)
+
+    assert await list_events(client) == (["Listed 0", "Listed 1", "Listed 2"], None)
+
+    names, cursor = await list_events(client, limit=2)
+    assert names == ["Listed 0", "Listed 1"]
+    assert await list_events(client, cursor=cursor) == (["Listed 2"], None)
+
+
+async def test_a_commit_moves_the_catalog_version_on(client, sqlite_uow):
+    await add_event(sqlite_uow, 10)
+    listed, _ = await list_events(client, 10)
+    version = catalog_cache.version
+    # Served from the cache, at the same version.
+    assert await list_events(client, 10) == (listed, None)
+    assert catalog_cache.version == version
+
+    await add_event(sqlite_uow, 11)
+
+    assert catalog_cache.version > version
+    names, _ = await list_events(client, 10)
+    assert names == listed + ["Listed 11"]
+
+
+async def test_browsers_may_read_the_next_cursor(client, sqlite_uow):
+    response = await client.get(
+        "/api/v1/events", params={"limit": 1}, headers={"Origin": "http://localhost:5173"}
+    )
+
+    assert "X-Next-Cursor" in response.headers["Access-Control-Expose-Headers"]
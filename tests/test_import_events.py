@@ -0,0 +1,136 @@
+from datetime import date, time
+from uuid import uuid4
+
+import pytest
+
+from src.application.use_cases.import_events import ImportEventsUseCase
+from src.infrastructure.importing import iter_rows
+
+
+async def chunks(text, size=7):
+    # Small chunks split lines and multi-byte characters across reads.
+    data = text.encode()
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def parse(fmt, text):
+    return [row async for row in iter_rows(fmt, chunks(text))]
+
+
+async def import_text(open_uow, fmt, text, **options):
+    async with open_uow() as uow:
+        return await ImportEventsUseCase(uow, batch_size=2).execute(
+            iter_rows(fmt, chunks(text)), **options
+        )
+
+
+def csv_schedule(name):
+    return (
+        "event_name,event_date,description,start_time,end_time,max_capacity\n"
+        f"{name},2031-05-01,Morning,09:00,09:30,10\n"
+        f"{name},2031-05-01,Morning,09:30,10:00,10\n"
+        f"{name} II,2031-05-02,,09:00,09:30,5\n"
+    )
+
+
+async def test_csv_rows_keep_the_line_they_start_on():
+    rows = await parse(
+        "csv",
+        "\ufeffevent_name,event_date,description\r\n"
+        '"Café",2031-05-01,"two\nlines"\r\n'
+        "\n"
+        "Talk,2031-05-02,\n",
+    )
+
+    assert rows == [
+        (2, {"event_name": "Café", "event_date": "2031-05-01", "description": "two\nlines"}),
+        (5, {"event_name": "Talk", "event_date": "2031-05-02", "description": ""}),
+    ]
+
+
+async def test_csv_with_an_unterminated_quote_fails():
+    with pytest.raises(ValueError, match="line 2"):
+        await parse("csv", 'event_name,description\nTalk,"open\n')
+
+
+async def test_ndjson_expands_nested_slots_and_reports_bad_lines():
+    rows = await parse(
+        "ndjson",
+        '{"name": "Talk", "event_date": "2031-05-01", "time_slots": '
+        '[{"start_time": "09:00"}, {"start_time": "10:00"}]}\n'
+        "not json\n"
+        "[1]\n"
+        '{"event_name": "Flat", "start_time": "11:00"}\n',
+    )
+
+    assert rows[0] == (1, {"event_name": "Talk", "event_date": "2031-05-01", "start_time": "09:00"})
+    assert rows[1] == (1, {"event_name": "Talk", "event_date": "2031-05-01", "start_time": "10:00"})
+    assert rows[2][0] == 2 and "Invalid JSON" in rows[2][1]["__error__"]
+    assert rows[3] == (3, {"__error__": "Expected a JSON object"})
+    assert rows[4] == (4, {"event_name": "Flat", "start_time": "11:00"})
+
+
+async def test_unsupported_format_fails():
+    with pytest.raises(ValueError, match="Unsupported"):
+        iter_rows("xml", chunks(""))
+
+
+async def test_import_groups_rows_into_events(open_uow):
+    name = f"Import {uuid4()}"
+
+    result = await import_text(open_uow, "csv", csv_schedule(name))
+
+    assert result.merged
+    assert (result.rows_processed, result.rows_rejected, result.rows_skipped) == (3, 0, 0)
+    assert (result.events_created, result.slots_created, result.events_skipped) == (2, 3, 0)
+    async with open_uow() as uow:
+        events = await uow.events.get_by_date_range(date(2031, 5, 1), date(2031, 5, 1))
+    (event,) = [event for event in events if event.name == name]
+    assert event.description == "Morning"
+    assert sorted(slot.start_time for slot in event.time_slots) == [time(9), time(9, 30)]
+
+
+async def test_importing_a_file_again_creates_nothing(open_uow):
+    name = f"Import {uuid4()}"
+    await import_text(open_uow, "csv", csv_schedule(name))
+
+    result = await import_text(
+        open_uow, "csv", csv_schedule(name) + f"{name} III,2031-05-03,,09:00,09:30,5\n"
+    )
+
+    assert (result.rows_processed, result.rows_skipped) == (4, 3)
+    assert (result.events_created, result.slots_created, result.events_skipped) == (1, 1, 2)
+    async with open_uow() as uow:
+        events = await uow.events.get_by_date_range(date(2031, 5, 1), date(2031, 5, 3))
+    assert sorted(event.name for event in events if event.name.startswith(name)) == [
+        name,
+        f"{name} II",
+        f"{name} III",
+    ]
+
+
+async def test_rejected_rows_are_reported_and_strict_merges_nothing(open_uow):
+    name = f"Import {uuid4()}"
+    text = (
+        f'{{"event_name": "{name}", "event_date": "2031-06-01", '
+        '"start_time": "09:00", "end_time": "09:30", "max_capacity": 4}\n'
+        f'{{"event_name": "{name}", "event_date": "2031-06-01", '
+        '"start_time": "10:00", "end_time": "09:30", "max_capacity": 4}\n'
+        f'{{"event_name": "{name}", "event_date": "2031-06-01", "start_time": "11:00"}}\n'
+    )
+
+    result = await import_text(open_uow, "ndjson", text, strict=True)
+
+    assert not result.merged
+    assert result.rows_rejected == 2
+    assert [error.line for error in result.errors] == [2, 3]
+    assert result.errors[1].message == "Missing field 'end_time'"
+    async with open_uow() as uow:
+        events = await uow.events.get_by_date_range(date(2031, 6, 1), date(2031, 6, 1))
+    assert not [event for event in events if event.name == name]
+
+    result = await import_text(open_uow, "ndjson", text)
+
+    assert result.merged
+    assert (result.events_created, result.slots_created) == (1, 1)
@@ -0,0 +1,96 @@
+from datetime import date, datetime, time, timedelta
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from src.application.use_cases.create_booking import CreateBookingUseCase
+from src.application.use_cases.create_event import CreateEventUseCase
+from src.application.use_cases.list_bookings import ListBookingsUseCase
+from src.infrastructure.api.cursors import decode_cursor, encode_cursor
+
+from .helpers import create_event, slot_ids
+
+
+def test_cursors_round_trip_dates_and_datetimes():
+    item_id = uuid4()
+
+    for position, parse in (
+        (date(2031, 2, 3), date.fromisoformat),
+        (datetime(2031, 2, 3, 4, 5, 6, 789), datetime.fromisoformat),
+    ):
+        cursor = encode_cursor(position, item_id)
+        assert "=" not in cursor
+        assert decode_cursor(cursor, parse) == (position, item_id)
+
+
+@pytest.mark.parametrize(
+    "cursor", ["", "not a cursor", encode_cursor(date(2031, 2, 3), uuid4())[:-4], "fA"]
+)
+def test_malformed_cursors_are_a_bad_request(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor, date.fromisoformat)
+
+    assert error.value.status_code == 400
+
+
+async def test_event_pages_cover_every_event_once_in_date_order(open_uow):
+    name = f"Paged {uuid4()}"
+    start = date(2040, 3, 1)
+    async with open_uow() as uow:
+        # Several events share a date, so the id breaks ties.
+        for i in range(7):
+            await CreateEventUseCase(uow).execute(
+                name=name,
+                event_date=start + timedelta(days=i // 3),
+                time_slots=[{"start_time": time(9), "end_time": time(9, 30), "max_capacity": 1}],
+            )
+
+    pages, after = [], None
+    while True:
+        async with open_uow() as uow:
+            page = await uow.events.get_page(
+                after, limit=3, start_date=start, end_date=start + timedelta(days=1)
+            )
+        if not page:
+            break
+        pages.append(page)
+        # The cursor the API hands out for the page.
+        cursor = encode_cursor(page[-1].event_date, page[-1].id)
+        after = decode_cursor(cursor, date.fromisoformat)
+
+    events = [event for page in pages for event in page if event.name == name]
+    keys = [(event.event_date, event.id) for event in events]
+    assert keys == sorted(keys)
+    assert len(set(keys)) == 6
+    assert all(len(event.time_slots) == 1 for event in events)
+
+
+async def test_booking_pages_filter_by_name_prefix_and_report_more(open_uow):
+    event = await create_event(open_uow, 10)
+    (slot,) = slot_ids(event)
+    async with open_uow() as uow:
+        for name in ("Ann", "anna", "Bob", "Annette", "Carl"):
+            await CreateBookingUseCase(uow).execute(name, slot, 1)
+
+    async with open_uow() as uow:
+        first, more = await ListBookingsUseCase(uow.bookings).execute(
+            time_slot_id=slot, limit=2, name_prefix="ann"
+        )
+        last = first[-1]
+        second, more_after = await ListBookingsUseCase(uow.bookings).execute(
+            time_slot_id=slot, after=(last.created_at, last.id), limit=2, name_prefix="ann"
+        )
+        by_event, _ = await ListBookingsUseCase(uow.bookings).execute(event_id=event.id)
+        with pytest.raises(ValueError, match="Exactly one"):
+            await ListBookingsUseCase(uow.bookings).execute()
+
+    assert [booking.attendee_name for booking in first + second] == ["Ann", "anna", "Annette"]
+    assert (more, more_after) == (True, False)
+    assert [booking.attendee_name for booking in by_event] == [
+        "Ann",
+        "anna",
+        "Bob",
+        "Annette",
+        "Carl",
+    ]
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+from starlette.requests import Request
+
+from src.infrastructure.api.rate_limit import (
+    ConcurrencyLimiter,
+    RateLimiter,
+    TokenBucket,
+    client_ip,
+)
+
+
+def request(forwarded=None, host="10.0.0.1"):
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    return Request({"type": "http", "headers": headers, "client": (host, 1234)})
+
+
+def test_bucket_allows_a_burst_then_refills_at_the_rate():
+    bucket = TokenBucket(burst=2, now=0.0)
+
+    assert bucket.take(rate=4, burst=2, now=0.0) == 0
+    assert bucket.take(rate=4, burst=2, now=0.0) == 0
+    assert bucket.take(rate=4, burst=2, now=0.0) == pytest.approx(0.25)
+    assert bucket.take(rate=4, burst=2, now=0.25) == 0
+    # A long pause refills no more than the burst.
+    assert bucket.take(rate=4, burst=2, now=100.0) == 0
+    assert bucket.take(rate=4, burst=2, now=100.0) == 0
+    assert bucket.take(rate=4, burst=2, now=100.0) > 0
+
+
+def test_limiter_keeps_a_bucket_per_key_and_evicts_the_least_recent():
+    limiter = RateLimiter(rate=0.001, burst=1, max_keys=2)
+    first, second, third = ("a", "GET /events"), ("b", "GET /events"), ("c", "GET /events")
+
+    assert limiter.check(first) == 0
+    assert limiter.check(second) == 0
+    assert limiter.check(first) > 0
+    assert limiter.check(third) == 0
+
+    assert len(limiter) == 2
+    # The second key was least recently seen, so it starts over with a full bucket.
+    assert limiter.check(second) == 0
+    assert limiter.check(third) > 0
+
+
+def test_client_ip_trusts_only_the_configured_proxies():
+    spoofed = request("1.1.1.1, 2.2.2.2, 3.3.3.3")
+
+    assert client_ip(spoofed, trusted_proxies=0) == "10.0.0.1"
+    assert client_ip(spoofed, trusted_proxies=1) == "3.3.3.3"
+    assert client_ip(spoofed, trusted_proxies=2) == "2.2.2.2"
+    assert client_ip(request("3.3.3.3"), trusted_proxies=2) == "10.0.0.1"
+    assert client_ip(request(), trusted_proxies=1) == "10.0.0.1"
+
+
+async def test_concurrency_limiter_queues_then_sheds():
+    limiter = ConcurrencyLimiter(limit=1, queue_timeout=0.05, max_waiting=1)
+    assert await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.waiting == 1
+    # The queue is full.
+    assert not await limiter.acquire()
+    # The waiter times out.
+    assert not await waiter
+    assert (limiter.in_flight, limiter.waiting) == (1, 0)
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    limiter.release()
+    assert await waiter
+    assert limiter.in_flight == 1
+    limiter.release()
+    assert limiter.in_flight == 0
@@ -0,0 +1,49 @@
+import pytest
+from sqlalchemy import update
+
+from src.application.use_cases.create_booking import CreateBookingUseCase
+from src.infrastructure.database.database import async_session_maker
+from src.infrastructure.database.models import TimeSlotModel
+from src.infrastructure.jobs.reconciler import CapacityReconciler
+
+from .helpers import create_event, seats, slot_ids
+
+
+async def drift(time_slot_id, current_bookings):
+    async with async_session_maker() as session:
+        await session.execute(
+            update(TimeSlotModel)
+            .where(TimeSlotModel.id == time_slot_id)
+            .values(current_bookings=current_bookings)
+        )
+        await session.commit()
+
+
+async def test_reconciler_corrects_drifted_counters(sqlite_uow):
+    event = await create_event(sqlite_uow, 5, 5, 5)
+    first, second, third = slot_ids(event)
+    async with sqlite_uow() as uow:
+        await CreateBookingUseCase(uow).execute("Attendee", first, 2)
+    await drift(first, 4)
+    await drift(third, 1)
+
+    result = await CapacityReconciler(async_session_maker, chunk_size=2, fix=True).reconcile()
+
+    assert result.drifted == result.corrected == 2
+    assert await seats(sqlite_uow, first) == 2
+    assert await seats(sqlite_uow, second) == 0
+    assert await seats(sqlite_uow, third) == 0
+
+
+async def test_reconciler_only_reports_drift_when_not_fixing(sqlite_uow):
+    event = await create_event(sqlite_uow, 5)
+    (slot,) = slot_ids(event)
+    await drift(slot, 3)
+
+    result = await CapacityReconciler(async_session_maker, chunk_size=2, fix=False).reconcile()
+
+    assert result.drifted == 1
+    assert result.corrected == 0
+    with pytest.raises(AssertionError):
+        await seats(sqlite_uow, slot)
+    await drift(slot, 0)
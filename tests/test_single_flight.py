@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from src.infrastructure.cache import SingleFlight
+
+
+class Loader:
+    def __init__(self, result="loaded"):
+        self.result = result
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+async def test_concurrent_loads_of_a_key_share_one_call():
+    flight = SingleFlight("test")
+    loader = Loader()
+
+    calls = [asyncio.create_task(flight.do("key", loader)) for _ in range(5)]
+    other = asyncio.create_task(flight.do("other", loader))
+    await asyncio.sleep(0)
+    loader.release.set()
+
+    assert await asyncio.gather(*calls, other) == ["loaded"] * 6
+    assert loader.calls == 2
+    assert len(flight) == 0
+
+
+async def test_nothing_is_kept_after_a_load_finishes():
+    flight = SingleFlight("test")
+    loader = Loader()
+    loader.release.set()
+
+    await flight.do("key", loader)
+    await flight.do("key", loader)
+
+    assert loader.calls == 2
+
+
+async def test_a_failed_load_fails_every_waiter_and_is_not_remembered():
+    flight = SingleFlight("test")
+    loader = Loader(ValueError("boom"))
+
+    calls = [asyncio.create_task(flight.do("key", loader)) for _ in range(3)]
+    await asyncio.sleep(0)
+    loader.release.set()
+
+    results = await asyncio.gather(*calls, return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+    loader.result = "loaded"
+    assert await flight.do("key", loader) == "loaded"
+
+
+async def test_a_cancelled_caller_does_not_fail_the_others():
+    flight = SingleFlight("test")
+    loader = Loader()
+
+    first = asyncio.create_task(flight.do("key", loader))
+    second = asyncio.create_task(flight.do("key", loader))
+    await asyncio.sleep(0)
+    first.cancel()
+    loader.release.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert await second == "loaded"
+    assert loader.calls == 1
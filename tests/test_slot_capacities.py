@@ -0,0 +1,104 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from src.application.use_cases.adjust_slot_capacities import (
+    CAPACITY_BELOW_BOOKINGS,
+    CAPACITY_NOT_FOUND,
+    CAPACITY_UNCHANGED,
+    CAPACITY_UPDATED,
+    AdjustSlotCapacitiesUseCase,
+)
+from src.application.use_cases.create_booking import CreateBookingUseCase
+from src.domain.entities import Change
+
+from .helpers import create_event, seats, slot_ids
+
+
+async def adjust(open_uow, capacities):
+    async with open_uow() as uow:
+        return await AdjustSlotCapacitiesUseCase(uow).execute(capacities)
+
+
+async def book(open_uow, time_slot_id, number_of_seats=1):
+    async with open_uow() as uow:
+        return await CreateBookingUseCase(uow).execute("Attendee", time_slot_id, number_of_seats)
+
+
+async def test_capacities_change_unless_they_would_overbook(open_uow):
+    event = await create_event(open_uow, 4, 4, 4)
+    grown, shrunk, kept = slot_ids(event)
+    await book(open_uow, shrunk, 3)
+    missing = uuid4()
+
+    results = await adjust(open_uow, {kept: 4, missing: 2, shrunk: 2, grown: 6})
+
+    assert [(result.time_slot_id, result.status) for result in results] == [
+        (kept, CAPACITY_UNCHANGED),
+        (missing, CAPACITY_NOT_FOUND),
+        (shrunk, CAPACITY_BELOW_BOOKINGS),
+        (grown, CAPACITY_UPDATED),
+    ]
+    assert (results[2].max_capacity, results[2].current_bookings) == (4, 3)
+    assert (results[3].max_capacity, results[3].current_bookings) == (6, 0)
+    async with open_uow() as uow:
+        assert (await uow.time_slots.get_by_id(grown)).max_capacity == 6
+        assert (await uow.time_slots.get_by_id(shrunk)).max_capacity == 4
+
+
+async def test_only_changed_capacities_reach_the_change_feed(open_uow):
+    event = await create_event(open_uow, 4, 4)
+    changed, unchanged = slot_ids(event)
+
+    await adjust(open_uow, {changed: 8, unchanged: 4})
+
+    async with open_uow() as uow:
+        async with uow:
+            await uow.change_log.sequence_pending()
+    async with open_uow() as uow:
+        entries = await uow.change_log.get_after(0, 100_000)
+    capacity_changes = [
+        entry.payload
+        for entry in entries
+        if entry.kind == Change.SLOT_CAPACITY_CHANGED and entry.payload["event_id"] == str(event.id)
+    ]
+    assert capacity_changes == [
+        {
+            "time_slot_id": str(changed),
+            "event_id": str(event.id),
+            "max_capacity": 8,
+            "current_bookings": 0,
+        }
+    ]
+
+
+async def test_capacity_cuts_racing_bookings_never_overbook(open_uow):
+    event = await create_event(open_uow, 10)
+    (slot,) = slot_ids(event)
+
+    results = await asyncio.gather(
+        *(book(open_uow, slot) for _ in range(6)),
+        adjust(open_uow, {slot: 3}),
+        return_exceptions=True,
+    )
+
+    booked = sum(not isinstance(result, Exception) for result in results[:-1])
+    (change,) = results[-1]
+    async with open_uow() as uow:
+        time_slot = await uow.time_slots.get_by_id(slot)
+    assert await seats(open_uow, slot) == booked
+    if change.status == CAPACITY_UPDATED:
+        assert time_slot.max_capacity == 3
+    else:
+        assert change.status == CAPACITY_BELOW_BOOKINGS
+        assert time_slot.max_capacity == 10
+
+
+async def test_invalid_requests_are_rejected(open_uow):
+    event = await create_event(open_uow, 4)
+
+    with pytest.raises(ValueError, match="At least one"):
+        await adjust(open_uow, {})
+    with pytest.raises(ValueError, match="positive"):
+        await adjust(open_uow, {slot_ids(event)[0]: 0})
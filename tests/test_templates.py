@@ -0,0 +1,147 @@
+from datetime import date, time, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.application.use_cases.add_template_exceptions import AddTemplateExceptionsUseCase
+from src.application.use_cases.create_booking import CreateBookingUseCase
+from src.application.use_cases.create_event_template import CreateEventTemplateUseCase
+from src.application.use_cases.generate_template_events import (
+    GenerateTemplateEventsUseCase,
+    slot_times,
+)
+from src.domain.entities import EventTemplate
+
+# A Monday.
+START = date(2032, 1, 5)
+
+
+def template(**rule):
+    return EventTemplate(
+        name="Class",
+        start_date=START,
+        window_start=time(9),
+        window_end=time(10),
+        slot_capacity=5,
+        **rule,
+    )
+
+
+def days(template, until_days):
+    return [(day - START).days for day in template.occurrences(START + timedelta(days=until_days))]
+
+
+def test_daily_templates_repeat_every_interval_days():
+    assert days(template(frequency=EventTemplate.DAILY, interval=3), 10) == [0, 3, 6, 9]
+
+
+def test_weekly_templates_repeat_on_their_weekdays_every_interval_weeks():
+    assert days(template(), 14) == [0, 7, 14]
+    # Tuesday and Friday every other week.
+    assert days(template(weekdays=[4, 1], interval=2), 21) == [1, 4, 15, 18]
+
+
+def test_occurrences_skip_exceptions_and_stop_at_the_end_date():
+    rule = template(
+        frequency=EventTemplate.DAILY,
+        exceptions=[START + timedelta(days=1)],
+        end_date=START + timedelta(days=3),
+    )
+
+    assert days(rule, 10) == [0, 2, 3]
+
+
+def test_occurrences_start_after_what_was_generated():
+    rule = template(frequency=EventTemplate.DAILY, generated_until=START + timedelta(days=1))
+
+    assert days(rule, 3) == [2, 3]
+
+
+def test_windows_split_into_half_hour_slots():
+    assert slot_times(time(9), time(10)) == [(time(9), time(9, 30)), (time(9, 30), time(10))]
+    with pytest.raises(ValueError, match="multiple of 30 minutes"):
+        slot_times(time(9), time(9, 45))
+    with pytest.raises(ValueError, match="multiple of 30 minutes"):
+        slot_times(time(10), time(9))
+
+
+async def create_template(open_uow, **rule):
+    async with open_uow() as uow:
+        return await CreateEventTemplateUseCase(uow).execute(
+            name=f"Class {uuid4()}",
+            start_date=START,
+            window_start=time(9),
+            window_end=time(10),
+            slot_capacity=5,
+            **rule,
+        )
+
+
+async def generated_events(open_uow, template):
+    async with open_uow() as uow:
+        events = await uow.events.get_by_date_range(START, START + timedelta(days=365))
+    return sorted(
+        (event for event in events if event.template_id == template.id),
+        key=lambda event: event.event_date,
+    )
+
+
+async def generate(open_uow, template, today=START, horizon_days=13):
+    async with open_uow() as uow:
+        fresh = await uow.templates.get_by_id(template.id)
+        return await GenerateTemplateEventsUseCase(uow, horizon_days=horizon_days).execute(
+            today, [fresh]
+        )
+
+
+async def test_invalid_templates_are_rejected(open_uow):
+    with pytest.raises(ValueError, match="Frequency"):
+        await create_template(open_uow, frequency="monthly")
+    with pytest.raises(ValueError, match="Weekdays"):
+        await create_template(open_uow, weekdays=[7])
+    with pytest.raises(ValueError, match="End date"):
+        await create_template(open_uow, end_date=START - timedelta(days=1))
+
+
+async def test_generation_creates_each_date_once(open_uow):
+    rule = await create_template(open_uow, weekdays=[0, 3])
+
+    assert await generate(open_uow, rule) == (1, 4, 8)
+    assert await generate(open_uow, rule) == (1, 0, 0)
+    assert await generate(open_uow, rule, horizon_days=20) == (1, 2, 4)
+
+    events = await generated_events(open_uow, rule)
+    assert [(event.event_date - START).days for event in events] == [0, 3, 7, 10, 14, 17]
+    assert all(len(event.time_slots) == 2 for event in events)
+    assert {slot.max_capacity for event in events for slot in event.time_slots} == {5}
+
+
+async def test_generation_never_fills_in_past_dates(open_uow):
+    rule = await create_template(open_uow, frequency=EventTemplate.DAILY)
+
+    generated = await generate(open_uow, rule, today=START + timedelta(days=5), horizon_days=2)
+
+    assert generated == (1, 3, 6)
+    events = await generated_events(open_uow, rule)
+    assert [(event.event_date - START).days for event in events] == [5, 6, 7]
+
+
+async def test_exceptions_remove_unbooked_events_and_keep_booked_ones(open_uow):
+    rule = await create_template(open_uow, frequency=EventTemplate.DAILY)
+    await generate(open_uow, rule, horizon_days=3)
+    first, second, *_ = await generated_events(open_uow, rule)
+    async with open_uow() as uow:
+        await CreateBookingUseCase(uow).execute("Attendee", first.time_slots[0].id, 1)
+    skipped = [first.event_date, second.event_date, START + timedelta(days=10)]
+
+    async with open_uow() as uow:
+        updated, kept = await AddTemplateExceptionsUseCase(uow).execute(rule.id, skipped)
+
+    assert kept == [first.event_date]
+    assert updated.exceptions == skipped
+    events = await generated_events(open_uow, rule)
+    assert [(event.event_date - START).days for event in events] == [0, 2, 3]
+    # The later exception is honoured once generation reaches it.
+    await generate(open_uow, rule, horizon_days=11)
+    events = await generated_events(open_uow, rule)
+    assert [(event.event_date - START).days for event in events] == [0, 2, 3, 4, 5, 6, 7, 8, 9, 11]
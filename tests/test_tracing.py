@@ -0,0 +1,153 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.infrastructure.api.tracing import TracingMiddleware, parse_traceparent
+from src.infrastructure.tracing import SPAN_SERVER, Tracer, current_span, traced
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+def test_valid_traceparents_are_parsed():
+    assert parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-01".encode()) == (
+        int(TRACE_ID, 16),
+        int(PARENT_ID, 16),
+        True,
+    )
+    assert parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-00".encode())[2] is False
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        b"",
+        f"00-{TRACE_ID}-{PARENT_ID}".encode(),
+        f"00-{TRACE_ID[:-1]}-{PARENT_ID}-01".encode(),
+        f"00-{TRACE_ID}-{PARENT_ID}-1".encode(),
+        f"00-{'z' * 32}-{PARENT_ID}-01".encode(),
+        f"00-{'0' * 32}-{PARENT_ID}-01".encode(),
+        f"00-{TRACE_ID}-{'0' * 16}-01".encode(),
+    ],
+)
+def test_malformed_traceparents_are_ignored(value):
+    assert parse_traceparent(value) is None
+
+
+def test_only_sampled_traces_open_spans():
+    source = Tracer(sample_rate=0.0, queue_size=10)
+
+    assert source.start_trace("GET /") is None
+    assert source.start_span("child") is None
+    assert source.start_trace("GET /", sampled=True) is not None
+
+
+async def test_traced_functions_nest_under_the_current_span():
+    source = Tracer(sample_rate=1.0, queue_size=10)
+
+    async def lookup():
+        return current_span.get()
+
+    async def rows():
+        yield current_span.get()
+
+    traced_lookup = traced("lookup", lookup, source)
+    traced_rows = traced("rows", rows, source)
+
+    # Outside a trace nothing is recorded.
+    assert await traced_lookup() is None
+    assert [row async for row in traced_rows()] == [None]
+
+    root = source.start_trace("GET /")
+    token = current_span.set(root)
+    try:
+        inner = await traced_lookup()
+        (row_span,) = [row async for row in traced_rows()]
+        assert current_span.get() is root
+    finally:
+        current_span.reset(token)
+    source.end(root)
+
+    assert [span.name for span in source.drain(10)] == ["lookup", "rows", "GET /"]
+    for span in (inner, row_span):
+        assert (span.trace_id, span.parent_id) == (root.trace_id, root.span_id)
+        assert span.end_ns >= span.start_ns
+
+
+async def test_failures_are_recorded_on_the_span():
+    source = Tracer(sample_rate=1.0, queue_size=10)
+
+    async def fail():
+        raise RuntimeError("boom")
+
+    root = source.start_trace("GET /")
+    token = current_span.set(root)
+    try:
+        with pytest.raises(RuntimeError):
+            await traced("fail", fail, source)()
+    finally:
+        current_span.reset(token)
+
+    (span,) = source.drain(10)
+    assert span.error == "RuntimeError: boom"
+
+
+def test_spans_beyond_the_queue_are_dropped():
+    source = Tracer(sample_rate=1.0, queue_size=2)
+
+    for _ in range(3):
+        source.end(source.start_trace("GET /"))
+
+    assert len(source) == 2
+
+
+def traced_app(source):
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware, source=source)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"traced": current_span.get() is not None}
+
+    return app
+
+
+async def request(source, headers=None):
+    transport = httpx.ASGITransport(app=traced_app(source))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get("/items/7", headers=headers)
+
+
+async def test_requests_join_the_callers_trace():
+    source = Tracer(sample_rate=0.0, queue_size=10)
+
+    response = await request(source, {"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01"})
+
+    assert response.json() == {"traced": True}
+    assert response.headers["X-Trace-Id"] == TRACE_ID
+    (span,) = source.drain(10)
+    assert (span.trace_id, span.parent_id) == (int(TRACE_ID, 16), int(PARENT_ID, 16))
+    assert span.kind == SPAN_SERVER
+    # Named after the route template, not the path.
+    assert span.name == "GET /items/{item_id}"
+    assert span.attributes["http.status_code"] == 200
+
+
+async def test_requests_follow_the_callers_sampling_decision():
+    source = Tracer(sample_rate=1.0, queue_size=10)
+
+    response = await request(source, {"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-00"})
+
+    assert response.json() == {"traced": False}
+    assert "X-Trace-Id" not in response.headers
+    assert len(source) == 0
+
+
+async def test_requests_without_a_valid_traceparent_start_their_own_trace():
+    source = Tracer(sample_rate=1.0, queue_size=10)
+
+    response = await request(source, {"traceparent": "garbage"})
+
+    (span,) = source.drain(10)
+    assert response.headers["X-Trace-Id"] == f"{span.trace_id:032x}"
+    assert span.parent_id is None